@@ -1,14 +1,26 @@
 from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from lxml import etree
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator, Set
+import itertools
 import json
+import os
 import re
 import shutil
 
-from data import XmlEntry, CodeEntry, WholeDictionary, SingleDictionary
+from data import XmlEntry, CodeEntry, WholeDictionary, SingleDictionary, ApplyResult
 from logger import logger
+from source_index import SourceIndex
 from urllib.parse import quote
-from util import xml_node_replace_translation, get_element_CDATA
+from util import (
+    xml_node_replace_translations,
+    translation_unchanged,
+    get_element_CDATA,
+    write_if_changed,
+    resolve_jobs,
+    XmlTreeCache,
+)
 from const import (
     ROOT_DIR,
     FONT_DIR,
@@ -18,6 +30,9 @@ from const import (
     PARATRANZ_PROJECT_ID,
 )
 
+# 原文本不在记录的行时，向上下各查找的行数
+JAVA_LINE_SEARCH_WINDOW = 5
+
 FONT_SIZE_REGEX = r"font-size\s*:\s*(\d+)\s*(?:px|pt)"
 LINE_HEIGHT_REGEX = r"line-height\s*:\s*(\d+)\s*(?:px|pt)"
 
@@ -40,6 +55,204 @@ def ui_value_modify(line: str, regex: str, multiplier: float) -> str:
     return line
 
 
+@dataclass(frozen=True)
+class JavaRewriteRule:
+    """
+    对整个java文件做的字面量替换
+    """
+
+    old: str
+    new: str
+    description: str
+
+    def apply(self, text: str) -> Tuple[str, int]:
+        count = text.count(self.old)
+        if count > 0:
+            text = text.replace(self.old, self.new)
+        return text, count
+
+
+HIDDEN_FIELD_NAME_RULE = JavaRewriteRule(
+    'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 2',
+    'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 1',
+    "允许单个字的名字",
+)
+
+FLUID_MODIFIER_RULES = [
+    JavaRewriteRule(
+        'if(name.endsWith("-")) {',
+        "if(!returnNames.containsKey(name)) {",
+        "调整前缀判断方法",
+    ),
+]
+
+# 所有java文件都会应用的规则
+JAVA_GLOBAL_REWRITE_RULES = [
+    JavaRewriteRule("Locale.ENGLISH", "Locale.CHINESE", "使用中文Locale"),
+]
+
+# 文件名 -> 规则，按顺序应用
+JAVA_FILE_REWRITE_RULES: Dict[str, List[JavaRewriteRule]] = {
+    "Game.java": [
+        JavaRewriteRule(
+            "public static final int FONT_SIZE_NORMAL = 18;",
+            "public static final int FONT_SIZE_NORMAL = 15;",
+            "修改默认字体大小",
+        ),
+        JavaRewriteRule(
+            "return date.substring(0, date.length()-5);",
+            "return date.substring(5, date.length());",
+            "调整日期格式",
+        ),
+    ],
+    "Properties.java": [
+        JavaRewriteRule(
+            "public int fontSize = 18;", "public int fontSize = 15;", "修改默认字体"
+        ),
+    ],
+    "UtilText.java": [
+        # 高版本jdk不再自带nashorn
+        # if "import jdk.nashorn" in line:
+        #     line = "//" + line
+        # if "import org.openjdk.nashorn" in line:
+        #     line = line[2:]
+        JavaRewriteRule(
+            ".getGenderName().getFeminine()",
+            ".getGenderName().getFeminineId()",
+            "阴性名称使用id",
+        ),
+        JavaRewriteRule(
+            ".getGenderName().getMasculine()",
+            ".getGenderName().getMasculineId()",
+            "阳性名称使用id",
+        ),
+        JavaRewriteRule(
+            ".getGenderName().getNeutral()",
+            ".getGenderName().getNeutralId()",
+            "中性名称使用id",
+        ),
+        # 调整频率
+        JavaRewriteRule(
+            "addMuffle(modifiedSentence, 5);",
+            "addMuffle(modifiedSentence, 8);",
+            "调整addMuffle频率",
+        ),
+        JavaRewriteRule(
+            "addSexSounds(modifiedSentence, 6);",
+            "addSexSounds(modifiedSentence, 10);",
+            "调整addSexSounds频率",
+        ),
+        JavaRewriteRule(
+            "addBimbo(modifiedSentence, 6);",
+            "addBimbo(modifiedSentence, 10);",
+            "调整addBimbo频率",
+        ),
+        JavaRewriteRule(
+            "replaceWithMuffle(modifiedSentence, 2);",
+            "replaceWithMuffle(modifiedSentence, 5);",
+            "调整replaceWithMuffle频率",
+        ),
+    ],
+    "AbstractAttribute.java": [
+        # Attribute的name同时被用于逻辑和显示，故使用类似的nameAbbreviation暂时替代
+        JavaRewriteRule(
+            "return name;", "return nameAbbreviation;", "属性名称使用nameAbbreviation"
+        ),
+        JavaRewriteRule(
+            'return "<"+tag+" style=\'color:"+this.getColour().toWebHexString()+";\'>"+name+"</"+tag+">";',
+            'return "<"+tag+" style=\'color:"+this.getColour().toWebHexString()+";\'>"+nameAbbreviation+"</"+tag+">";',
+            "属性标签使用nameAbbreviation",
+        ),
+    ],
+    "MainController.java": [HIDDEN_FIELD_NAME_RULE],
+    "CityHallDemographics.java": [HIDDEN_FIELD_NAME_RULE],
+    "CharacterCreation.java": [HIDDEN_FIELD_NAME_RULE],
+    "Main.java": [
+        JavaRewriteRule(
+            "protected void loadFonts() {",
+            "protected void loadFonts() {\n"
+            + '\t\tif (Font.loadFont(toUri("res/fonts/Source Han/SourceHanSansCN-Regular.otf"), 12) != null) {\n'
+            + '\t\t\tFont.loadFont(toUri("res/fonts/Source Han/SourceHanSansCN-Bold.otf"), 12);\n'
+            + "\t\t} else {\n"
+            + '\t\t\tSystem.err.println("Source Han Sans font could not be loaded.");\n'
+            + "\t\t}\n",
+            "内置字体导入",
+        ),
+    ],
+    "Util.java": [
+        JavaRewriteRule(
+            'private static Pattern endOfSentence = Pattern.compile("[,.!?]");',
+            'private static Pattern endOfSentence = Pattern.compile("[,.!?，。！？、]");',
+            "中文句末标点",
+        ),
+        # line = line.replace(
+        #     "if(sentence.charAt(i)==' '",
+        #     "if(true")
+        # line = line.replace(
+        #     "&& Character.isLetter(sentence.charAt(i+1))",
+        #     "&& !isEndOfSentence(sentence.charAt(i+1))"
+        # )
+    ],
+    "Units.java": [
+        JavaRewriteRule(
+            'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.internationalDate) ? "dd.MM.yy" : "MM/dd/yy")',
+            'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.internationalDate) ? "yy.MM.dd" : "yy.MM.dd")',
+            "调整日期格式",
+        ),
+        JavaRewriteRule(
+            "DateTimeFormatter.ofPattern(\"d'%o %m' yyyy\")",
+            'DateTimeFormatter.ofPattern("yyyy年MM月dd日")',
+            "调整长日期格式",
+        ),
+        # 在使用中文Locale之后应用，时间仍使用英文格式
+        JavaRewriteRule(
+            'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.twentyFourHourTime) ? "HH:mm" : "hh:mm a")',
+            'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.twentyFourHourTime) ? "HH:mm" : "hh:mm a").withLocale(Locale.ENGLISH)',
+            "调整时间格式",
+        ),
+    ],
+    "AbstractFluidType.java": [
+        JavaRewriteRule(
+            'if(name.endsWith("-")) {',
+            "if(!baseFluidType.getNames().contains(name)) {",
+            "调整精液前缀判断方法",
+        ),
+    ],
+    "AbstractPenisType.java": FLUID_MODIFIER_RULES,
+    "AbstractVaginaType.java": FLUID_MODIFIER_RULES,
+    "GameCharacter.java": [
+        JavaRewriteRule(":determiner)", ':"")', "remove useless 'the'"),
+    ],
+    "Wes.java": [
+        JavaRewriteRule(
+            "return this.getNameIgnoresPlayerKnowledge();", 'return "Wes";', "固定名字"
+        ),
+    ],
+    "Brax.java": [
+        JavaRewriteRule(
+            "return this.getNameIgnoresPlayerKnowledge();",
+            "if (Main.game.getDialogueFlags().hasFlag(DialogueFlagValue.bimbofiedBrax))\n"
+            + '\t\t\treturn "Brandi";\n'
+            + "\t\telse if (Main.game.getDialogueFlags().hasFlag(DialogueFlagValue.feminisedBrax))\n"
+            + '\t\t\treturn "Bree";\n'
+            + "\t\telse\n"
+            + '\t\t\treturn "Brax";\n',
+            "按状态固定名字",
+        ),
+    ],
+    "Sex.java": [
+        JavaRewriteRule(
+            "positionActionsPlayer.sort((a1, a2) ->",
+            "positionActionsPlayer.sort((a1, a2) -> true?((a1.getActionType() == a2.getActionType())? (a1.isPositionSwap() == a2.isPositionSwap() ? a1.getActionTitle().compareTo(a2.getActionTitle()) : (a1.isPositionSwap() ? -1 : 1)): (a1.getActionType() == SexActionType.POSITIONING_MENU ? -1 : 1)):",
+            "调整姿势选项排序",
+        ),
+    ],
+    "SexActionManager.java": [
+        JavaRewriteRule("Value<>", "Value<String, Field[]>", "补全泛型参数"),
+    ],
+}
+
+
 def valid_element(element: etree._Element) -> bool:
     text = get_element_CDATA(element)
     if text is None:
@@ -54,17 +267,293 @@ def valid_element(element: etree._Element) -> bool:
     return True
 
 
+class XmlNodeIndex:
+    """
+    一次遍历文档树，按节点名记录元素，htmlContent再按tag属性分组
+    """
+
+    def __init__(self, tree: etree._ElementTree, tags: Iterable[str]):
+        self.elements: Dict[str, List[etree._Element]] = {tag: [] for tag in tags}
+        self.html_content: Dict[str, List[etree._Element]] = {}
+        self.valid_elements: Dict[str, List[etree._Element]] = {}
+
+        if len(self.elements) == 0:
+            return
+
+        for element in tree.iter(*self.elements):
+            if element.tag == "htmlContent":
+                attribute = element.get("tag")
+                if attribute is not None:
+                    self.html_content.setdefault(attribute, []).append(element)
+            else:
+                self.elements[element.tag].append(element)
+
+    def html_content_nodes(self, attribute: str) -> List[etree._Element]:
+        return self.html_content.get(attribute, [])
+
+    def valid_nodes(self, tag: str) -> List[etree._Element]:
+        # 首次使用时才过滤，与逐个节点名替换时的判断时机一致
+        nodes = self.valid_elements.get(tag)
+        if nodes is None:
+            nodes = list(filter(valid_element, self.elements[tag]))
+            self.valid_elements[tag] = nodes
+        return nodes
+
+
+def apply_xml_file(
+    original_file: Path,
+    dict_file: Path,
+    json_dict: SingleDictionary,
+    tree: Optional[etree._ElementTree] = None,
+) -> ApplyResult:
+    result = ApplyResult(file=original_file.as_posix())
+
+    entry_list = [
+        XmlEntry.from_json(original_file, entry) for _, entry in json_dict.items()
+    ]
+
+    if tree is None:
+        parser = etree.XMLParser(strip_cdata=False)
+        tree = etree.parse(str(original_file), parser)
+
+    def replace(nodes: List[etree._Element], entries: List[XmlEntry]) -> None:
+        pending = [entry for entry in entries if not translation_unchanged(entry)]
+        result.skipped += len(entries) - len(pending)
+        if len(pending) == 0:
+            return
+
+        # 在任一节点中匹配即视为已应用
+        unmatched: Optional[Set[int]] = None
+        for node in nodes:
+            node_unmatched = {
+                id(entry) for entry in xml_node_replace_translations(node, pending)
+            }
+            unmatched = node_unmatched if unmatched is None else unmatched & node_unmatched
+
+        for entry in pending:
+            if id(entry) not in unmatched:
+                result.applied += 1
+                continue
+            result.mismatched += 1
+            result.missed.append(entry.to_key())
+            logger.warning(
+                "\t****%s[%s]:原文本无匹配！|%s",
+                dict_file.as_posix(),
+                entry.node_tag
+                if entry.attribute is None
+                else f"{entry.node_tag}:{entry.attribute}",
+                entry.original[:80],
+            )
+
+    entry_dict: Dict[str, List[XmlEntry]] = {}
+    for entry in entry_list:
+        if entry_dict.get(entry.node_tag) is None:
+            entry_dict[entry.node_tag] = [entry]
+        else:
+            entry_dict[entry.node_tag].append(entry)
+
+    node_index = XmlNodeIndex(tree, entry_dict.keys())
+
+    for tag, entry_cluster in entry_dict.items():
+        # special process for htmlContent
+        if tag == "htmlContent":
+            entry_dict: Dict[str, List[XmlEntry]] = {}
+            for entry in entry_cluster:
+                if entry_dict.get(entry.attribute):
+                    entry_dict[entry.attribute].append(entry)
+                else:
+                    entry_dict[entry.attribute] = [entry]
+
+            for entry_attribute, entries in entry_dict.items():
+                nodes = node_index.html_content_nodes(entry_attribute)
+                if len(nodes) > 1:
+                    replace(nodes, entries)
+                else:
+                    node = nodes[0]
+                    replace([node], entries)
+        else:
+            nodes: List[etree._Element] = node_index.valid_nodes(tag)
+            # 同一节点的条目一起替换
+            node_entries: Dict[int, Tuple[etree._Element, List[XmlEntry]]] = {}
+            for entry in entry_cluster:
+                try:
+                    node = nodes[entry.node_idx]
+                except Exception:
+                    logger.error(
+                        "****%s[%s]:节点索引超出范围！", entry.node_idx, nodes, tag
+                    )
+                    for node in nodes:
+                        logger.error(node.text)
+                    raise Exception
+                node_entries.setdefault(id(node), (node, []))[1].append(entry)
+            for node, entries in node_entries.values():
+                replace([node], entries)
+
+    # 没有替换任何条目时不序列化也不写回，保留上游文件及其修改时间
+    if result.applied == 0:
+        return result
+
+    # 序列化结果与原文件一致时同样不写回
+    content = etree.tostring(
+        tree,
+        encoding="UTF-8",  # 与tree.write写入的声明一致
+        xml_declaration=True,
+        pretty_print=True,
+        standalone=False,
+    )
+    result.written = write_if_changed(original_file, content)
+    return result
+
+
+def apply_java_file(
+    target: str, original_file: Path, dict_file: Path, json_dict: SingleDictionary
+) -> ApplyResult:
+    result = ApplyResult(file=original_file.as_posix())
+
+    with open(original_file, "r", encoding="utf-8") as f:
+        text = f.readlines()
+
+    entry_list = [
+        CodeEntry.from_json(original_file, entry) for _, entry in json_dict.items()
+    ]
+
+    # 先按记录的行号替换，已替换的行不再用于查找偏移的条目
+    claimed: Set[int] = set()
+    pending: List[Tuple[CodeEntry, str]] = []
+    for entry in entry_list:
+        if len(entry.translation) <= 0:
+            result.skipped += 1
+            continue
+        line_text = text[entry.line] if entry.line < len(text) else ""
+        translation = check_java_translation(
+            target, line_text, entry.original, entry.translation, dict_file, entry.line
+        )
+        if entry.line < len(text) and replace_java_line(
+            text, entry.line, entry.original, translation
+        ):
+            claimed.add(entry.line)
+            result.applied += 1
+        else:
+            pending.append((entry, translation))
+
+    # 上游插入或删除行后，在附近的行中由近到远查找原文本
+    for entry, translation in sorted(pending, key=lambda item: item[0].line):
+        for line in java_search_lines(entry.line, len(text)):
+            if line in claimed:
+                continue
+            if replace_java_line(text, line, entry.original, translation):
+                claimed.add(line)
+                result.applied += 1
+                result.relocated.append((entry.line, line))
+                break
+        else:
+            result.mismatched += 1
+            result.missed.append(entry.to_id())
+            logger.warning(
+                "\t****%s[%s]:原文本在附近%s行内均无匹配！|%s",
+                dict_file.as_posix(),
+                entry.line,
+                JAVA_LINE_SEARCH_WINDOW,
+                entry.original.strip(),
+            )
+
+    # 与以文本模式写入的内容一致，未变化时不写回
+    content = "".join(text).encode("utf-8")
+    if os.linesep != "\n":
+        content = content.replace(b"\n", os.linesep.encode("ascii"))
+    result.written = write_if_changed(original_file, content)
+    return result
+
+
+def java_search_lines(line: int, line_count: int) -> Iterator[int]:
+    for distance in range(1, JAVA_LINE_SEARCH_WINDOW + 1):
+        for candidate in (line + distance, line - distance):
+            if 0 <= candidate < line_count:
+                yield candidate
+
+
+def replace_java_line(
+    text: List[str], line: int, original: str, translation: str
+) -> bool:
+    index = text[line].find(original)
+    if index == -1:
+        return False
+    text[line] = text[line][:index] + translation + text[line][index + len(original) :]
+    return True
+
+
+def check_java_translation(
+    target: str, text: str, original: str, translation: str, file: Path, line: int
+) -> str:
+    """
+    常见错误检测，返回修正后的翻译文本
+    """
+    quote_count = translation.count('"') - translation.count('\\"')
+    if quote_count % 2 == 1 and "//" not in translation and "/*" not in translation:
+        logger.warning(
+            "\t****%s[%s]:翻译文本有奇数个双引号！|https://paratranz.cn/projects/%s/strings?text=%s",
+            file.as_posix(),
+            line,
+            PARATRANZ_PROJECT_ID[target],
+            quote(original),
+        )
+    if "\\n" in translation and "\\n" not in original:
+        logger.warning(
+            "\t****%s[%s]:翻译文本有额外换行符！|https://paratranz.cn/projects/%s/strings?text=%s",
+            file.as_posix(),
+            line,
+            PARATRANZ_PROJECT_ID[target],
+            quote(original),
+        )
+        translation = translation.replace("\\n", "")
+
+    if original.endswith(",") and not translation.strip().endswith(","):
+        logger.warning(
+            "\t****%s[%s]:翻译文本末尾无逗号！|https://paratranz.cn/projects/%s/strings?text=%s",
+            file.as_posix(),
+            line,
+            PARATRANZ_PROJECT_ID[target],
+            quote(original),
+        )
+    elif original.endswith(";") and not translation.strip().endswith(";"):
+        logger.warning(
+            "\t****%s[%s]:翻译文本末尾无分号！|https://paratranz.cn/projects/%s/strings?text=%s",
+            file.as_posix(),
+            line,
+            PARATRANZ_PROJECT_ID[target],
+            quote(original),
+        )
+
+    return translation
+
+
 class Applier:
     def __init__(
-        self, target: str, root: str, dict_dir: str, new_data: WholeDictionary = {}
+        self,
+        target: str,
+        root: str,
+        dict_dir: str,
+        new_data: WholeDictionary = {},
+        tree_cache: Optional[XmlTreeCache] = None,
+        source_index: Optional[SourceIndex] = None,
+        jobs: int = 1,
     ) -> None:
         self.target = target
         self.root = Path(root)
         self.dict_dir = Path(dict_dir)
         self.new_data: WholeDictionary = new_data
+        self.tree_cache = tree_cache
+        self.jobs = resolve_jobs(jobs)
+        self.results: List[ApplyResult] = []
+        self.source_index = (
+            source_index if source_index is not None else SourceIndex(self.root)
+        )
 
     def apply(self) -> None:
         self.apply_res()
+        if self.tree_cache is not None:
+            # 没有对应字典的文件不会再被使用
+            self.tree_cache.clear()
         if self.target == "main":
             self.apply_src()
             self.apply_special()  # 对于其他优化游戏的文件进行调整
@@ -95,7 +584,7 @@ class Applier:
         )
 
     def modify_css(self) -> None:
-        for file in self.root.glob("**/*.css"):
+        for file in self.source_index.paths(".css"):
             with open(file, mode="r", encoding="utf-8") as f:
                 lines = f.readlines()
 
@@ -118,179 +607,66 @@ class Applier:
                 f.writelines(lines)
 
     def modify_java(self) -> None:
-        for file in self.root.glob("**/*.java"):
-            with open(file, mode="r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            for idx, line in enumerate(lines):
-                # 调整字体和行高
-                line = ui_value_modify(line, FONT_SIZE_REGEX, 0.8)
-                line = ui_value_modify(line, LINE_HEIGHT_REGEX, 0.8)
-
-                # 使用中文Locale
-                line = line.replace("Locale.ENGLISH", "Locale.CHINESE")
-
-                if file.name == "Game.java":
-                    # 修改默认字体大小
-                    line = line.replace(
-                        "public static final int FONT_SIZE_NORMAL = 18;",
-                        "public static final int FONT_SIZE_NORMAL = 15;",
-                    )
-                    # 调整日期格式
-                    line = line.replace(
-                        "return date.substring(0, date.length()-5);",
-                        "return date.substring(5, date.length());",
-                    )
-                elif file.name == "Properties.java":
-                    # 修改默认字体
-                    line = line.replace(
-                        "public int fontSize = 18;", "public int fontSize = 15;"
-                    )
-                elif file.name == "UtilText.java":
-                    # 高版本jdk不再自带nashorn
-                    # if "import jdk.nashorn" in line:
-                    #     line = "//" + line
-                    # if "import org.openjdk.nashorn" in line:
-                    #     line = line[2:]
-                    line = line.replace(
-                        ".getGenderName().getFeminine()",
-                        ".getGenderName().getFeminineId()",
-                    )
-                    line = line.replace(
-                        ".getGenderName().getMasculine()",
-                        ".getGenderName().getMasculineId()",
-                    )
-                    line = line.replace(
-                        ".getGenderName().getNeutral()",
-                        ".getGenderName().getNeutralId()",
-                    )
-                    # 调整频率
-                    line = line.replace(
-                        "addMuffle(modifiedSentence, 5);",
-                        "addMuffle(modifiedSentence, 8);",
-                    )
-                    line = line.replace(
-                        "addSexSounds(modifiedSentence, 6);",
-                        "addSexSounds(modifiedSentence, 10);",
-                    )
-                    line = line.replace(
-                        "addBimbo(modifiedSentence, 6);",
-                        "addBimbo(modifiedSentence, 10);",
-                    )
-                    line = line.replace(
-                        "addBimbo(modifiedSentence, 6);",
-                        "addBro(modifiedSentence, 10);",
-                    )
-                    line = line.replace(
-                        "replaceWithMuffle(modifiedSentence, 2);",
-                        "replaceWithMuffle(modifiedSentence, 5);",
-                    )
+        # 规则 -> 文件名 -> 替换次数
+        report: Dict[JavaRewriteRule, Dict[str, int]] = {}
+        ui_report: Dict[str, int] = {}
 
-                elif file.name == "AbstractAttribute.java":
-                    # Attribute的name同时被用于逻辑和显示，故使用类似的nameAbbreviation暂时替代
-                    line = line.replace("return name;", "return nameAbbreviation;")
-                    line = line.replace(
-                        'return "<"+tag+" style=\'color:"+this.getColour().toWebHexString()+";\'>"+name+"</"+tag+">";',
-                        'return "<"+tag+" style=\'color:"+this.getColour().toWebHexString()+";\'>"+nameAbbreviation+"</"+tag+">";',
-                    )
-                elif file.name == "MainController.java":
-                    line = line.replace(
-                        'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 2',
-                        'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 1',
-                    )
-                elif file.name == "CityHallDemographics.java":
-                    line = line.replace(
-                        'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 2',
-                        'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 1',
-                    )
-                elif file.name == "CharacterCreation.java":
-                    line = line.replace(
-                        'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 2',
-                        'Main.mainController.getWebEngine().getDocument().getElementById("hiddenFieldName").getTextContent().length() < 1',
-                    )
-                elif file.name == "Main.java":
-                    # 内置字体导入
-                    line = line.replace(
-                        "protected void loadFonts() {",
-                        "protected void loadFonts() {\n"
-                        + '\t\tif (Font.loadFont(toUri("res/fonts/Source Han/SourceHanSansCN-Regular.otf"), 12) != null) {\n'
-                        + '\t\t\tFont.loadFont(toUri("res/fonts/Source Han/SourceHanSansCN-Bold.otf"), 12);\n'
-                        + "\t\t} else {\n"
-                        + '\t\t\tSystem.err.println("Source Han Sans font could not be loaded.");\n'
-                        + "\t\t}\n",
-                    )
-                elif file.name == "Util.java":
-                    line = line.replace(
-                        'private static Pattern endOfSentence = Pattern.compile("[,.!?]");',
-                        'private static Pattern endOfSentence = Pattern.compile("[,.!?，。！？、]");',
-                    )
-                    # line = line.replace(
-                    #     "if(sentence.charAt(i)==' '",
-                    #     "if(true")
-                    # line = line.replace(
-                    #     "&& Character.isLetter(sentence.charAt(i+1))",
-                    #     "&& !isEndOfSentence(sentence.charAt(i+1))"
-                    # )
-                elif file.name == "Units.java":
-                    # 调整日期格式
-                    line = line.replace(
-                        'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.internationalDate) ? "dd.MM.yy" : "MM/dd/yy")',
-                        'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.internationalDate) ? "yy.MM.dd" : "yy.MM.dd")',
-                    )
-                    line = line.replace(
-                        "DateTimeFormatter.ofPattern(\"d'%o %m' yyyy\")",
-                        'DateTimeFormatter.ofPattern("yyyy年MM月dd日")',
-                    )
-                    # 调整时间格式
-                    line = line.replace(
-                        'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.twentyFourHourTime) ? "HH:mm" : "hh:mm a")',
-                        'DateTimeFormatter.ofPattern(Main.getProperties().hasValue(PropertyValue.twentyFourHourTime) ? "HH:mm" : "hh:mm a").withLocale(Locale.ENGLISH)',
-                    )
-                elif file.name == "AbstractFluidType.java":
-                    # 调整精液前缀判断方法
-                    line = line.replace(
-                        'if(name.endsWith("-")) {',
-                        "if(!baseFluidType.getNames().contains(name)) {",
-                    )
-                elif (
-                    file.name == "AbstractPenisType.java"
-                    or file.name == "AbstractVaginaType.java"
-                ):
-                    line = line.replace(
-                        'if(name.endsWith("-")) {',
-                        "if(!returnNames.containsKey(name)) {",
-                    )
-                elif file.name == "GameCharacter.java":
-                    # remove useless 'the'
-                    line = line.replace(":determiner)", ':"")')
-                elif file.name == "Wes.java":
-                    line = line.replace(
-                        "return this.getNameIgnoresPlayerKnowledge();", 'return "Wes";'
-                    )
-                elif file.name == "Brax.java":
-                    line = line.replace(
-                        "return this.getNameIgnoresPlayerKnowledge();",
-                        "if (Main.game.getDialogueFlags().hasFlag(DialogueFlagValue.bimbofiedBrax))\n"
-                        + '\t\t\treturn "Brandi";\n'
-                        + "\t\telse if (Main.game.getDialogueFlags().hasFlag(DialogueFlagValue.feminisedBrax))\n"
-                        + '\t\t\treturn "Bree";\n'
-                        + "\t\telse\n"
-                        + '\t\t\treturn "Brax";\n',
-                    )
-                elif file.name == "Sex.java":
-                    line = line.replace(
-                        "positionActionsPlayer.sort((a1, a2) ->",
-                        "positionActionsPlayer.sort((a1, a2) -> true?((a1.getActionType() == a2.getActionType())? (a1.isPositionSwap() == a2.isPositionSwap() ? a1.getActionTitle().compareTo(a2.getActionTitle()) : (a1.isPositionSwap() ? -1 : 1)): (a1.getActionType() == SexActionType.POSITIONING_MENU ? -1 : 1)):",
-                    )
-                elif file.name == "SexActionManager.java":
-                    line = line.replace("Value<>", "Value<String, Field[]>")
-                lines[idx] = line
+        for file in self.source_index.paths(".java"):
+            # 与逐行读写时一致，换行符统一为\n；内容未修改且换行符无需统一的文件不写回
+            with open(file, mode="r", encoding="utf-8") as f:
+                text = f.read()
+                newline_normalized = f.newlines in (None, "\n")
+
+            # 调整字体和行高
+            modified = text
+            if "font-size" in modified or "line-height" in modified:
+                lines = modified.split("\n")
+                count = 0
+                for idx, line in enumerate(lines):
+                    if "font-size" not in line and "line-height" not in line:
+                        continue
+                    new_line = ui_value_modify(line, FONT_SIZE_REGEX, 0.8)
+                    new_line = ui_value_modify(new_line, LINE_HEIGHT_REGEX, 0.8)
+                    if new_line != line:
+                        lines[idx] = new_line
+                        count += 1
+                if count > 0:
+                    modified = "\n".join(lines)
+                    ui_report[file.name] = count
+
+            for rule in JAVA_GLOBAL_REWRITE_RULES + JAVA_FILE_REWRITE_RULES.get(
+                file.name, []
+            ):
+                modified, count = rule.apply(modified)
+                if count > 0:
+                    file_counts = report.setdefault(rule, {})
+                    file_counts[file.name] = file_counts.get(file.name, 0) + count
+
+            if modified == text and newline_normalized:
+                continue
 
             with open(file, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+                f.write(modified)
+
+        if len(ui_report) > 0:
+            logger.info(
+                "调整字体和行高：%s个文件，%s行",
+                len(ui_report),
+                sum(ui_report.values()),
+            )
+        for rule, file_counts in report.items():
+            logger.info(
+                "java改写规则[%s]：%s",
+                rule.description,
+                "，".join(f"{name}×{count}" for name, count in file_counts.items()),
+            )
+        for name, rules in JAVA_FILE_REWRITE_RULES.items():
+            for rule in rules:
+                if name not in report.get(rule, {}):
+                    logger.info("java改写规则[%s]未在%s中生效", rule.description, name)
 
     def modify_xml(self) -> None:
-        for file in self.root.glob("**/*.xml"):
+        for file in self.source_index.paths(".xml"):
             if file.name == "eisek_mob_hideout.xml":
                 with open(file, mode="r", encoding="utf-8") as f:
                     line = f.read()
@@ -304,178 +680,109 @@ class Applier:
                 with open(file, mode="w", encoding="utf-8") as f:
                     f.write(new_line)
 
-    def apply_res(self) -> None:
-        original_files = [file for file in self.root.glob("**/*.xml")]
-        dict_fils = [
-            self.dict_dir.joinpath(file.relative_to(self.root)).with_suffix(".json")
-            for file in original_files
-        ]
-
-        for original_file, dict_file in zip(original_files, dict_fils):
-            if not dict_file.exists():  # 不存在对应字典文件
+    def dict_sources(self, suffix: str) -> List[Tuple[Path, Path]]:
+        """
+        按内存中的字典获取(源文件, 字典文件)，无需等待字典写入磁盘
+        """
+        source_files = {
+            Path(file.relative).with_suffix(".json").as_posix(): file.path
+            for file in self.source_index.query(suffix)
+        }
+
+        pairs: List[Tuple[Path, Path]] = []
+        for dict_key in self.new_data.keys():
+            original_file = source_files.get(dict_key)
+            if original_file is None:  # 不存在对应源文件
                 continue
+            pairs.append((original_file, self.dict_dir / dict_key))
+        return pairs
 
-            self.apply_xml(original_file, dict_file)
-
-    def apply_xml(self, original_file: Path, dict_file: Path) -> None:
-        # with open(dict_file, "r", encoding="utf-8") as f:
-        #     entry_list = json.load(f)
-
-        # entry_list = [XmlEntry.from_json(original_file, entry) for entry in entry_list]
-
-        json_dict: SingleDictionary = self.new_data[
-            dict_file.relative_to(self.dict_dir).as_posix()
-        ]
-
-        entry_list = [
-            XmlEntry.from_json(original_file, entry) for _, entry in json_dict.items()
-        ]
-
-        parser = etree.XMLParser(strip_cdata=False)
+    def apply_res(self) -> None:
+        pairs = self.dict_sources(".xml")
+        if self.jobs <= 1 or len(pairs) <= 1:
+            results = [
+                self.apply_xml(original_file, dict_file)
+                for original_file, dict_file in pairs
+            ]
+        else:
+            # 每个文件一个任务，文档树缓存只能在本进程内使用
+            with ProcessPoolExecutor(self.jobs) as executor:
+                results = list(
+                    executor.map(
+                        apply_xml_file,
+                        [original_file for original_file, _ in pairs],
+                        [dict_file for _, dict_file in pairs],
+                        [self.dict_of(dict_file) for _, dict_file in pairs],
+                    )
+                )
+        self.report("xml", results)
 
-        tree: etree._Element = etree.parse(str(original_file), parser)
+    def apply_xml(self, original_file: Path, dict_file: Path) -> ApplyResult:
+        tree: Optional[etree._ElementTree] = None
+        if self.tree_cache is not None:
+            # 复用提取阶段的文档树，写回后文件已变化，故直接取出
+            tree = self.tree_cache.take(original_file)
 
-        entry_dict: Dict[str, List[XmlEntry]] = {}
-        for entry in entry_list:
-            if entry_dict.get(entry.node_tag) is None:
-                entry_dict[entry.node_tag] = [entry]
-            else:
-                entry_dict[entry.node_tag].append(entry)
-
-        for tag, entry_cluster in entry_dict.items():
-            # special process for htmlContent
-            if tag == "htmlContent":
-                entry_dict: Dict[str, List[XmlEntry]] = {}
-                for entry in entry_cluster:
-                    if entry_dict.get(entry.attribute):
-                        entry_dict[entry.attribute].append(entry)
-                    else:
-                        entry_dict[entry.attribute] = [entry]
-
-                for entry_attribute, entries in entry_dict.items():
-                    nodes = tree.xpath(f"//htmlContent[@tag='{entry_attribute}']")
-                    if len(nodes) > 1:
-                        for idx, node in enumerate(nodes):
-                            for entry in entries:
-                                xml_node_replace_translation(node, entry)
-                    else:
-                        node = nodes[0]
-                        for entry in entries:
-                            xml_node_replace_translation(node, entry)
-            else:
-                # nodes: List[etree._Element] = list()
-                nodes: List[etree._Element] = list(
-                    filter(valid_element, tree.iter(tag))
-                )
-                for entry in entry_cluster:
-                    try:
-                        node = nodes[entry.node_idx]
-                    except Exception:
-                        logger.error(
-                            "****%s[%s]:节点索引超出范围！",
-                            entry.node_idx,
-                            nodes,
-                            tag
-                        )
-                        for node in nodes:
-                            logger.error(node.text)
-                        raise Exception
-                    xml_node_replace_translation(node, entry)
-
-        tree.write(
-            original_file.as_posix(),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-            standalone=False,
+        return apply_xml_file(
+            original_file, dict_file, self.dict_of(dict_file), tree=tree
         )
 
     def apply_src(self) -> None:
-        original_files = [file for file in self.root.glob("**/*.java")]
-        dict_fils = [
-            self.dict_dir.joinpath(file.relative_to(self.root)).with_suffix(".json")
-            for file in original_files
-        ]
-
-        for original_file, dict_file in zip(original_files, dict_fils):
-            if not dict_file.exists():  # 不存在对应字典文件
-                continue
-
-            self.apply_java(original_file, dict_file)
-
-    def apply_java(self, original_file: Path, dict_file: Path) -> None:
-        with open(original_file, "r", encoding="utf-8") as f:
-            text = f.readlines()
-
-        json_dict: SingleDictionary = self.new_data[
-            dict_file.relative_to(self.dict_dir).as_posix()
-        ]
-
-        entry_list = [
-            CodeEntry.from_json(original_file, entry) for _, entry in json_dict.items()
-        ]
-
-        for entry in entry_list:
-            line_text = text[entry.line]
-            applied_text = self.apply_java_line(
-                line_text, entry.original, entry.translation, dict_file, entry.line
-            )
-            text[entry.line] = applied_text
-
-        with open(original_file, "w", encoding="utf-8") as f:
-            f.writelines(text)
-
-    def apply_java_line(
-        self, text: str, original: str, translation: str, file: Path, line: int
-    ) -> str:
-        if len(translation) <= 0:
-            return text
-
-        # 常见错误检测
-        quote_count = translation.count('"') - translation.count('\\"')
-        if quote_count % 2 == 1 and "//" not in translation and "/*" not in translation:
-            logger.warning(
-                "\t****%s[%s]:翻译文本有奇数个双引号！|https://paratranz.cn/projects/%s/strings?text=%s",
-                file.as_posix(),
-                line,
-                PARATRANZ_PROJECT_ID[self.target],
-                quote(original),
-            )
-            print(text)
-        if "\\n" in translation and "\\n" not in original:
-            logger.warning(
-                "\t****%s[%s]:翻译文本有额外换行符！|https://paratranz.cn/projects/%s/strings?text=%s",
-                file.as_posix(),
-                line,
-                PARATRANZ_PROJECT_ID[self.target],
-                quote(original),
-            )
-            translation = translation.replace("\\n", "")
+        pairs = self.dict_sources(".java")
+        if self.jobs <= 1 or len(pairs) <= 1:
+            results = [
+                self.apply_java(original_file, dict_file)
+                for original_file, dict_file in pairs
+            ]
+        else:
+            with ProcessPoolExecutor(self.jobs) as executor:
+                results = list(
+                    executor.map(
+                        apply_java_file,
+                        itertools.repeat(self.target),
+                        [original_file for original_file, _ in pairs],
+                        [dict_file for _, dict_file in pairs],
+                        [self.dict_of(dict_file) for _, dict_file in pairs],
+                    )
+                )
+        self.report("java", results)
 
-        if original.endswith(",") and not translation.strip().endswith(","):
-            logger.warning(
-                "\t****%s[%s]:翻译文本末尾无逗号！|https://paratranz.cn/projects/%s/strings?text=%s",
-                file.as_posix(),
-                line,
-                PARATRANZ_PROJECT_ID[self.target],
-                quote(original),
-            )
-        elif original.endswith(";") and not translation.strip().endswith(";"):
-            logger.warning(
-                "\t****%s[%s]:翻译文本末尾无分号！|https://paratranz.cn/projects/%s/strings?text=%s",
-                file.as_posix(),
-                line,
-                PARATRANZ_PROJECT_ID[self.target],
-                quote(original),
-            )
+    def apply_java(self, original_file: Path, dict_file: Path) -> ApplyResult:
+        return apply_java_file(
+            self.target, original_file, dict_file, self.dict_of(dict_file)
+        )
 
-        index = text.find(original)
-        if index == -1:
-            logger.warning("\t****原文本无匹配！")
-            return text
-        else:
-            text = text[:index] + translation + text[index + len(original) :]
-            return text
+    def dict_of(self, dict_file: Path) -> SingleDictionary:
+        return self.new_data[dict_file.relative_to(self.dict_dir).as_posix()]
+
+    def report(self, kind: str, results: List[ApplyResult]) -> None:
+        self.results.extend(results)
+        logger.info(
+            "应用%s字典：%s个文件，写入%s个；条目应用%s个，跳过%s个，无匹配%s个",
+            kind,
+            len(results),
+            sum(result.written for result in results),
+            sum(result.applied for result in results),
+            sum(result.skipped for result in results),
+            sum(result.mismatched for result in results),
+        )
+        for result in results:
+            if len(result.relocated) > 0:
+                logger.info(
+                    "\t%s：%s个条目的行号已修正 %s",
+                    result.file,
+                    len(result.relocated),
+                    ", ".join(
+                        f"{expected}->{actual}" for expected, actual in result.relocated
+                    ),
+                )
+            if len(result.missed) > 0:
+                logger.info(
+                    "\t%s：%s个条目无匹配 %s",
+                    result.file,
+                    len(result.missed),
+                    ", ".join(result.missed),
+                )
 
 
 if __name__ == "__main__":
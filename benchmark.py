@@ -0,0 +1,478 @@
+"""
+流水线各阶段的性能测试，同时校验新旧实现的结果一致
+
+python benchmark.py --target main xml
+python benchmark.py --target main java
+python benchmark.py --target main htmlcontent
+python benchmark.py --target main applyxml
+python benchmark.py dictzip --zip downloads/dict-latest.zip
+python benchmark.py --target main merge --zip downloads/dict-latest.zip
+python benchmark.py fuzzy --zip downloads/dict-latest.zip
+"""
+import argparse
+import copy
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from lxml import etree
+
+from applier import XmlNodeIndex, valid_element
+from const import DOWNLOAD_DIR, PREVIOUS_GAME_VERSION, SOURCE_DIR
+from dict_source import DictionarySource, DirectoryDictionarySource, ZipDictionarySource
+from extractor import (
+    Extractor,
+    extract_xml_tree,
+    extract_java_file,
+)
+from data import JsonEntry, SingleDictionary, WholeDictionary, XmlEntry
+from fuzzy_match import FUZZY_THRESHOLD, FuzzyIndex, signature, similarity
+from logger import logger
+import benchmark_baseline as baseline
+from update import update_data
+from util import split_htmlContent
+
+
+def res_xml_files(root: Path, target: str) -> List[Path]:
+    res_path = root / "res" if target == "main" else root
+    return sorted(res_path.glob("**/*.xml"))
+
+
+def bench_xml(args) -> None:
+    files = res_xml_files(Path(args.root), args.target)
+    parser = etree.XMLParser(strip_cdata=False)
+
+    parse_time = legacy_time = new_time = 0.0
+    for file in files:
+        start = time.perf_counter()
+        legacy = baseline.extract_xml(file)
+        legacy_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        root = etree.parse(file.as_posix(), parser)
+        parse_time += time.perf_counter() - start
+        new = extract_xml_tree(file, root)
+        new_time += time.perf_counter() - start
+
+        if list(legacy.items()) != list(new.items()):
+            raise AssertionError(f"提取结果不一致：{file}")
+
+    logger.info("共%s个xml文件，结果一致", len(files))
+    logger.info("其中解析耗时 %.3fs", parse_time)
+    logger.info("基线逐节点名遍历 %.3fs", legacy_time)
+    logger.info(
+        "单次遍历分派 %.3fs (%.1fx)", new_time, legacy_time / max(new_time, 1e-9)
+    )
+
+
+def bench_java(args) -> None:
+    files = sorted(Path(args.root).joinpath("src").glob("**/*.java"))
+
+    timings: List[Tuple[float, float, Path]] = []
+    for file in files:
+        start = time.perf_counter()
+        legacy = baseline.extract_java(file) or {}
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        new = extract_java_file(file)
+        new_time = time.perf_counter() - start
+
+        if list(legacy.items()) != list(new.items()):
+            raise AssertionError(f"提取结果不一致：{file}")
+        timings.append((legacy_time, new_time, file))
+
+    legacy_total = sum(t[0] for t in timings)
+    new_total = sum(t[1] for t in timings)
+    logger.info("共%s个java文件，结果一致", len(files))
+    logger.info("基线逐行判断目录并逐个检查 %.3fs", legacy_total)
+    logger.info(
+        "按文件预编译匹配 %.3fs (%.1fx)", new_total, legacy_total / max(new_total, 1e-9)
+    )
+    logger.info("节省耗时最多的文件：")
+    for legacy_time, new_time, file in sorted(
+        timings, key=lambda t: t[1] - t[0]
+    )[: args.top]:
+        logger.info(
+            "\t%.2fms -> %.2fms %s",
+            legacy_time * 1000,
+            new_time * 1000,
+            file.relative_to(args.root).as_posix(),
+        )
+
+
+def bench_htmlcontent(args) -> None:
+    res_path = Path(args.root) / "res" / "txt" if args.target == "main" else Path(args.root)
+    parser = etree.XMLParser(strip_cdata=False)
+
+    texts: List[str] = []
+    for file in sorted(res_path.glob("**/*.xml")):
+        root = etree.parse(file.as_posix(), parser)
+        for element in root.iter("htmlContent"):
+            if element.text is not None and element.text.strip() != "":
+                texts.append(element.text)
+
+    # 全部htmlContent作为对照语料
+    for text in texts:
+        if baseline.split_htmlContent(text) != split_htmlContent(text):
+            raise AssertionError(f"拆分结果不一致：{text[:200]}")
+    logger.info("共%s个htmlContent节点，拆分结果一致", len(texts))
+
+    largest = sorted(texts, key=len, reverse=True)[: args.top]
+    logger.info(
+        "最大的%s个节点，共%s字符", len(largest), sum(len(text) for text in largest)
+    )
+    for name, func in [
+        ("九次findall", baseline.split_htmlContent),
+        ("单次遍历记号", split_htmlContent),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in largest:
+                func(text)
+        logger.info("%s %.3fs", name, time.perf_counter() - start)
+
+
+def group_entries(file: Path, entry_dict: SingleDictionary) -> Dict[str, List[XmlEntry]]:
+    grouped: Dict[str, List[XmlEntry]] = {}
+    for entry in entry_dict.values():
+        xml_entry = XmlEntry.from_json(file, entry)
+        grouped.setdefault(xml_entry.node_tag, []).append(xml_entry)
+    return grouped
+
+
+def legacy_resolve_nodes(
+    tree: etree._ElementTree, grouped: Dict[str, List[XmlEntry]]
+) -> List[Tuple[str, List[etree._Element]]]:
+    """
+    旧实现：每个htmlContent的tag属性一次xpath，其他节点名各遍历一次
+    """
+    resolved = []
+    for tag, entries in grouped.items():
+        if tag == "htmlContent":
+            for attribute in dict.fromkeys(entry.attribute for entry in entries):
+                nodes = tree.xpath(f"//htmlContent[@tag='{attribute}']")
+                resolved.append((f"{tag}:{attribute}", nodes))
+        else:
+            nodes = list(filter(valid_element, tree.iter(tag)))
+            resolved.append((tag, nodes))
+    return resolved
+
+
+def index_resolve_nodes(
+    tree: etree._ElementTree, grouped: Dict[str, List[XmlEntry]]
+) -> List[Tuple[str, List[etree._Element]]]:
+    node_index = XmlNodeIndex(tree, grouped.keys())
+    resolved = []
+    for tag, entries in grouped.items():
+        if tag == "htmlContent":
+            for attribute in dict.fromkeys(entry.attribute for entry in entries):
+                nodes = node_index.html_content_nodes(attribute)
+                resolved.append((f"{tag}:{attribute}", nodes))
+        else:
+            resolved.append((tag, node_index.valid_nodes(tag)))
+    return resolved
+
+
+def bench_applyxml(args) -> None:
+    parser = etree.XMLParser(strip_cdata=False)
+
+    documents = []
+    for file in res_xml_files(Path(args.root), args.target):
+        tree = etree.parse(file.as_posix(), parser)
+        grouped = group_entries(file, extract_xml_tree(file, tree))
+        if len(grouped) == 0:
+            continue
+        html_count = sum(1 for _ in tree.iter("htmlContent"))
+        documents.append((html_count, file, tree, grouped))
+
+    # htmlContent最多的对话文件
+    documents = sorted(documents, key=lambda doc: doc[0], reverse=True)[: args.top]
+    quoted = 0
+    for _, file, tree, grouped in documents:
+        if any("'" in (entry.attribute or "") for entry in grouped.get("htmlContent", [])):
+            quoted += 1  # 旧实现的xpath无法处理含单引号的属性
+            continue
+        if legacy_resolve_nodes(tree, grouped) != index_resolve_nodes(tree, grouped):
+            raise AssertionError(f"节点查找结果不一致：{file}")
+    logger.info(
+        "htmlContent最多的%s个文件（共%s个htmlContent），查找结果一致，%s个文件含单引号属性未对比",
+        len(documents),
+        sum(doc[0] for doc in documents),
+        quoted,
+    )
+
+    for name, func in [
+        ("逐属性xpath", legacy_resolve_nodes),
+        ("单次遍历索引", index_resolve_nodes),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _, _, tree, grouped in documents:
+                if func is legacy_resolve_nodes and any(
+                    "'" in (entry.attribute or "")
+                    for entry in grouped.get("htmlContent", [])
+                ):
+                    continue
+                func(tree, grouped)
+        logger.info("%s %.3fs", name, time.perf_counter() - start)
+
+
+def legacy_unzip_dict(zip_path: Path, extract_path: Path) -> Path:
+    """
+    旧实现：解压整个压缩包，移动raw目录，删除utf8目录，再逐个重命名*.json.json
+    """
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        zip_ref.extractall(extract_path)
+
+    old_dict_dir = extract_path / "old_dict"
+    shutil.move(extract_path / "raw", old_dict_dir)
+    shutil.rmtree(extract_path / "utf8", ignore_errors=True)
+
+    for file in old_dict_dir.glob("**/*.json.json"):
+        os.rename(file, file.parent / file.stem)
+    return old_dict_dir
+
+
+def load_source(source: DictionarySource) -> List[Tuple[str, List[JsonEntry]]]:
+    return [(path, source.load(path)) for path in source.paths()] + [
+        (path, source.load_outdated(path)) for path in source.outdated_paths()
+    ]
+
+
+def bench_dictzip(args) -> None:
+    zip_path = Path(args.zip)
+
+    legacy_time = new_time = 0.0
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            start = time.perf_counter()
+            legacy = load_source(
+                DirectoryDictionarySource(legacy_unzip_dict(zip_path, Path(temp_dir)))
+            )
+            legacy_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        source = ZipDictionarySource(zip_path)
+        new = load_source(source)
+        source.close()
+        new_time += time.perf_counter() - start
+
+        if legacy != new:
+            raise AssertionError("读取结果不一致")
+
+    logger.info(
+        "共%s个字典文件（含过时词条），%s个条目，结果一致",
+        len(new),
+        sum(len(entries) for _, entries in new),
+    )
+    logger.info("解压后遍历读取 %.3fs", legacy_time / args.repeat)
+    logger.info(
+        "直接读取压缩包 %.3fs (%.1fx)",
+        new_time / args.repeat,
+        legacy_time / max(new_time, 1e-9),
+    )
+
+
+def legacy_merge(old_data, new_data, prev_outdated_data):
+    """
+    旧实现：深复制整个旧字典后合并
+    """
+    outdated_data, new_data = baseline.update_data(copy.deepcopy(old_data), new_data)
+    missing = list(outdated_data)
+    if len(outdated_data) > 0:
+        _, prev_outdated_data = baseline.update_data(
+            outdated_data, prev_outdated_data, version=PREVIOUS_GAME_VERSION
+        )
+    return missing, new_data, prev_outdated_data
+
+
+def copy_free_merge(old_data, new_data, prev_outdated_data):
+    outdated_data, new_data = update_data(old_data, new_data)
+    missing = list(outdated_data)
+    outdated_data = {key: dict(entry) for key, entry in outdated_data.items()}
+    if len(outdated_data) > 0:
+        _, prev_outdated_data = update_data(
+            outdated_data, prev_outdated_data, version=PREVIOUS_GAME_VERSION
+        )
+    return missing, new_data, prev_outdated_data
+
+
+def merge_inputs(
+    source: DictionarySource, new_data: WholeDictionary
+) -> List[Tuple[SingleDictionary, SingleDictionary, SingleDictionary]]:
+    """
+    每次调用都重新读取，两种实现各自修改自己的一份输入
+    """
+    inputs = []
+    for path in source.paths():
+        if path not in new_data:
+            continue
+        old_data = {entry["key"]: entry for entry in source.load(path)}
+        prev_outdated_data = {
+            entry["key"]: entry for entry in source.load_outdated(path) or []
+        }
+        inputs.append((old_data, copy.deepcopy(new_data[path]), prev_outdated_data))
+    return inputs
+
+
+def bench_merge(args) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        extractor = Extractor(args.target, args.root, temp_dir, "")
+        extractor.extract()
+    source = ZipDictionarySource(Path(args.zip))
+
+    # 结果一致，且新实现不修改旧字典
+    legacy_inputs = merge_inputs(source, extractor.new_data)
+    new_inputs = merge_inputs(source, extractor.new_data)
+    pristine = copy.deepcopy([old_data for old_data, _, _ in new_inputs])
+    for legacy_input, new_input, old_data in zip(legacy_inputs, new_inputs, pristine):
+        if legacy_merge(*legacy_input) != copy_free_merge(*new_input):
+            raise AssertionError("合并结果不一致")
+        if new_input[0] != old_data:
+            raise AssertionError("旧字典被修改")
+    logger.info(
+        "共%s个字典文件，%s个旧条目，合并结果一致",
+        len(new_inputs),
+        sum(len(old_data) for old_data in pristine),
+    )
+
+    for name, func in [("深复制后合并", legacy_merge), ("只读合并", copy_free_merge)]:
+        cpu_time = 0.0
+        for _ in range(args.repeat):
+            inputs = merge_inputs(source, extractor.new_data)
+            start = time.process_time()
+            for merge_input in inputs:
+                func(*merge_input)
+            cpu_time += time.process_time() - start
+
+        # 与流水线一样保留全部合并结果
+        inputs = merge_inputs(source, extractor.new_data)
+        tracemalloc.start()
+        results = [func(*merge_input) for merge_input in inputs]
+        _, peak = tracemalloc.get_traced_memory()
+        del results
+        tracemalloc.stop()
+        logger.info(
+            "%s：CPU %.3fs，内存峰值%.1fMB",
+            name,
+            cpu_time / args.repeat,
+            peak / 1024 / 1024,
+        )
+    source.close()
+
+
+def bench_fuzzy(args) -> None:
+    source = ZipDictionarySource(Path(args.zip))
+    translated: Dict[str, str] = {}
+    untranslated: List[str] = []
+    for path in source.paths():
+        for entry in source.load(path):
+            if entry["stage"] == 0:
+                untranslated.append(entry["original"])
+            elif entry["translation"] not in ("", entry["original"]):
+                translated.setdefault(entry["original"], entry["translation"])
+    source.close()
+    untranslated = list(dict.fromkeys(untranslated))
+
+    start = time.perf_counter()
+    index: FuzzyIndex[str] = FuzzyIndex()
+    for original in translated:
+        index.add(original, original)
+    index.sort_keys()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [index.query(original, limit=1) for original in untranslated]
+    query_time = time.perf_counter() - start
+    logger.info(
+        "索引%s条原文 %.3fs，查询%s条 %.3fs，%s条找到相似原文",
+        len(index),
+        build_time,
+        len(untranslated),
+        query_time,
+        sum(len(result) > 0 for result in results),
+    )
+
+    # 与两两比较签名的结果对照，统计LSH的召回率
+    signatures = [signature(original) for original in translated]
+    signatures = [sig for sig in signatures if sig is not None]
+    expected = found = 0
+    for original, result in list(zip(untranslated, results))[: args.sample]:
+        sig = signature(original)
+        if sig is None:
+            continue
+        best = max((similarity(sig, other) for other in signatures), default=0.0)
+        if best >= FUZZY_THRESHOLD:
+            expected += 1
+            found += len(result) > 0 and result[0][0] == best
+    logger.info("抽样%s条，两两比较有%s条超过阈值，LSH找到其中%s条", args.sample, expected, found)
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument(
+    "--target",
+    type=str,
+    default="main",
+    choices=["main", "mod"],
+    help="determine which project to benchmark",
+)
+argparser.add_argument(
+    "--root", type=str, default=None, help="source directory, default to SOURCE_DIR"
+)
+subparsers = argparser.add_subparsers(dest="stage", required=True)
+subparsers.add_parser("xml", help="single-pass xml extraction").set_defaults(
+    func=bench_xml
+)
+java_parser = subparsers.add_parser("java", help="precompiled java line matcher")
+java_parser.add_argument("--top", type=int, default=10, help="files to report")
+java_parser.set_defaults(func=bench_java)
+html_parser = subparsers.add_parser("htmlcontent", help="htmlContent splitting")
+html_parser.add_argument("--top", type=int, default=50, help="largest nodes to time")
+html_parser.add_argument("--repeat", type=int, default=20, help="timing rounds")
+html_parser.set_defaults(func=bench_htmlcontent)
+applyxml_parser = subparsers.add_parser("applyxml", help="xml node lookup when applying")
+applyxml_parser.add_argument("--top", type=int, default=20, help="largest dialogue files")
+applyxml_parser.add_argument("--repeat", type=int, default=20, help="timing rounds")
+applyxml_parser.set_defaults(func=bench_applyxml)
+dictzip_parser = subparsers.add_parser("dictzip", help="reading the dictionary zip")
+dictzip_parser.add_argument(
+    "--zip",
+    type=str,
+    default=os.path.join(DOWNLOAD_DIR, "dict-latest.zip"),
+    help="dictionary zip downloaded from paratranz",
+)
+dictzip_parser.add_argument("--repeat", type=int, default=3, help="timing rounds")
+dictzip_parser.set_defaults(func=bench_dictzip)
+merge_parser = subparsers.add_parser("merge", help="merging the old dictionary")
+merge_parser.add_argument(
+    "--zip",
+    type=str,
+    default=os.path.join(DOWNLOAD_DIR, "dict-latest.zip"),
+    help="dictionary zip downloaded from paratranz",
+)
+merge_parser.add_argument("--repeat", type=int, default=3, help="timing rounds")
+merge_parser.set_defaults(func=bench_merge)
+fuzzy_parser = subparsers.add_parser("fuzzy", help="fuzzy matching untranslated entries")
+fuzzy_parser.add_argument(
+    "--zip",
+    type=str,
+    default=os.path.join(DOWNLOAD_DIR, "dict-latest.zip"),
+    help="dictionary zip downloaded from paratranz",
+)
+fuzzy_parser.add_argument(
+    "--sample", type=int, default=200, help="queries compared against brute force"
+)
+fuzzy_parser.set_defaults(func=bench_fuzzy)
+
+
+if __name__ == "__main__":
+    args = argparser.parse_args()
+    if args.root is None:
+        args.root = SOURCE_DIR[args.target]
+    args.func(args)
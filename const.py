@@ -27,6 +27,20 @@ NEW_DICT_DIR: Dict = {"main": "./new_dict", "mod": "./new_mod_dict"}
 OLD_DICT_DIR: Dict = {"main": "./old_dict", "mod": "./old_mod_dict"}
 ENTRY_DIFF_DIR: Dict = {"main": "./entry_diff", "mod": "./entry_mod_diff"}
 TRANS_DIFF_DIR: Dict = {"main": "./translation_diff", "mod": "./translation_mod_diff"}
+SUGGESTION_DIR: Dict = {"main": "./fuzzy_suggestion", "mod": "./fuzzy_mod_suggestion"}
+CHANGESET_FILE: Dict = {"main": "./dict_changeset.json", "mod": "./dict_mod_changeset.json"}
+EXTRACT_CACHE_FILE: Dict = {
+    "main": "./cache/extract_main.json",
+    "mod": "./cache/extract_mod.json",
+}
+DICT_SNAPSHOT_FILE: Dict = {
+    "main": "./cache/dict_main.snapshot",
+    "mod": "./cache/dict_mod.snapshot",
+}
+# 提取与应用阶段共用的xml文档树缓存的内存上限
+XML_TREE_CACHE_LIMIT = 256 * 1024 * 1024
+# 解析后的文档树占用约为源文件大小的倍数：对话文本约4.5倍，物品、服装等短节点较多的文件约8.7倍
+XML_TREE_MEMORY_FACTOR = 9
 FONT_DIR = "./resources/font"
 SVG_DIR = "./resources/svg"
 FONT_TARGET_DIR = "./res/fonts"
@@ -72,6 +86,12 @@ __all__ = [
     "SOURCE_DIR",
     "NEW_DICT_DIR",
     "OLD_DICT_DIR",
+    "SUGGESTION_DIR",
+    "CHANGESET_FILE",
+    "EXTRACT_CACHE_FILE",
+    "DICT_SNAPSHOT_FILE",
+    "XML_TREE_CACHE_LIMIT",
+    "XML_TREE_MEMORY_FACTOR",
     "FONT_DIR",
     "SVG_DIR",
     "FONT_TARGET_DIR",
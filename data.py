@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+import sys
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Dict, List, Tuple
 from pathlib import Path
 
 JsonEntry = Dict
@@ -7,7 +11,149 @@ WholeDictionary = Dict[Path, Dict[str, JsonEntry]]
 SingleDictionary = Dict[str, JsonEntry]
 
 
-@dataclass
+def strip_version(key: str) -> str:
+    """
+    去掉过时词条合并时追加的版本号后缀，不修改字典中的条目
+    """
+    if "." in key:
+        return key[: key.rfind("_")]
+    return key
+
+
+@lru_cache(maxsize=None)
+def parse_xml_key(key: str) -> Tuple[str, Optional[str], int]:
+    """
+    解析xml条目的key，返回(节点名, 属性, 编号)，不同文件中的key大量重复，结果会被缓存
+    """
+    parts = strip_version(key).split("_")
+    return (
+        sys.intern(parts[0]),
+        parts[1].replace("-", "_") if parts[1] != "text" else None,
+        int(parts[-1]),
+    )
+
+
+@lru_cache(maxsize=None)
+def parse_code_key(key: str) -> int:
+    """
+    解析java条目的key，返回行号
+    """
+    return int(strip_version(key))
+
+
+def intern_dictionary(entry_dict: SingleDictionary) -> SingleDictionary:
+    """
+    驻留字典中的key，所有文件共用同一份key字符串；条目中的"key"与字典的键指向同一对象
+    """
+    interned: SingleDictionary = {}
+    for key, entry in entry_dict.items():
+        key = sys.intern(key)
+        if entry.get("key") == key:
+            entry["key"] = key
+        interned[key] = entry
+    return interned
+
+
+COMPACT_FIELDS = ("key", "original", "translation", "stage")
+
+
+class CompactDictionary(Mapping):
+    """
+    只读的单个字典文件，key、原文、译文与阶段按列保存，不为每个条目保留一个dict
+
+    按key取条目时才构造dict，修改取到的条目不影响字典本身；含有其他字段的条目，其余字段单独保存
+    """
+
+    __slots__ = ("index", "originals", "translations", "stages", "extras")
+
+    def __init__(self, entries: Iterable[JsonEntry]):
+        self.index: Dict[str, int] = {}
+        originals: List[str] = []
+        translations: List[str] = []
+        self.stages = array("b")
+        self.extras: Dict[int, Dict] = {}
+        for row, entry in enumerate(entries):
+            self.index[sys.intern(entry["key"])] = row
+            originals.append(entry["original"])
+            translations.append(entry["translation"])
+            self.stages.append(entry["stage"])
+            if len(entry) > len(COMPACT_FIELDS):
+                self.extras[row] = {
+                    name: value
+                    for name, value in entry.items()
+                    if name not in COMPACT_FIELDS
+                }
+        self.originals: Tuple[str, ...] = tuple(originals)
+        self.translations: Tuple[str, ...] = tuple(translations)
+
+    def __getitem__(self, key: str) -> JsonEntry:
+        row = self.index[key]
+        entry = {
+            "key": key,
+            "original": self.originals[row],
+            "translation": self.translations[row],
+            "stage": self.stages[row],
+        }
+        extra = self.extras.get(row)
+        if extra is not None:
+            entry.update(extra)
+        return entry
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.index
+
+    def __eq__(self, other: object) -> bool:
+        """
+        与其他字典逐条比较，结果同dict相等，但不为每个条目构造dict
+        """
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(other) != len(self.index):
+            return False
+        missing = object()
+        for key, entry in other.items():
+            row = self.index.get(key)
+            if row is None:
+                return False
+            extra = self.extras.get(row, {})
+            if (
+                len(entry) != len(COMPACT_FIELDS) + len(extra)
+                or entry.get("key", missing) != key
+                or entry.get("original", missing) != self.originals[row]
+                or entry.get("translation", missing) != self.translations[row]
+                or entry.get("stage", missing) != self.stages[row]
+                or any(entry.get(name, missing) != value for name, value in extra.items())
+            ):
+                return False
+        return True
+
+    __hash__ = None
+
+    def __getstate__(self) -> Tuple:
+        return self.index, self.originals, self.translations, self.stages, self.extras
+
+    def __setstate__(self, state: Tuple) -> None:
+        index, self.originals, self.translations, self.stages, self.extras = state
+        # 进程池返回时反序列化得到的是新字符串，与其他字典共用同一份key
+        self.index = {sys.intern(key): row for key, row in index.items()}
+
+
+def compact_dictionaries(data: Dict[str, Mapping]) -> None:
+    """
+    将整个字典的各文件原地转换为CompactDictionary，逐个文件转换，转换完的条目dict随即释放
+    """
+    for path, entry_dict in data.items():
+        if not isinstance(entry_dict, CompactDictionary):
+            data[path] = CompactDictionary(entry_dict.values())
+
+
+@dataclass(slots=True)
 class Entry:
     file: str
     original: str or bytes
@@ -21,7 +167,7 @@ class Entry:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class XmlEntry(Entry):
     node_tag: str
     attribute: Optional[str]
@@ -29,18 +175,15 @@ class XmlEntry(Entry):
 
     @staticmethod
     def from_json(file: Path, entry_json: Dict[str, str]) -> "XmlEntry":
-        if "." in entry_json["key"]:
-            entry_json["key"] = entry_json["key"][: entry_json["key"].rfind("_")]
+        node_tag, attribute, node_idx = parse_xml_key(entry_json["key"])
         return XmlEntry(
             file=file.as_posix(),
             original=entry_json["original"],
             translation=entry_json["translation"],
-            node_tag=entry_json["key"].split("_")[0],
-            attribute=entry_json["key"].split("_")[1].replace("-", "_")
-            if entry_json["key"].split("_")[1] != "text"
-            else None,
+            node_tag=node_tag,
+            attribute=attribute,
             stage=entry_json["stage"] if entry_json.get("stage") is not None else 0,
-            node_idx=int(entry_json["key"].split("_")[-1]),
+            node_idx=node_idx,
         )
 
     def to_json(self) -> Dict:
@@ -54,20 +197,24 @@ class XmlEntry(Entry):
     def to_id(self) -> str:
         return f"{self.node_tag}_{self.attribute if self.attribute is not None else 'text'}"
 
+    def to_key(self) -> str:
+        """
+        字典中的key，即to_id加上同名节点中的编号
+        """
+        return f"{self.to_id()}_{self.node_idx}"
 
-@dataclass
+
+@dataclass(slots=True)
 class CodeEntry(Entry):
     line: int
 
     @staticmethod
     def from_json(file: Path, entry_json: Dict[str, str]) -> "CodeEntry":
-        if "." in entry_json["key"]:
-            entry_json["key"] = entry_json["key"][: entry_json["key"].rfind("_")]
         return CodeEntry(
             file=file.as_posix(),
             original=entry_json["original"],
             translation=entry_json["translation"],
-            line=int(entry_json["key"]),
+            line=parse_code_key(entry_json["key"]),
             stage=entry_json["stage"] if entry_json.get("stage") is not None else 0,
         )
 
@@ -83,6 +230,26 @@ class CodeEntry(Entry):
         return f"{self.line:0>5}"
 
 
+@dataclass
+class ApplyResult:
+    file: str
+    applied: int = 0  # 已替换的条目
+    skipped: int = 0  # 无需替换的条目
+    mismatched: int = 0  # 原文本无匹配的条目
+    written: bool = False  # 文件内容是否变化并写回
+    relocated: List[Tuple[int, int]] = field(default_factory=list)  # (记录的行号, 实际行号)
+    missed: List[str] = field(default_factory=list)  # 无匹配条目在字典中的key
+
+
+@dataclass
+class MergeResult:
+    path: str
+    old_data: CompactDictionary  # 旧字典，条目保持读取时的内容
+    new_data: Optional[SingleDictionary]  # 合并后的新字典，新提取中不存在该文件时为None
+    missing: List[str] = field(default_factory=list)  # 新提取中遗失的旧条目
+    emptied: bool = False  # 文件已不存在且不再有任何过时词条
+
+
 @dataclass
 class FilePair:
     original_file: Path
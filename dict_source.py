@@ -0,0 +1,180 @@
+import json
+import shutil
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from const import OUTDATE_DIR_NAME
+from data import JsonEntry
+from source_index import SourceIndex
+
+
+class DictionarySource(ABC):
+    """
+    旧字典的读取来源，路径均为相对字典根目录的posix路径
+
+    字典文件与过时词条分为两部分，过时词条的路径不含过时词条目录名
+    """
+
+    @abstractmethod
+    def paths(self) -> List[str]:
+        """
+        所有字典文件，按路径排序，不含过时词条
+        """
+
+    @abstractmethod
+    def load(self, path: str) -> List[JsonEntry]:
+        """
+        读取字典文件
+        """
+
+    @abstractmethod
+    def outdated_paths(self) -> List[str]:
+        """
+        所有过时词条文件
+        """
+
+    @abstractmethod
+    def load_outdated(self, path: str) -> Optional[List[JsonEntry]]:
+        """
+        读取过时词条，不存在时返回None
+        """
+
+    @abstractmethod
+    def read_outdated(self, path: str) -> Optional[bytes]:
+        """
+        过时词条文件的原始内容，不存在时返回None
+        """
+
+    @abstractmethod
+    def export_outdated(self, target_dir: Path) -> None:
+        """
+        将过时词条迁移到输出目录；合并阶段不会处理的过时词条文件也需要保留在输出目录中
+        """
+
+
+class DirectoryDictionarySource(DictionarySource):
+    """
+    解压到磁盘上的字典目录
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.outdated_root = self.root / OUTDATE_DIR_NAME
+
+        prefix = OUTDATE_DIR_NAME + "/"
+        self.dict_paths: List[str] = []
+        self.outdated: List[str] = []
+        for file in SourceIndex(self.root).query(".json"):
+            if file.relative.startswith(prefix):
+                self.outdated.append(file.relative[len(prefix) :])
+            else:
+                self.dict_paths.append(file.relative)
+
+    def paths(self) -> List[str]:
+        return list(self.dict_paths)
+
+    def load(self, path: str) -> List[JsonEntry]:
+        with open(self.root / path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def outdated_paths(self) -> List[str]:
+        return list(self.outdated)
+
+    def load_outdated(self, path: str) -> Optional[List[JsonEntry]]:
+        file = self.outdated_root / path
+        if not file.exists():
+            return None
+        with open(file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def read_outdated(self, path: str) -> Optional[bytes]:
+        file = self.outdated_root / path
+        if not file.exists():
+            return None
+        return file.read_bytes()
+
+    def export_outdated(self, target_dir: Path) -> None:
+        # 整个目录移动到输出目录，之后从新位置读取
+        if self.outdated_root.exists():
+            shutil.move(self.outdated_root, target_dir)
+            self.outdated_root = Path(target_dir)
+
+
+class ZipDictionarySource(DictionarySource):
+    """
+    直接读取Paratranz导出的字典压缩包，不解压到磁盘
+
+    只使用raw目录，路径与解压后的字典目录一致：去掉raw/前缀，*.json.json改为*.json
+    """
+
+    RAW_DIR = "raw/"
+
+    def __init__(self, zip_path: Path):
+        self.zip_path = Path(zip_path)
+        self.zip_file = zipfile.ZipFile(self.zip_path, "r")
+
+        prefix = OUTDATE_DIR_NAME + "/"
+        # 规范化后的路径 -> 压缩包内的文件名
+        self.members: Dict[str, str] = {}
+        self.outdated: Dict[str, str] = {}
+        for info in self.zip_file.infolist():
+            if info.is_dir() or not info.filename.startswith(self.RAW_DIR):
+                continue
+            path = info.filename[len(self.RAW_DIR) :]
+            if path.endswith(".json.json"):
+                path = path[: -len(".json")]
+            if not path.endswith(".json"):
+                continue
+            if path.startswith(prefix):
+                self.outdated[path[len(prefix) :]] = info.filename
+            else:
+                self.members[path] = info.filename
+
+        self.members = dict(sorted(self.members.items()))
+        self.outdated = dict(sorted(self.outdated.items()))
+
+    def paths(self) -> List[str]:
+        return list(self.members)
+
+    def load(self, path: str) -> List[JsonEntry]:
+        with self.zip_file.open(self.members[path]) as f:
+            return json.load(f)
+
+    def outdated_paths(self) -> List[str]:
+        return list(self.outdated)
+
+    def load_outdated(self, path: str) -> Optional[List[JsonEntry]]:
+        member = self.outdated.get(path)
+        if member is None:
+            return None
+        with self.zip_file.open(member) as f:
+            return json.load(f)
+
+    def read_outdated(self, path: str) -> Optional[bytes]:
+        member = self.outdated.get(path)
+        if member is None:
+            return None
+        return self.zip_file.read(member)
+
+    def export_outdated(self, target_dir: Path) -> None:
+        # 与解压后移动目录的结果一致，按原内容写出全部过时词条
+        for path, member in self.outdated.items():
+            file = Path(target_dir) / path
+            file.parent.mkdir(parents=True, exist_ok=True)
+            with self.zip_file.open(member) as src, open(file, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+    def __getstate__(self) -> Dict:
+        # 传给子进程时不复制打开的压缩包，在子进程中重新打开
+        state = self.__dict__.copy()
+        del state["zip_file"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.zip_file = zipfile.ZipFile(self.zip_path, "r")
+
+    def close(self) -> None:
+        self.zip_file.close()
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import requests
+
+from logger import logger
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# 连接中断时未读满的一块会丢失，网络读取用较小的块
+DOWNLOAD_READ_SIZE = 64 * 1024
+DOWNLOAD_PROGRESS_INTERVAL = 5.0  # 进度日志的最小间隔（秒）
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_TIMEOUT = 60
+
+
+def sha256_file(file: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Downloader:
+    """
+    共用同一个HTTP会话的下载器
+
+    - 文件旁的.meta.json记录ETag/Last-Modified与sha256，文件未被改动时发送条件请求，未变化则跳过下载
+    - 先下载到.part文件，中断后（包括下次运行）用Range请求续传
+    - 校验长度与sha256后再原子替换目标文件；服务器未给出长度时由validate检查文件是否完整
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        retries: int = DOWNLOAD_RETRIES,
+        timeout: float = DOWNLOAD_TIMEOUT,
+    ):
+        self.session = session if session is not None else requests.Session()
+        self.retries = retries
+        self.timeout = timeout
+
+    @staticmethod
+    def meta_file(file: Path) -> Path:
+        return file.with_name(file.name + ".meta.json")
+
+    @staticmethod
+    def part_file(file: Path) -> Path:
+        return file.with_name(file.name + ".part")
+
+    @staticmethod
+    def read_meta(meta_file: Path) -> Dict:
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def write_meta(meta_file: Path, meta: Dict) -> None:
+        with open(meta_file, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    def fetch(
+        self,
+        url: str,
+        file: Path,
+        headers: Optional[Dict[str, str]] = None,
+        sha256: Optional[str] = None,
+        validate: Optional[Callable[[Path], bool]] = None,
+    ) -> bool:
+        """
+        下载url到file，返回文件是否更新；sha256为预期的校验值，不提供时只校验长度
+
+        validate在无法得知文件长度且没有sha256时检查下载的文件，如zipfile.is_zipfile，不通过则重新下载
+        """
+        file = Path(file)
+        file.parent.mkdir(parents=True, exist_ok=True)
+
+        # 仅当本地文件与记录一致时才发送条件请求
+        conditional: Dict[str, str] = {}
+        meta = self.read_meta(self.meta_file(file))
+        if (
+            file.exists()
+            and meta.get("url") == url
+            and meta.get("sha256") == sha256_file(file)
+            and (sha256 is None or meta.get("sha256") == sha256)
+        ):
+            if meta.get("etag"):
+                conditional["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                conditional["If-Modified-Since"] = meta["last_modified"]
+
+        for attempt in range(self.retries + 1):
+            try:
+                return self.download(
+                    url, file, dict(headers or {}), conditional, sha256, validate
+                )
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                if attempt >= self.retries:
+                    raise
+                wait = min(2**attempt, 30)
+                logger.warning(
+                    "下载中断，%s秒后续传（第%s次重试）：%s", wait, attempt + 1, e
+                )
+                time.sleep(wait)
+
+    def download(
+        self,
+        url: str,
+        file: Path,
+        headers: Dict[str, str],
+        conditional: Dict[str, str],
+        sha256: Optional[str],
+        validate: Optional[Callable[[Path], bool]] = None,
+    ) -> bool:
+        part = self.part_file(file)
+        part_meta_file = self.meta_file(part)
+        part_meta = self.read_meta(part_meta_file)
+
+        # 只有能确认服务器上的文件未变化时才续传
+        validator = part_meta.get("etag") or part_meta.get("last_modified")
+        offset = 0
+        if part.exists() and part_meta.get("url") == url and validator:
+            offset = part.stat().st_size
+
+        request_headers = {**headers, **conditional, "Accept-Encoding": "identity"}
+        if offset > 0:
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = validator
+
+        with self.session.get(
+            url, headers=request_headers, stream=True, timeout=self.timeout
+        ) as r:
+            if r.status_code == 304:
+                logger.info("文件未变化，跳过下载：%s", file.as_posix())
+                return False
+            if r.status_code == 416:  # 续传位置无效，重新下载
+                logger.warning("无法续传，重新下载：%s", file.as_posix())
+                part.unlink(missing_ok=True)
+                part_meta_file.unlink(missing_ok=True)
+                return self.download(url, file, headers, conditional, sha256, validate)
+            r.raise_for_status()
+
+            if r.status_code == 206 and r.headers.get("Content-Range", "").startswith(
+                f"bytes {offset}-"
+            ):
+                logger.info("从%.1fMB处续传：%s", offset / 1024 / 1024, file.as_posix())
+                mode = "ab"
+            else:
+                offset = 0
+                mode = "wb"
+
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            self.write_meta(
+                part_meta_file,
+                {"url": url, "etag": etag, "last_modified": last_modified},
+            )
+
+            total = None
+            # 续传时以Content-Range中的完整长度为准
+            full_length = r.headers.get("Content-Range", "").rpartition("/")[2]
+            if mode == "ab" and full_length.isdigit():
+                total = int(full_length)
+            elif r.headers.get("Content-Length") is not None:
+                total = offset + int(r.headers["Content-Length"])
+
+            digest = hashlib.sha256()
+            if offset > 0:
+                with open(part, "rb") as f:
+                    for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                        digest.update(block)
+
+            size = offset
+            start = last_report = time.monotonic()
+            with open(part, mode) as f:
+                for chunk in r.iter_content(DOWNLOAD_READ_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+
+                    now = time.monotonic()
+                    if now - last_report >= DOWNLOAD_PROGRESS_INTERVAL:
+                        last_report = now
+                        if total:
+                            logger.info(
+                                "已下载%.1fMB/%.1fMB (%.0f%%)：%s",
+                                size / 1024 / 1024,
+                                total / 1024 / 1024,
+                                size / total * 100,
+                                file.name,
+                            )
+                        else:
+                            logger.info(
+                                "已下载%.1fMB：%s", size / 1024 / 1024, file.name
+                            )
+
+        if total is not None and size != total:
+            # 保留已下载的部分，重试时续传
+            raise requests.ConnectionError(
+                f"下载不完整：{size}/{total}字节，{file.as_posix()}"
+            )
+
+        file_sha256 = digest.hexdigest()
+        if sha256 is not None and file_sha256 != sha256:
+            part.unlink(missing_ok=True)
+            part_meta_file.unlink(missing_ok=True)
+            raise ValueError(f"sha256校验失败：{file.as_posix()}")
+
+        if total is None and sha256 is None:
+            if validate is None:
+                logger.warning("服务器未返回文件长度，无法确认下载完整：%s", file.as_posix())
+            elif not validate(part):
+                # 无法确定缺失的位置，重试时重新下载
+                part.unlink(missing_ok=True)
+                part_meta_file.unlink(missing_ok=True)
+                raise requests.ConnectionError(f"下载的文件不完整：{file.as_posix()}")
+
+        os.replace(part, file)
+        self.write_meta(
+            self.meta_file(file),
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "sha256": file_sha256,
+                "size": size,
+            },
+        )
+        part_meta_file.unlink(missing_ok=True)
+
+        logger.info(
+            "下载完成：%s，%.1fMB，用时%.1fs",
+            file.as_posix(),
+            size / 1024 / 1024,
+            time.monotonic() - start,
+        )
+        return True
@@ -0,0 +1,128 @@
+"""
+原文的模糊匹配：字符n-gram的MinHash签名与LSH分桶
+
+- 签名使用分箱MinHash（one permutation hashing），每个n-gram只计算一次crc32，按值域分箱、箱内取最小值；
+  空箱借用右侧最近的非空箱
+- 签名分为若干band，每个band的哈希与条目编号合并为一个整数，排序后以二分查找取出同桶的候选，
+  只对候选估算相似度，不做两两比较；命中的band数不足以达到阈值的候选直接跳过
+- 相似度为两个签名中相同箱的比例，即n-gram集合Jaccard相似度的估计
+"""
+import math
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import repeat
+from operator import eq
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+FUZZY_NGRAM = 5
+# 36个箱中至多10个不同时相似度才达到阈值，而band有12个，所以至少有两个band完全相同：
+# 相似度估计不低于阈值的条目一定会成为候选
+FUZZY_BANDS = 12
+FUZZY_ROWS = 3
+FUZZY_BINS = FUZZY_BANDS * FUZZY_ROWS
+FUZZY_THRESHOLD = 0.7
+FUZZY_MIN_LENGTH = 16  # 过短的原文相似度没有意义
+
+# 将crc32的值域等分为若干箱，排序后同一箱的哈希相邻
+BIN_BOUNDS = [(idx << 32) // FUZZY_BINS for idx in range(FUZZY_BINS)]
+
+# 桶键的低位保存条目编号
+ID_BITS = 22
+ID_MASK = (1 << ID_BITS) - 1
+HASH_MASK = (1 << (64 - ID_BITS)) - 1
+
+T = TypeVar("T")
+
+
+def signature(text: str) -> Optional[Tuple[int, ...]]:
+    """
+    规范化空白后的MinHash签名，原文过短时返回None
+    """
+    data = " ".join(text.split()).encode("utf-8")
+    if len(data) < FUZZY_MIN_LENGTH:
+        return None
+
+    n = FUZZY_NGRAM
+    hashes = sorted(map(zlib.crc32, [data[i : i + n] for i in range(len(data) - n + 1)]))
+    # 第一个不小于箱下界的哈希即该箱的最小值；空箱自然取到右侧最近非空箱的值，越界时回到第一个箱
+    positions = list(map(bisect_left, repeat(hashes, FUZZY_BINS), BIN_BOUNDS))
+    hashes.append(hashes[0])
+    return tuple(map(hashes.__getitem__, positions))
+
+
+def band_hashes(sig: Tuple[int, ...]) -> List[int]:
+    return [
+        hash((band, *sig[band * FUZZY_ROWS : (band + 1) * FUZZY_ROWS])) & HASH_MASK
+        for band in range(FUZZY_BANDS)
+    ]
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    return sum(map(eq, a, b)) / FUZZY_BINS
+
+
+class FuzzyIndex(Generic[T]):
+    """
+    按原文模糊查找的索引，条目全部加入后再查询
+    """
+
+    def __init__(self):
+        # 全部签名连续保存，每个条目占FUZZY_BINS个值
+        self.signatures = array("I")
+        self.payloads: List[T] = []
+        self.keys = array("Q")
+        self.sorted = True
+
+    def add(self, text: str, payload: T) -> bool:
+        sig = signature(text)
+        if sig is None:
+            return False
+        idx = len(self.payloads)
+        if idx > ID_MASK:
+            raise ValueError(f"模糊匹配索引最多容纳{ID_MASK + 1}个条目")
+        self.signatures.extend(sig)
+        self.payloads.append(payload)
+        self.keys.extend((h << ID_BITS) | idx for h in band_hashes(sig))
+        self.sorted = False
+        return True
+
+    def sort_keys(self) -> None:
+        if not self.sorted:
+            self.keys = array("Q", sorted(self.keys))
+            self.sorted = True
+
+    def query(
+        self, text: str, limit: int = 3, threshold: float = FUZZY_THRESHOLD
+    ) -> List[Tuple[float, T]]:
+        """
+        相似度不低于阈值的候选，按相似度从高到低、加入顺序从先到后排列
+        """
+        sig = signature(text)
+        if sig is None:
+            return []
+        self.sort_keys()
+
+        keys = self.keys
+        band_hits: Counter = Counter()
+        for h in band_hashes(sig):
+            lo = bisect_left(keys, h << ID_BITS)
+            hi = bisect_left(keys, (h + 1) << ID_BITS, lo)
+            band_hits.update(key & ID_MASK for key in keys[lo:hi])
+        # 不同的箱至多分布在这么多个band中，其余band必须完全相同
+        min_hits = FUZZY_BANDS - (FUZZY_BINS - math.ceil(threshold * FUZZY_BINS))
+        candidates = [idx for idx, hits in band_hits.items() if hits >= min_hits]
+
+        signatures = self.signatures
+        scores = (
+            (similarity(sig, signatures[idx * FUZZY_BINS : (idx + 1) * FUZZY_BINS]), idx)
+            for idx in candidates
+        )
+        matches = sorted((-score, idx) for score, idx in scores if score >= threshold)[
+            :limit
+        ]
+        return [(-score, self.payloads[idx]) for score, idx in matches]
+
+    def __len__(self) -> int:
+        return len(self.payloads)
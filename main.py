@@ -2,17 +2,46 @@ import time
 import shutil
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
 
+import requests
+
 from extractor import Extractor
 from applier import Applier
+from data import compact_dictionaries
 from processor import Processor
 from repo_dump import Repo
+from download import Downloader
 from update import Updater
-from const import NEW_DICT_DIR, OLD_DICT_DIR, REPO_BRANCH
+from source_index import SourceIndex
+from dict_source import DictionarySource, ZipDictionarySource
+from snapshot import (
+    DictionarySnapshot,
+    SnapshotDictionarySource,
+    file_sha1,
+    write_snapshot,
+)
+from const import (
+    NEW_DICT_DIR,
+    OLD_DICT_DIR,
+    REPO_BRANCH,
+    EXTRACT_CACHE_FILE,
+    DICT_SNAPSHOT_FILE,
+    XML_TREE_CACHE_LIMIT,
+    OUTDATE_DIR_NAME,
+)
 from logger import logger
-from util import dict_update_splited_htmlContent
+from util import (
+    dict_update_splited_htmlContent,
+    XmlTreeCache,
+    resolve_jobs,
+    dumps_dictionary,
+    write_if_changed,
+    peak_rss,
+    timed_stage,
+)
 
 
 argparser = argparse.ArgumentParser()
@@ -37,12 +66,62 @@ argparser.add_argument(
 argparser.add_argument(
     "--special-process", action="store_true", help="whether to do special process"
 )
+argparser.add_argument(
+    "--no-fuzzy-suggestion",
+    action="store_true",
+    default=False,
+    help="whether to skip suggesting translations of similar entries in special process",
+)
+argparser.add_argument(
+    "--no-diff-files",
+    action="store_true",
+    default=False,
+    help="whether to only write the changeset instead of full copies of changed dictionary files",
+)
 argparser.add_argument(
     "--ignore-untranslated",
     action="store_true",
     help="whether to ignore untranslated entries",
 )
 
+argparser.add_argument(
+    "--no-extract-cache",
+    action="store_true",
+    default=False,
+    help="whether to re-extract every file instead of reusing unchanged results",
+)
+argparser.add_argument(
+    "--dict-snapshot",
+    action="store_true",
+    default=False,
+    help="whether to load the old dictionary from a binary snapshot cached for each dictionary zip",
+)
+argparser.add_argument(
+    "--jobs",
+    type=int,
+    default=1,
+    help="number of worker processes used by extraction, 0 to use all cores",
+)
+
+argparser.add_argument(
+    "--no-translation-memory",
+    action="store_true",
+    default=False,
+    help="whether to only reuse translations of the same file when merging",
+)
+argparser.add_argument(
+    "--merge-jobs",
+    type=int,
+    default=1,
+    help="number of worker processes used to merge dictionaries, 0 to use all cores",
+)
+argparser.add_argument(
+    "--apply-jobs",
+    type=int,
+    default=0,
+    help="number of worker processes used to apply dictionaries, 0 to use all cores",
+)
+
 argparser.add_argument(
     "--target",
     type=str,
@@ -71,7 +150,8 @@ def main():
     old_dict_dir = Path(OLD_DICT_DIR[target])
 
     logger.info("==== 正在移除临时文件 ====")
-    shutil.rmtree(new_dict_dir, ignore_errors=True)
+    # 新字典保留在磁盘上，输出时只写入发生变化的文件
+    shutil.rmtree(new_dict_dir / OUTDATE_DIR_NAME, ignore_errors=True)
     shutil.rmtree(old_dict_dir, ignore_errors=True)
 
     new_dict_dir.mkdir(parents=True, exist_ok=True)
@@ -80,56 +160,191 @@ def main():
     repo = Repo(target, REPO_BRANCH[target], pt_token)
     root = repo.source_dir
 
-    if not args.no_update_repo:
-        logger.info("==== 正在下载最新版本游戏源码 ====")
-        repo.fetch_latest_version()
-        logger.info("==== 正在解压最新版本游戏源码 ====")
-        repo.unzip_latest_version()
+    # 字典下载与源码的下载、解压、提取互不依赖，在后台进行
+    with ThreadPoolExecutor(1) as fetch_executor:
+        dict_future = None
+        if not args.no_download_dict:
+            dict_future = fetch_executor.submit(fetch_dict, repo)
+
+        if not args.no_update_repo:
+            with timed_stage("下载最新版本游戏源码"):
+                repo.fetch_latest_version()
+            with timed_stage("解压最新版本游戏源码"):
+                repo.unzip_latest_version()
+
+        # 源码目录只遍历一次，各阶段共用
+        source_index = SourceIndex(root)
+
+        # 提取阶段解析过的xml文档树留给应用阶段复用，文档树无法传给子进程，仅在单进程应用时有效
+        apply_jobs = resolve_jobs(args.apply_jobs)
+        tree_cache = None
+        if apply_jobs <= 1:
+            tree_cache = XmlTreeCache(XML_TREE_CACHE_LIMIT)
+        else:
+            logger.info("多进程应用字典（%s个进程），不缓存xml文档树", apply_jobs)
 
-    extractor = Extractor(target, root, new_dict_dir, repo.latest_commit)
+        extractor = Extractor(
+            target,
+            root,
+            new_dict_dir,
+            repo.latest_commit,
+            jobs=args.jobs,
+            cache_file=None if args.no_extract_cache else EXTRACT_CACHE_FILE[target],
+            tree_cache=tree_cache,
+            source_index=source_index,
+        )
+
+        with timed_stage("提取翻译条目"):
+            extractor.extract()
 
-    logger.info("==== 正在提取翻译条目 ====")
-    extractor.extract()
+        new_data = extractor.new_data
 
-    new_data = extractor.new_data
+        if dict_future is not None:
+            start = time.perf_counter()
+            dict_future.result()
+            logger.info("等待字典下载%.2fs", time.perf_counter() - start)
 
-    if not args.no_download_dict:
-        logger.info("==== 正在下载最新字典文件 ====")
-        repo.fetch_latest_dict()
-    if not old_dict_dir.exists():
-        logger.info("==== 正在解压最新字典文件 ====")
-        repo.unzip_latest_dict(old_dict_dir)
+    if args.dict_snapshot:
+        dict_source = load_dict_snapshot(repo, Path(DICT_SNAPSHOT_FILE[target]))
+    elif not old_dict_dir.exists():
+        # 直接从压缩包读取，不再解压到磁盘
+        dict_source = ZipDictionarySource(repo.latest_dict_zip())
+    else:
+        dict_source = None
 
-    updater = Updater(old_dict_dir, new_dict_dir, new_data)
+    updater = Updater(
+        old_dict_dir,
+        new_dict_dir,
+        new_data,
+        source=dict_source,
+        jobs=args.merge_jobs,
+        translation_memory=not args.no_translation_memory,
+    )
 
-    logger.info("==== 正在合并字典 ====")
-    updater.update_dict(new_data, args.ignore_untranslated)
+    with timed_stage("合并字典"):
+        updater.update_dict(new_data, args.ignore_untranslated)
 
     old_data = updater.old_data
     new_data = updater.new_data
 
     if args.special_process:
         processor = Processor(
-            target, new_dict_dir, old_dict_dir, pt_token, updater, new_data, old_data
+            target,
+            new_dict_dir,
+            old_dict_dir,
+            pt_token,
+            updater,
+            new_data,
+            old_data,
+            fuzzy_suggestion=not args.no_fuzzy_suggestion,
+            diff_files=not args.no_diff_files,
+        )
+        with timed_stage("应用特殊处理"):
+            processor.process()
+
+    # 此后字典只被读取，按列保存以降低应用与写入阶段的内存占用
+    compact_dictionaries(new_data)
+
+    applier = Applier(
+        target,
+        root,
+        new_dict_dir,
+        new_data,
+        tree_cache=tree_cache,
+        source_index=source_index,
+        jobs=apply_jobs,
+    )
+
+    # 应用只读取内存中的字典，与写入字典文件同时进行
+    with ThreadPoolExecutor(1) as executor:
+        dump_future = executor.submit(dump, new_data, new_dict_dir)
+
+        with timed_stage("应用字典"):
+            applier.apply()
+
+        dump_future.result()
+
+    if tree_cache is not None:
+        tree_cache.report()
+
+    rss = peak_rss()
+    if rss is not None:
+        logger.info(
+            "内存峰值：主进程%.1fMB，子进程%.1fMB",
+            rss[0] / 1024 / 1024,
+            rss[1] / 1024 / 1024,
         )
-        logger.info("==== 正在应用特殊处理 ====")
-        processor.process()
 
-    dump(new_data, new_dict_dir)
 
-    applier = Applier(target, root, new_dict_dir, new_data)
+def fetch_dict(repo: Repo) -> None:
+    # 在后台线程中运行，不与主线程共用requests.Session
+    with requests.Session() as session, timed_stage("下载最新字典文件"):
+        repo.fetch_latest_dict(Downloader(session))
+
+
+def load_dict_snapshot(repo: Repo, snapshot_file: Path) -> DictionarySource:
+    """
+    快照与字典压缩包对应时直接使用，否则从压缩包重新生成快照
+    """
+    zip_path = repo.latest_dict_zip()
+    zip_digest = file_sha1(zip_path)
 
-    logger.info("==== 正在应用字典 ====")
-    applier.apply()
+    if snapshot_file.exists():
+        try:
+            snapshot = DictionarySnapshot(snapshot_file)
+        except ValueError as e:
+            logger.warning("%s，重新生成", e)
+        else:
+            if snapshot.source_digest == zip_digest:
+                logger.info("==== 使用字典快照 %s ====", snapshot_file.as_posix())
+                return SnapshotDictionarySource(snapshot)
+            snapshot.close()
+
+    logger.info("==== 正在生成字典快照 ====")
+    zip_source = ZipDictionarySource(zip_path)
+    write_snapshot(snapshot_file, zip_digest, zip_source)
+    zip_source.close()
+    return SnapshotDictionarySource(DictionarySnapshot(snapshot_file))
 
 
 def dump(new_data, new_dict_dir):
-    import json
+    # 上次运行留下的字典文件，过时词条由合并阶段重新生成
+    previous_files = [
+        file
+        for file in SourceIndex(new_dict_dir).query(".json")
+        if not file.relative.startswith(OUTDATE_DIR_NAME + "/")
+    ]
+
+    for parent in {(new_dict_dir / path).parent for path in new_data.keys()}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def dump_file(item) -> bool:
+        path, new_dict = item
+        return write_if_changed(
+            new_dict_dir / path, dumps_dictionary(list(new_dict.values()))
+        )
 
-    for path, new_dict in new_data.items():
-        (new_dict_dir / path).parent.mkdir(parents=True, exist_ok=True)
-        with open(new_dict_dir / path, "w", encoding="utf-8") as f:
-            json.dump(list(new_dict.values()), f, ensure_ascii=False, indent=2)
+    # 只写入内容发生变化的文件
+    with ThreadPoolExecutor() as executor:
+        written = sum(executor.map(dump_file, new_data.items()))
+
+    removed = 0
+    for file in previous_files:
+        if file.relative not in new_data:
+            os.remove(file.path)
+            removed += 1
+            # 一并移除变空的目录
+            parent = file.path.parent
+            while parent != new_dict_dir and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+
+    logger.info(
+        "字典文件：写入%s个，未变化%s个，移除%s个",
+        written,
+        len(new_data) - written,
+        removed,
+    )
 
 
 if __name__ == "__main__":
@@ -1,15 +1,52 @@
+import hashlib
 import json
 import os
 import shutil
+import time
 
 from pathlib import Path
-from typing import Dict, Union, List, Tuple, Set
+from typing import Dict, Iterable, Mapping, Union, List, Tuple, Set
 
 from logger import logger
 from data import JsonEntry, WholeDictionary, SingleDictionary
-from const import ENTRY_DIFF_DIR, TRANS_DIFF_DIR
+from const import ENTRY_DIFF_DIR, TRANS_DIFF_DIR, SUGGESTION_DIR, CHANGESET_FILE
+from fuzzy_match import FuzzyIndex
+from translation_memory import memory_key
 from update import Updater
 
+SUGGESTION_STAGE = 2  # 有疑问，需要人工确认
+
+# 变动类别 -> 日志中的名称
+CHANGE_CATEGORIES: Dict[str, str] = {
+    "added": "新增",
+    "removed": "移除",
+    "original": "原文变动",
+    "translation": "译文变动",
+    "stage": "阶段变动",
+}
+
+
+def entry_fingerprint(entry: JsonEntry, old: bool) -> bytes:
+    """
+    由条目的key、规范化后的原文、译文与阶段计算的指纹，与运行环境无关
+
+    原文的规范化与memory_key一致，新旧字典的条目指纹可以直接比较
+    """
+    _, original = memory_key(entry, old)
+    content = f"{entry['key']}\0{original}\0{entry['translation']}\0{entry['stage']}"
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+
+
+def entry_fingerprints(entries: Mapping[str, JsonEntry], old: bool) -> Dict[str, bytes]:
+    return {key: entry_fingerprint(entry, old) for key, entry in entries.items()}
+
+
+def file_fingerprint(fingerprints: Iterable[bytes]) -> bytes:
+    """
+    由各条目指纹计算的文件指纹，与条目顺序无关
+    """
+    return hashlib.blake2b(b"".join(sorted(fingerprints)), digest_size=8).digest()
+
 
 class Processor:
     def __init__(
@@ -20,7 +57,9 @@ class Processor:
         pt_token: str,
         updater: Updater,
         new_data: WholeDictionary = {},
-        old_data: WholeDictionary = {},
+        old_data: Dict[str, Mapping[str, JsonEntry]] = {},
+        fuzzy_suggestion: bool = True,
+        diff_files: bool = True,
     ):
         self.target = target
         self.dict_path = dict_path
@@ -33,10 +72,12 @@ class Processor:
         self.untranslated: Dict[str, JsonEntry] = {}
 
         self.new_data: WholeDictionary = new_data
-        self.old_data: WholeDictionary = old_data
+        self.old_data: Dict[str, Mapping[str, JsonEntry]] = old_data
         
         self.updater = updater
-        print(updater.file_with_missing_entry)
+        self.fuzzy_suggestion = fuzzy_suggestion
+        self.diff_files = diff_files
+        print(sorted(updater.file_with_missing_entry))
 
     def load(self):
         for path, fileDict in self.new_data.items():
@@ -54,52 +95,138 @@ class Processor:
     def process(self):
         self.load()
         self.check_same()
+        if self.fuzzy_suggestion:
+            self.suggest_similar()
         self.filter_changed()
 
     def filter_changed(self):
+        """
+        逐文件比较新旧字典，一次遍历中将变动按CHANGE_CATEGORIES分类，写出变动集
+
+        新旧条目直接比较，内容完全一致的文件跳过；变动集中记录有变动的文件的指纹及其中变动条目的指纹，
+        完整的变动文件副本（entry_diff/translation_diff）可选
+        """
         shutil.rmtree(ENTRY_DIFF_DIR[self.target], ignore_errors=True)
         shutil.rmtree(TRANS_DIFF_DIR[self.target], ignore_errors=True)
+        start = time.perf_counter()
 
         entry_diff: Set[str] = set()
         trans_diff: Dict[str, List[JsonEntry]] = {}
+        changeset: Dict[str, Dict[str, Union[str, List[str], Dict[str, str]]]] = {}
 
         for file, entries in self.new_data.items():
-            if self.old_data.get(file, None) is None:
+            old_entries = self.old_data.get(file, None)
+            if old_entries is None:
                 entry_diff.add(file)
+                fingerprints = entry_fingerprints(entries, old=False)
+                changeset[file] = {
+                    "fingerprint": file_fingerprint(fingerprints.values()).hex(),
+                    "added": list(entries.keys()),
+                    "entries": {key: fp.hex() for key, fp in fingerprints.items()},
+                }
                 continue
-            if file in self.updater.file_with_missing_entry:
-                entry_diff.add(file)
-            if len(entries) != len(self.old_data[file]) or set(entries.keys()) != set(self.old_data[file].keys()):
+            missing = file in self.updater.file_with_missing_entry
+            if missing:
                 entry_diff.add(file)
+            # 内容完全一致的文件直接跳过
+            elif entries == old_entries:
+                continue
 
+            changes: Dict[str, List[str]] = {
+                category: [] for category in CHANGE_CATEGORIES
+            }
             file_trans_diff: List[JsonEntry] = []
 
             for key, entry in entries.items():
-                old_entry = self.old_data[file].get(key, None)
+                old_entry = old_entries.get(key, None)
                 if old_entry is None:
+                    changes["added"].append(key)
                     if entry["translation"] != "":
                         # print(key, self.old_data[file][key])
                         file_trans_diff.append(entry)
                         entry["stage"] = 1
                     continue
+
                 if old_entry["stage"] != 0 and entry["stage"] == 0:
                     entry_diff.add(file)
                     file_trans_diff.append(entry)
-                    continue
-                if old_entry["stage"] == 0 and entry["stage"] != 0:
+                elif old_entry["stage"] == 0 and entry["stage"] != 0:
                     file_trans_diff.append(entry)
                 elif entry["translation"] != old_entry["translation"]:
                     file_trans_diff.append(entry)
                     entry["stage"] = 1 if old_entry["stage"] != 0 else 0
 
+                # 旧字典中xml条目的换行经过转义，原文不同时再规范化比较
+                if entry["original"] != old_entry["original"] and memory_key(
+                    entry, old=False
+                ) != memory_key(old_entry, old=True):
+                    changes["original"].append(key)
+                if entry["translation"] != old_entry["translation"]:
+                    changes["translation"].append(key)
+                if entry["stage"] != old_entry["stage"]:
+                    changes["stage"].append(key)
 
+            if len(entries) != len(old_entries) or len(changes["added"]) > 0:
+                changes["removed"] = [key for key in old_entries if key not in entries]
+            if len(changes["added"]) > 0 or len(changes["removed"]) > 0:
+                entry_diff.add(file)
 
             if len(file_trans_diff) > 0:
                 trans_diff[file] = file_trans_diff
 
+            if missing or any(len(keys) > 0 for keys in changes.values()):
+                # 阶段可能在比较中被调整，指纹按写入字典的内容计算
+                fingerprints = entry_fingerprints(entries, old=False)
+                changed = set(changes["added"]).union(
+                    changes["original"], changes["translation"], changes["stage"]
+                )
+                changeset[file] = {
+                    "fingerprint": file_fingerprint(fingerprints.values()).hex(),
+                    **{
+                        category: keys
+                        for category, keys in changes.items()
+                        if len(keys) > 0
+                    },
+                    "entries": {
+                        key: fingerprint.hex()
+                        for key, fingerprint in fingerprints.items()
+                        if key in changed
+                    },
+                }
+
+        # 在新提取中已不存在的文件
+        for file, old_entries in self.old_data.items():
+            if file not in self.new_data:
+                changeset[file] = {"removed": list(old_entries.keys())}
+
         logger.info(f"共有{len(entry_diff)}个文件原词条发生变动！")
         logger.info(f"共有{len(trans_diff)}个文件翻译发生变动！")
 
+        summary = {
+            category: sum(
+                len(changes.get(category, [])) for changes in changeset.values()
+            )
+            for category in CHANGE_CATEGORIES
+        }
+        with open(CHANGESET_FILE[self.target], "w", encoding="utf-8") as f:
+            json.dump(
+                {"summary": {"files": len(changeset), **summary}, "files": changeset},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        logger.info(
+            f"变动集：{len(changeset)}个文件，"
+            + "，".join(
+                f"{CHANGE_CATEGORIES[category]}{count}条"
+                for category, count in summary.items()
+            )
+            + f"，用时{time.perf_counter() - start:.2f}s"
+        )
+
+        if not self.diff_files:
+            return
+
         for path in entry_diff:
             out_path = Path(ENTRY_DIFF_DIR[self.target], path)
             os.makedirs(out_path.parent, exist_ok=True)
@@ -130,3 +257,59 @@ class Processor:
                 fill_count += 1
 
         logger.info(f"共有{fill_count}个词条会被填充！")
+
+    def suggest_similar(self):
+        """
+        为仍未翻译的条目查找原文相似的已翻译条目，作为建议译文单独输出，不写入字典
+        """
+        shutil.rmtree(SUGGESTION_DIR[self.target], ignore_errors=True)
+        start = time.perf_counter()
+
+        index: FuzzyIndex[Tuple[str, JsonEntry]] = FuzzyIndex()
+        indexed: Set[str] = set()
+        for key, value in self.translated.items():
+            # 无需汉化的条目没有参考价值
+            if value["translation"] in ("", value["original"]):
+                continue
+            if value["original"] in indexed:
+                continue
+            indexed.add(value["original"])
+            index.add(value["original"], (key, value))
+
+        suggestions: Dict[str, List[JsonEntry]] = {}
+        queried: Dict[str, List[Tuple[float, Tuple[str, JsonEntry]]]] = {}
+        for path, entries in self.new_data.items():
+            for key, value in entries.items():
+                if value["stage"] != 0:
+                    continue
+                candidates = queried.get(value["original"])
+                if candidates is None:
+                    candidates = queried[value["original"]] = index.query(
+                        value["original"]
+                    )
+                if len(candidates) == 0:
+                    continue
+                _, (_, best) = candidates[0]
+                suggestions.setdefault(path, []).append(
+                    {
+                        "key": value["key"],
+                        "original": value["original"],
+                        "translation": best["translation"],
+                        "stage": SUGGESTION_STAGE,
+                        "context": "\n".join(
+                            f"相似度{score:.0%}：{similar_key}"
+                            for score, (similar_key, _) in candidates
+                        ),
+                    }
+                )
+
+        logger.info(
+            f"共有{sum(map(len, suggestions.values()))}个未翻译词条找到相似译文"
+            f"（索引{len(index)}条原文，用时{time.perf_counter() - start:.2f}s）"
+        )
+
+        for path, entries in suggestions.items():
+            out_path = Path(SUGGESTION_DIR[self.target], path)
+            os.makedirs(out_path.parent, exist_ok=True)
+            with open(out_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, ensure_ascii=False)
@@ -1,11 +1,12 @@
 from pathlib import Path
-from urllib import request
+from typing import Optional
 import requests
 import os
 import zipfile
 import shutil
 
 from const import *
+from download import Downloader
 from logger import logger
 
 
@@ -16,6 +17,9 @@ class Repo:
         self.source_dir: Path = Path(SOURCE_DIR[target])
         self.paratranz_access_token = paratranz_access_token
         self.latest_commit = ""
+        # 提交查询与文件下载共用同一个连接池
+        self.session = requests.Session()
+        self.downloader = Downloader(self.session)
 
     def fetch_latest_version(self) -> None:
         if os.environ.get("USE_GITHUB_ACTION") is not None:
@@ -33,9 +37,9 @@ class Repo:
         if not path.exists():
             path.mkdir()
         try:
-            with requests.get(
+            with self.session.get(
                 api_url,
-                stream=True,
+                timeout=self.downloader.timeout,
                 headers={
                     "Accept": "application/vnd.github+json",
                     "Authorization": GITHUB_PUBLIC_ACCESS_TOKEN,
@@ -50,11 +54,11 @@ class Repo:
 
         file_path = path / f"repo-latest-{self.latest_commit}.zip"
         if not file_path.exists() and self.latest_commit != "unknown":
-            for existing_file in path.glob("repo-latest-*.zip"):
-                os.remove(existing_file)
-            request.urlretrieve(
-                download_url, path / f"repo-latest-{self.latest_commit}.zip"
-            )
+            # 连同旧版本的.meta.json与.part一起删除，当前版本的.part留作续传
+            for existing_file in path.glob("repo-latest-*"):
+                if not existing_file.name.startswith(file_path.name):
+                    os.remove(existing_file)
+            self.downloader.fetch(download_url, file_path, validate=zipfile.is_zipfile)
 
     def unzip_latest_version(self) -> None:
         zip_path = list(Path(DOWNLOAD_DIR).glob("**/repo-latest-*.zip"))[0]
@@ -70,32 +74,30 @@ class Repo:
             zip_ref.extractall(extract_path.parent)
         os.rename("./liliths-throne-public-dev/", extract_path)
 
+    def latest_dict_zip(self) -> Path:
+        return Path(DOWNLOAD_DIR) / f"dict-latest.zip"
+
     def get_paratranz_api_url(self):
         return PARATRANZ_API_BASE_URL + "/projects/" + PARATRANZ_PROJECT_ID[self.target]
 
-    def fetch_latest_dict(self) -> None:
-        def reporthook(block_count, block_size, file_size):
-            print(round(block_count * block_size / file_size *100,2), end="\r")
-
+    def fetch_latest_dict(self, downloader: Optional[Downloader] = None) -> None:
+        """
+        downloader默认为与提交查询共用会话的下载器；在其他线程中下载时须传入独立的下载器
+        """
         download_url = self.get_paratranz_api_url() + "/artifacts/download"
-
-        path = Path(DOWNLOAD_DIR)
-
-        if not path.exists():
-            path.mkdir()
-
-        file_path = path / f"dict-latest.zip"
-        if file_path.exists():
-            os.remove(file_path)
-
-        opener = request.build_opener()
-        opener.addheaders = [("Authorization", self.paratranz_access_token)]
-        request.install_opener(opener)
-
-        request.urlretrieve(download_url, file_path, reporthook=reporthook)
+        if downloader is None:
+            downloader = self.downloader
+
+        # 字典未更新时服务器返回304，保留已下载的文件
+        downloader.fetch(
+            download_url,
+            self.latest_dict_zip(),
+            headers={"Authorization": self.paratranz_access_token},
+            validate=zipfile.is_zipfile,
+        )
 
     def unzip_latest_dict(self, old_dict_dir) -> None:
-        zip_path = Path(DOWNLOAD_DIR) / f"dict-latest.zip"
+        zip_path = self.latest_dict_zip()
         extract_path = Path(ROOT_DIR)
 
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
@@ -0,0 +1,315 @@
+"""
+字典快照：将整个旧字典（含过时词条）保存为单个二进制文件，按需读取
+
+文件结构（小端序）：
+    文件头      magic, 格式版本, 来源文件的sha1, 文件数, 字符串表/文件索引/条目/原始内容的偏移
+    字符串表    字符串数, 每个字符串的(偏移, 字节数), utf-8编码的字符串数据
+    文件索引    每个文件的(所属部分, 路径字符串, 首个条目, 条目数, 原始内容的偏移, 字节数)
+    条目        每个条目的(key, 原文, 译文, 阶段, 其余字段的json)，均为字符串表中的编号
+    原始内容    过时词条文件的原始字节，迁移时原样写出；字典文件不保存
+
+打开时只读取文件头与文件索引，条目与字符串在读取对应文件时才从内存映射中解码
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dict_source import DictionarySource
+from data import JsonEntry
+from logger import logger
+
+SNAPSHOT_MAGIC = b"LTDICT\x00\x00"
+SNAPSHOT_VERSION = 2
+
+HEADER = struct.Struct("<8sI20sIQQQQ")
+STRING = struct.Struct("<II")  # 偏移, 字节数
+FILE = struct.Struct("<BIIIQQ")  # 所属部分, 路径, 首个条目, 条目数, 原始内容的偏移, 字节数
+RECORD = struct.Struct("<IIIiI")  # key, 原文, 译文, 阶段, 其余字段
+
+SECTION_DICT = 0
+SECTION_OUTDATED = 1
+
+NO_STRING = 0xFFFFFFFF
+ENTRY_FIELDS = ["key", "original", "translation", "stage"]
+STAGE_MIN, STAGE_MAX = -(2**31), 2**31 - 1
+
+
+def file_sha1(file: Path) -> bytes:
+    digest = hashlib.sha1()
+    with open(file, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+class StringTable:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.data: List[bytes] = []
+
+    def add(self, text: str) -> int:
+        idx = self.ids.get(text)
+        if idx is None:
+            idx = self.ids[text] = len(self.data)
+            self.data.append(text.encode("utf-8"))
+        return idx
+
+    def pack(self) -> bytes:
+        offsets = bytearray()
+        offset = 0
+        for data in self.data:
+            offsets += STRING.pack(offset, len(data))
+            offset += len(data)
+        return struct.pack("<I", len(self.data)) + bytes(offsets) + b"".join(self.data)
+
+
+def pack_entry(strings: StringTable, entry: JsonEntry) -> bytes:
+    fields = list(entry.keys())
+    stage = entry.get("stage")
+    if (
+        fields[:4] == ENTRY_FIELDS
+        and isinstance(entry["key"], str)
+        and isinstance(entry["original"], str)
+        and isinstance(entry["translation"], str)
+        and type(stage) is int
+        and STAGE_MIN <= stage <= STAGE_MAX
+    ):
+        extra = NO_STRING
+        if len(fields) > 4:
+            extra = strings.add(
+                json.dumps(
+                    {field: entry[field] for field in fields[4:]}, ensure_ascii=False
+                )
+            )
+        return RECORD.pack(
+            strings.add(entry["key"]),
+            strings.add(entry["original"]),
+            strings.add(entry["translation"]),
+            stage,
+            extra,
+        )
+
+    # 字段不完整或顺序不同的条目整体保存为json
+    return RECORD.pack(
+        NO_STRING,
+        NO_STRING,
+        NO_STRING,
+        0,
+        strings.add(json.dumps(entry, ensure_ascii=False)),
+    )
+
+
+def write_snapshot(file: Path, source_digest: bytes, source: DictionarySource) -> None:
+    """
+    读取字典来源中的全部文件，写入快照
+    """
+    strings = StringTable()
+    files = bytearray()
+    records: List[bytes] = []
+    raw_data: List[bytes] = []
+    raw_size = 0
+    file_count = 0
+
+    for section, paths, load in [
+        (SECTION_DICT, source.paths(), source.load),
+        (SECTION_OUTDATED, source.outdated_paths(), source.load_outdated),
+    ]:
+        for path in paths:
+            entries = load(path)
+            if entries is None:
+                continue
+            raw = source.read_outdated(path) if section == SECTION_OUTDATED else b""
+            files += FILE.pack(
+                section, strings.add(path), len(records), len(entries), raw_size, len(raw)
+            )
+            records.extend(pack_entry(strings, entry) for entry in entries)
+            raw_data.append(raw)
+            raw_size += len(raw)
+            file_count += 1
+
+    string_data = strings.pack()
+    strings_offset = HEADER.size
+    files_offset = strings_offset + len(string_data)
+    records_offset = files_offset + len(files)
+    raw_offset = records_offset + len(records) * RECORD.size
+
+    file = Path(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = file.with_name(file.name + ".tmp")
+    with open(temp_file, "wb") as f:
+        f.write(
+            HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                source_digest,
+                file_count,
+                strings_offset,
+                files_offset,
+                records_offset,
+                raw_offset,
+            )
+        )
+        f.write(string_data)
+        f.write(files)
+        f.write(b"".join(records))
+        f.writelines(raw_data)
+    os.replace(temp_file, file)
+
+    logger.info(
+        "已生成字典快照%s：%s个文件，%s个条目，%s个字符串",
+        file.as_posix(),
+        file_count,
+        len(records),
+        len(strings.data),
+    )
+
+
+class DictionarySnapshot:
+    """
+    以内存映射方式打开的字典快照
+    """
+
+    def __init__(self, file: Path):
+        self.file = Path(file)
+        self.handle = open(self.file, "rb")
+        try:
+            self.buffer = mmap.mmap(self.handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 空文件无法映射
+            self.handle.close()
+            raise ValueError(f"无效的字典快照：{self.file}")
+
+        try:
+            (
+                magic,
+                version,
+                self.source_digest,
+                file_count,
+                strings_offset,
+                files_offset,
+                self.records_offset,
+                self.raw_offset,
+            ) = HEADER.unpack_from(self.buffer, 0)
+        except struct.error:
+            magic = version = None
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"无效的字典快照：{self.file}")
+
+        (self.string_count,) = struct.unpack_from("<I", self.buffer, strings_offset)
+        self.string_index_offset = strings_offset + 4
+        self.string_data_offset = (
+            self.string_index_offset + self.string_count * STRING.size
+        )
+
+        # 所属部分 -> 路径 -> (首个条目, 条目数)
+        self.sections: Dict[int, Dict[str, Tuple[int, int]]] = {
+            SECTION_DICT: {},
+            SECTION_OUTDATED: {},
+        }
+        # 过时词条的路径 -> (原始内容的偏移, 字节数)
+        self.raw_files: Dict[str, Tuple[int, int]] = {}
+        for idx in range(file_count):
+            section, path, first, count, raw_start, raw_length = FILE.unpack_from(
+                self.buffer, files_offset + idx * FILE.size
+            )
+            path = self.string(path)
+            self.sections[section][path] = (first, count)
+            if section == SECTION_OUTDATED:
+                self.raw_files[path] = (raw_start, raw_length)
+
+    def string(self, idx: int) -> str:
+        offset, length = STRING.unpack_from(
+            self.buffer, self.string_index_offset + idx * STRING.size
+        )
+        start = self.string_data_offset + offset
+        return self.buffer[start : start + length].decode("utf-8")
+
+    def paths(self, section: int) -> List[str]:
+        return list(self.sections[section])
+
+    def load(self, section: int, path: str) -> Optional[List[JsonEntry]]:
+        located = self.sections[section].get(path)
+        if located is None:
+            return None
+
+        first, count = located
+        start = self.records_offset + first * RECORD.size
+        records = self.buffer[start : start + count * RECORD.size]
+
+        # 逐条目解码，字符串的位置查找放在局部变量中以减少属性访问
+        buffer = self.buffer
+        string_index = self.string_index_offset
+        string_data = self.string_data_offset
+        unpack_string = STRING.unpack_from
+        string_size = STRING.size
+
+        def string(idx: int) -> str:
+            offset, length = unpack_string(buffer, string_index + idx * string_size)
+            offset += string_data
+            return buffer[offset : offset + length].decode("utf-8")
+
+        entries: List[JsonEntry] = []
+        for key, original, translation, stage, extra in RECORD.iter_unpack(records):
+            if key == NO_STRING:
+                entries.append(json.loads(string(extra)))
+                continue
+            entry = {
+                "key": sys.intern(string(key)),
+                "original": string(original),
+                "translation": string(translation),
+                "stage": stage,
+            }
+            if extra != NO_STRING:
+                entry.update(json.loads(string(extra)))
+            entries.append(entry)
+        return entries
+
+    def raw(self, path: str) -> Optional[bytes]:
+        located = self.raw_files.get(path)
+        if located is None:
+            return None
+        start = self.raw_offset + located[0]
+        return self.buffer[start : start + located[1]]
+
+    def __getstate__(self) -> Dict:
+        # 传给子进程时只传递路径，在子进程中重新映射
+        return {"file": self.file}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__(state["file"])
+
+    def close(self) -> None:
+        self.buffer.close()
+        self.handle.close()
+
+
+class SnapshotDictionarySource(DictionarySource):
+    def __init__(self, snapshot: DictionarySnapshot):
+        self.snapshot = snapshot
+
+    def paths(self) -> List[str]:
+        return self.snapshot.paths(SECTION_DICT)
+
+    def load(self, path: str) -> List[JsonEntry]:
+        return self.snapshot.load(SECTION_DICT, path)
+
+    def outdated_paths(self) -> List[str]:
+        return self.snapshot.paths(SECTION_OUTDATED)
+
+    def load_outdated(self, path: str) -> Optional[List[JsonEntry]]:
+        return self.snapshot.load(SECTION_OUTDATED, path)
+
+    def read_outdated(self, path: str) -> Optional[bytes]:
+        return self.snapshot.raw(path)
+
+    def export_outdated(self, target_dir: Path) -> None:
+        # 与压缩包来源一致，按原内容写出全部过时词条
+        for path in self.outdated_paths():
+            file = Path(target_dir) / path
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_bytes(self.read_outdated(path))
@@ -0,0 +1,70 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from logger import logger
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    path: Path
+    relative: str  # 相对于索引根目录的posix路径
+    size: int
+    mtime_ns: int
+
+
+class SourceIndex:
+    """
+    一次os.scandir遍历得到的文件目录，按后缀分类，供各阶段查询以代替重复的glob
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        # 后缀 -> 按相对路径排序的文件列表
+        self.files: Dict[str, List[SourceFile]] = {}
+        self.scan()
+
+    def scan(self) -> None:
+        files: Dict[str, List[SourceFile]] = {}
+        count = 0
+
+        stack = [(self.root.as_posix(), "")]
+        while stack:
+            dir_path, prefix = stack.pop()
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    relative = prefix + entry.name
+                    if entry.is_dir():
+                        stack.append((entry.path, relative + "/"))
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        suffix = os.path.splitext(entry.name)[1]
+                        files.setdefault(suffix, []).append(
+                            SourceFile(
+                                path=self.root / relative,
+                                relative=relative,
+                                size=stat.st_size,
+                                mtime_ns=stat.st_mtime_ns,
+                            )
+                        )
+                        count += 1
+
+        for suffix_files in files.values():
+            suffix_files.sort(key=lambda file: file.relative)
+        self.files = files
+        logger.info("已索引%s下的%s个文件", self.root.as_posix(), count)
+
+    def query(self, suffix: str, subdir: Optional[str] = None) -> List[SourceFile]:
+        """
+        获取指定后缀（如".xml"）的文件，subdir为相对根目录的子目录
+        """
+        files = self.files.get(suffix, [])
+        if subdir is None:
+            return list(files)
+
+        prefix = subdir.strip("/") + "/"
+        return [file for file in files if file.relative.startswith(prefix)]
+
+    def paths(self, suffix: str, subdir: Optional[str] = None) -> List[Path]:
+        return [file.path for file in self.query(suffix, subdir)]
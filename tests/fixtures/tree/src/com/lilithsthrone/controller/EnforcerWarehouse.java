@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(<i>hot</i>_softly);
+		new BodyCoveringTemplate"over [pc.her] feel quick warm jumps [pc.her] dog dog",
+		int a = b + c(fox_quick);
+		tooDeep.add"<i>hot</i> lazy jumps quite fox quite"
+		return"dog feel softly brown quite the <b>bold</b> brown";
+		int a = b + c(brown_warm);
+		"brown the as dog quite feel softly <i>hot</i> dog over [npc.Name]" + "brown the as dog quite feel softly <i>hot</i> dog over [npc.Name]",
+		Availability.add"feel quite softly softly softly [npc.Name] softly" +
+		new AbstractItemEffectType"dog feel fox")
+		@Override
+		entry.getValue().getValue().add"brown the fox over you <b>bold</b>",
+		"as softly the fox as jumps <b>bold</b> fox over moans feel the lazy" + "as softly the fox as jumps <b>bold</b> fox over moans feel the lazy";
+		writing = "quick jumps over",
+		foo("softly jumps brown warm warm it's dog it's fox lazy"); // fox [npc.Name] softly <i>hot</i> lazy feel brown
+		style = "font-size: 8px; line-height:10px";
+		speech.add"quite <b>bold</b> <i>hot</i> fox jumps warm you fox the brown quick" +
+		x.getAllOf("<i>hot</i> feel <b>bold</b> softly quick moans as over quite [npc.Name]");
+		.add"softly it's moans quick it's <i>hot</i> <i>hot</i> <i>hot</i> lazy feel quite dog the it's";
+}
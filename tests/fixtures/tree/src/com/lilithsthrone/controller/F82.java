@@ -0,0 +1,14 @@
+package x;
+public class X {
+		Locale.ENGLISH;
+		int a = b + c(feel_<b>bold</b>);
+		StringBuilder().append("feel it's quite fox warm dog you the quick softly"
+		int a = b + c(<b>bold</b>_it's);
+		@Override
+		list2.add"dog lazy fox jumps quite [pc.her] warm fox [npc.Name]" +
+
+		new AbstractPlaceUpgrade"the as the";
+		int a = b + c(quick_it's);
+		lazy moans [pc.her] */
+		"<i>hot</i> quick warm it's" + "<i>hot</i> quick warm it's",
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		foo("dog the as as"); // jumps it's the dog you moans [pc.her] moans <i>hot</i> jumps brown
+		int a = b + c(softly_over);
+		failEffects"warm lazy warm lazy quite <b>bold</b> <i>hot</i> warm feel jumps quick the")
+		System.err.println("fox [npc.Name] [pc.her] you over it's quite");
+		dog fox warm brown it's it's it's <b>bold</b> */
+		System.err.println"you feel [npc.Name] lazy warm the as quite over [pc.her] <b>bold</b> lazy <b>bold</b> <i>hot</i>";
+		x.getAllOf("brown dog quite quite <i>hot</i> warm you jumps feel");
+		x.getAllOf("<b>bold</b> [pc.her] brown quick moans over [pc.her] it's as quick the as softly <i>hot</i>");
+		int a = b + c(fox_the);
+		softly as moans brown fox quick over lazy feel feel */
+		new BodyCoveringTemplate"quick as lazy the quite dog jumps as softly feel it's feel"
+		the as as */
+		"fox <b>bold</b> as softly brown fox fox warm dog <i>hot</i>" + "fox <b>bold</b> as softly brown fox fox warm dog <i>hot</i>"
+		foo("brown quick brown lazy you softly the quick it's it's <b>bold</b>"); // over <b>bold</b> feel as [pc.her] it's quite dog dog <b>bold</b> feel
+		int a = b + c(brown_warm);
+		x.getAllOf("you you lazy <b>bold</b> quick feel it's jumps dog as dog");
+		this("fox softly quite")
+		int a = b + c(the_[npc.Name]);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		/* comment over quick <b>bold</b> quick as over moans
+		foo("the fox fox moans dog moans jumps [npc.Name] [npc.Name] quick [pc.her]"); // you quick the you quick
+		int a = b + c(warm_quick);
+
+		/* comment softly jumps moans quick over <b>bold</b> jumps quite
+		faceBodyDescriptionFeral = "softly it's it's moans [pc.her] quite the <i>hot</i>";
+		int a = b + c(jumps_as);
+		Util.capitaliseSentence"as quick lazy the warm moans lazy softly it's"
+		/* comment quite feel lazy over [npc.Name]
+		x.getAllOf("the <i>hot</i> warm jumps");
+		x.getAllOf("jumps <b>bold</b> quick");
+		as brown [npc.Name] warm over you moans lazy jumps it's quite [npc.Name] moans over */
+		super("quick lazy lazy over over softly [npc.Name] <b>bold</b>";
+		"fox it's [pc.her] over dog fox feel jumps [pc.her] <b>bold</b> [pc.her]" + "fox it's [pc.her] over dog fox feel jumps [pc.her] <b>bold</b> [pc.her]";
+		@Override
+		"feel softly fox moans <b>bold</b> jumps moans over moans" + "feel softly fox moans <b>bold</b> jumps moans over moans",
+		prefixes = "you [pc.her] warm softly brown warm dog jumps softly jumps <b>bold</b>",
+		Content.get"dog [npc.Name] [npc.Name] <i>hot</i> as <b>bold</b> lazy [npc.Name] the" +
+}
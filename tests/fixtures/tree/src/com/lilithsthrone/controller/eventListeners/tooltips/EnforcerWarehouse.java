@@ -0,0 +1,21 @@
+package x;
+public class X {
+		foo("you it's quick"); // <i>hot</i> quite <i>hot</i> warm moans
+		you lazy lazy quite fox <b>bold</b> */
+		"<b>bold</b> it's softly jumps fox warm warm <b>bold</b> you" + "<b>bold</b> it's softly jumps fox warm warm <b>bold</b> you"
+		/* comment <i>hot</i> warm lazy <i>hot</i> softly the warm <b>bold</b> jumps quick dog as
+		int a = b + c(fox_quite);
+		System.err.println("[pc.her] the fox lazy softly you moans <b>bold</b> you dog over");
+		@Override
+		/* comment it's as lazy over <i>hot</i> feel quick <i>hot</i> it's
+		int a = b + c(you_as);
+		"quite brown quick dog moans brown" + "quite brown quick dog moans brown",
+		style = "font-size: 26px; line-height:14px";
+		"it's brown quite softly feel you <b>bold</b> the you brown fox" + "it's brown quite softly feel you <b>bold</b> the you brown fox";
+		demonstoneImages = "as brown jumps" +
+		style = "font-size: 29px; line-height:12px";
+		foo("warm fox you softly [npc.Name] fox quick"); // you over feel as over [pc.her] over brown quick <b>bold</b>
+		x.getAllOf("lazy [pc.her] <b>bold</b> lazy brown fox dog softly as warm <i>hot</i> dog fox [pc.her]");
+		@Override
+		foo("quick feel"); // brown over dog the
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		super("fox softly warm lazy";
+		int a = b + c(the_the);
+		warm over quick warm brown as */
+		x.getAllOf("warm quick softly <b>bold</b> [pc.her] [pc.her] feel the");
+		Names.contains"<b>bold</b> quite the dog dog quite [pc.her] <i>hot</i> over over"
+		stretching.add"[npc.Name] you it's brown [pc.her] [npc.Name] over"
+
+		int a = b + c(quick_quite);
+		formatAttackOutcome"dog jumps brown it's quite you dog <b>bold</b> jumps <b>bold</b> <b>bold</b> as fox quite"
+		title="you fox brown over feel dog you over the dog lazy dog fox",
+		"<b>bold</b> feel <i>hot</i> jumps <i>hot</i> dog lazy feel you brown the brown <b>bold</b>" + "<b>bold</b> feel <i>hot</i> jumps <i>hot</i> dog lazy feel you brown the brown <b>bold</b>",
+		/* comment warm brown [npc.Name] over quick feel
+		Output.append("brown lazy jumps"
+		x.getAllOf("<b>bold</b> lazy brown softly moans dog over warm the warm <b>bold</b> [pc.her]");
+		x.getAllOf("brown quite jumps warm softly");
+		/* comment <i>hot</i> lazy brown [npc.Name] [npc.Name] feel lazy moans feel moans over fox
+		Locale.ENGLISH;
+		"<i>hot</i> warm dog feel softly quick jumps" + "<i>hot</i> warm dog feel softly quick jumps";
+}
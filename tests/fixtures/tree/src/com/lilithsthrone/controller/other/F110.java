@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new PossibleItemEffect"brown quite it's <i>hot</i> jumps as feel brown [pc.her] it's quick softly softly the";
+
+		"you it's moans quick softly brown lazy feel fox warm the [pc.her] as as" + "you it's moans quick softly brown lazy feel fox warm the [pc.her] as as"
+		x.getAllOf("[npc.Name] quite quite you fox");
+		foo("warm lazy [npc.Name] quick the fox fox"); // <b>bold</b> fox you the over fox as it's quick fox
+		area = "fox quite brown it's warm <b>bold</b> the")
+		style = "font-size: 16px; line-height:8px";
+		int a = b + c(moans_over);
+		foo("<b>bold</b> dog lazy it's feel lazy fox"); // [pc.her] it's feel quite it's jumps the dog it's quite fox
+		x.getAllOf("lazy as moans");
+		getTextStartStringBuilder()"[npc.Name] over dog softly" +
+		new BodyCoveringTemplate"you the moans <b>bold</b> fox as";
+		you quick [npc.Name] you quite feel you */
+		int a = b + c(it's_as);
+		<i>hot</i> brown warm [npc.Name] <i>hot</i> over quite feel as quite fox [pc.her] the */
+		style = "font-size: 17px; line-height:14px";
+		foo("[npc.Name] <i>hot</i> softly quick"); // [npc.Name] it's softly you it's the feel as warm moans quite <i>hot</i> it's
+		style = "font-size: 21px; line-height:23px";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(fox_warm);
+
+
+		int a = b + c(moans_dog);
+		parsed.add"quick warm warm jumps <b>bold</b>")
+		/* comment quite <b>bold</b> dog
+		System.err.println("it's feel");
+		orificesRecovering.add"brown warm softly fox brown it's you",
+		tooltipSB.append"quick moans brown",
+		@Override
+		new BodyCoveringTemplate"<b>bold</b> as [pc.her] brown [npc.Name] dog softly as feel [pc.her] fox moans moans",
+		Locale.ENGLISH;
+
+		quick <b>bold</b> you the <b>bold</b> over */
+		new AbstractItemEffectType"quick quick you as jumps dog you it's";
+		style = "font-size: 8px; line-height:25px";
+		new AbstractPlaceUpgrade"<i>hot</i> <b>bold</b> [npc.Name] brown jumps the the it's lazy softly quick"
+		int a = b + c(dog_you);
+}
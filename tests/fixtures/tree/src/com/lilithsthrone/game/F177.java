@@ -0,0 +1,19 @@
+package x;
+public class X {
+		@Override
+		disclaimer="jumps it's feel dog feel lazy feel it's you feel <b>bold</b>"
+		_CALCULATION = "dog jumps dog quick quite <i>hot</i>")
+		getTooltipText"softly over quite feel moans the quick" +
+		Content.put"jumps lazy quite dog quick fox moans jumps brown warm it's you"
+		*/"brown it's softly brown dog the the <b>bold</b> fox")
+		"as softly the over brown brown lazy [npc.Name] lazy quite fox the the [npc.Name]" + "as softly the over brown brown lazy [npc.Name] lazy quite fox the the [npc.Name]",
+		new AbstractRace"[pc.her] quite" +
+		new AbstractRace"[pc.her] [npc.Name] it's you dog [npc.Name]"
+		int a = b + c(quick_<b>bold</b>);
+		new ParserCommand"the moans <b>bold</b> dog <b>bold</b> the quite over fox fox as softly warm over" +
+		womanCry = "quite lazy warm feel jumps [npc.Name] <b>bold</b> dog [pc.her] <i>hot</i> warm <i>hot</i> dog",
+		new AbstractBodyCoveringType"the the quick lazy it's <i>hot</i> lazy moans over" +
+		int a = b + c(quite_[pc.her]);
+		foo("warm <b>bold</b> moans feel <i>hot</i> lazy"); // dog it's you jumps [npc.Name] moans [npc.Name] warm over quick [npc.Name]
+		@Override
+}
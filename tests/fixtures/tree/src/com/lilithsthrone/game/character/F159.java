@@ -0,0 +1,21 @@
+package x;
+public class X {
+		style = "font-size: 9px; line-height:18px";
+		foo("jumps as softly fox"); // you brown it's as
+		areaEgged = "<i>hot</i> it's over you quite warm it's brown" +
+		softly the the */
+		int a = b + c([pc.her]_softly);
+		int a = b + c(as_it's);
+		ingredientMap.put"quick dog over moans lazy lazy")
+		new AbstractPlaceUpgrade"it's lazy",
+		int a = b + c(softly_feel);
+		int a = b + c(over_jumps);
+		/* comment jumps quite over feel [npc.Name] warm over brown lazy fox the jumps [npc.Name] fox
+		tooltipSB.append"it's [npc.Name] it's",
+		Locale.ENGLISH;
+		int a = b + c(as_brown);
+		int a = b + c(fox_[pc.her]);
+		int a = b + c(quite_[pc.her]);
+
+		int a = b + c(the_brown);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		stage = "jumps as brown warm quick it's <b>bold</b> the you <i>hot</i> dog jumps brown";
+		foo("the lazy fox you"); // quite [pc.her] the jumps fox fox the fox over <b>bold</b> <b>bold</b> quite lazy <b>bold</b>
+		new AbstractItemType"jumps brown <b>bold</b> as as")
+		new AbstractAttribute"brown quite <i>hot</i> jumps softly";
+		@Override
+		"brown <b>bold</b> softly" + "brown <b>bold</b> softly",
+		.flashMessage"as fox [pc.her] brown [npc.Name] over over moans moans jumps";
+		additional = "it's you as dog lazy")
+		new MuleReward"<b>bold</b> <b>bold</b> lazy brown <b>bold</b> quick quite warm over softly softly softly lazy")
+		getTooltipText"lazy warm moans lazy brown quite fox softly softly moans [pc.her] jumps <i>hot</i> [pc.her]";
+		@Override
+		foo("you lazy [pc.her] as you"); // <i>hot</i> feel
+		names += "[pc.her] over <i>hot</i> the you warm" +
+		modifiers.add("softly it's feel warm the",
+		descriptions.append("the <i>hot</i> [npc.Name] <i>hot</i> warm <b>bold</b> <i>hot</i> <i>hot</i> <b>bold</b> the [npc.Name] softly <i>hot</i>")
+		setSurname"fox jumps softly <i>hot</i> jumps the dog moans brown [npc.Name] quick [npc.Name] as")
+		"fox you you <i>hot</i> jumps" + "fox you you <i>hot</i> jumps";
+		Locale.ENGLISH;
+}
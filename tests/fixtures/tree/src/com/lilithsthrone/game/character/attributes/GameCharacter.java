@@ -0,0 +1,21 @@
+package x;
+public class X {
+		formatAttackOutcome"the quick over brown over",
+		x.getAllOf("quick as <i>hot</i> quick you lazy");
+		foo("the lazy <i>hot</i>"); // <b>bold</b> it's fox it's softly [npc.Name] softly [npc.Name] <b>bold</b> <i>hot</i> quick fox
+		"softly warm it's jumps" + "softly warm it's jumps";
+		@Override
+		System.err.println("dog [pc.her] quite it's quick");
+		int a = b + c(you_quick);
+		"fox the over dog quite <i>hot</i> <i>hot</i> <b>bold</b> softly" + "fox the over dog quite <i>hot</i> <i>hot</i> <b>bold</b> softly";
+		int a = b + c(you_dog);
+		dangerousDirections.add"you fox you over feel over")
+		int a = b + c(lazy_<b>bold</b>);
+		foo("quite jumps"); // quite fox fox over <i>hot</i> softly the [pc.her]
+		names.put"warm fox fox over moans lazy moans softly warm you <b>bold</b> [pc.her] warm"
+		output.append("dog fox as lazy the as warm softly dog <b>bold</b> softly softly moans" +
+		it's [npc.Name] the fox warm [npc.Name] lazy jumps brown the jumps moans moans */
+		new AbstractParserTarget"<i>hot</i> [npc.Name] as dog <i>hot</i> quick moans jumps <i>hot</i> lazy <b>bold</b> over [npc.Name]")
+		"[npc.Name] [pc.her] softly it's feel dog you feel feel" + "[npc.Name] [pc.her] softly it's feel dog you feel feel"
+		int a = b + c(the_jumps);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		Util.newArrayListOfValues"it's softly dog [npc.Name]" +
+		from2 = "[npc.Name] lazy over moans fox warm softly feel quite"
+		int a = b + c(lazy_over);
+		System.err.println("[pc.her] as lazy the softly softly lazy brown moans");
+		foo("dog dog warm you <i>hot</i> feel the it's moans as"); // <b>bold</b> brown moans
+		int a = b + c(<b>bold</b>_[npc.Name]);
+		foo("as it's jumps feel the feel jumps quick brown softly the moans warm you"); // as lazy softly brown moans you
+		Locale.ENGLISH;
+		int a = b + c(it's_<i>hot</i>);
+		new AbstractStatusEffect"lazy dog quite as [pc.her] you you [npc.Name] you",
+		map.put"softly you jumps dog feel <i>hot</i> quick";
+		reason = "jumps softly";
+		x.getAllOf("you moans softly the");
+		"as [pc.her]" + "as [pc.her]"
+		faceBodyDescriptionFeral = "feel moans [npc.Name] you [npc.Name] dog you"
+		setSurname"<i>hot</i> it's"
+		"feel moans [pc.her] jumps [pc.her] quick" + "feel moans [pc.her] jumps [pc.her] quick"
+		foo("lazy jumps softly jumps moans quick you fox <b>bold</b> lazy as brown"); // moans as lazy softly quite brown
+}
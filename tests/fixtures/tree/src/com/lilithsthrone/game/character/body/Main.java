@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"fox [npc.Name]" + "fox [npc.Name]";
+		.flashMessage"<b>bold</b> jumps warm quick as [pc.her] jumps warm quick you as [pc.her]";
+		softly lazy feel brown the softly dog over quite you <i>hot</i> the quite you */
+
+
+		int a = b + c(moans_quite);
+		new GenderAppearance"it's <b>bold</b> jumps fox lazy it's quick jumps softly it's over";
+
+		foo("softly <b>bold</b> jumps brown feel quick <i>hot</i> the as [npc.Name] <i>hot</i>"); // quick <i>hot</i> brown [pc.her] dog warm moans [npc.Name] feel you <b>bold</b> you moans
+		"the dog dog quick quite feel feel feel you fox quite you warm brown" + "the dog dog quick quite feel feel feel you fox quite you warm brown"
+		areaEgged = "<b>bold</b> quite <b>bold</b> you lazy warm it's moans [npc.Name] moans")
+		list2.add"as the"
+
+		x.getAllOf("feel fox you over feel [npc.Name] [npc.Name] over fox over [npc.Name] the [pc.her]");
+		int a = b + c(brown_<b>bold</b>);
+		"quick [pc.her] jumps quite moans over warm softly" + "quick [pc.her] jumps quite moans over warm softly"
+		int a = b + c(over_quite);
+		"you lazy" + "you lazy",
+}
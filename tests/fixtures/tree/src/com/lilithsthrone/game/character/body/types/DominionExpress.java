@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c([pc.her]_dog);
+		Locale.ENGLISH;
+		int a = b + c(fox_<b>bold</b>);
+		new AbstractParserTarget"<i>hot</i> jumps moans dog <b>bold</b> as lazy over the jumps feel the",
+		foo("fox brown moans feel"); // as softly [npc.Name] [npc.Name] lazy <i>hot</i> moans lazy feel
+
+		/* comment softly over quite as lazy <i>hot</i> */
+		getTooltipText"fox lazy brown feel you <b>bold</b> warm as quite feel [pc.her]",
+
+		@Override
+		foo("the <i>hot</i> lazy <b>bold</b>"); // quick warm [npc.Name] as warm softly softly jumps
+		@Override
+		x.getAllOf("quite quick softly quick");
+		.add"feel [pc.her] feel jumps warm [npc.Name] <b>bold</b> feel dog <b>bold</b> lazy" +
+		int a = b + c(jumps_lazy);
+		int a = b + c(<b>bold</b>_dog);
+		.flashMessage"quick it's it's fox")
+		"as [pc.her] dog" + "as [pc.her] dog";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(as_it's);
+		/* comment [npc.Name] fox over quite [pc.her] brown as */
+		int a = b + c(over_feel);
+		int a = b + c(over_warm);
+		"jumps lazy [npc.Name] jumps <i>hot</i> quite" + "jumps lazy [npc.Name] jumps <i>hot</i> quite",
+
+
+		x.getAllOf("as [npc.Name]");
+		foo("over lazy as [pc.her]"); // fox over softly <b>bold</b> [pc.her] fox [pc.her] over over dog it's <i>hot</i> the
+		new SexSlot"you fox quick quick quick dog it's"
+		Locale.ENGLISH;
+		int a = b + c(<b>bold</b>_warm);
+		System.err.println"dog you you [pc.her] brown fox [npc.Name] as [npc.Name] warm"
+		spawnSubGloryHoleNPC"<b>bold</b> <b>bold</b> [pc.her] <b>bold</b> quite <i>hot</i> lazy the warm [pc.her]")
+		/* comment jumps feel <b>bold</b> brown you fox
+
+		stretching.add"[npc.Name] <i>hot</i> moans fox you fox quick moans")
+		"lazy you you" + "lazy you you"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		System.err.println("moans the [npc.Name] <b>bold</b> as <i>hot</i> warm");
+		@Override
+		disabledMsg = "warm <b>bold</b> as over over feel" +
+		perkRequirementsList.add"[pc.her] the feel moans dog it's fox over <b>bold</b> jumps [npc.Name] warm"
+		/* comment [npc.Name] lazy */
+		int a = b + c(moans_<i>hot</i>);
+		Modified.add"[npc.Name] quite over as over moans you",
+		System.err.println"you feel as the lazy lazy <i>hot</i> warm jumps you quite quite warm quick";
+		new AbstractSubspecies"softly [npc.Name] quick",
+		"you fox [npc.Name] feel <i>hot</i> the [npc.Name] <i>hot</i> [npc.Name] softly lazy quite" + "you fox [npc.Name] feel <i>hot</i> the [npc.Name] <i>hot</i> [npc.Name] softly lazy quite";
+		"quick [pc.her] warm feel the lazy softly as <i>hot</i> over softly" + "quick [pc.her] warm feel the lazy softly as <i>hot</i> over softly";
+		foo("you quite jumps over"); // [npc.Name] <b>bold</b> quick dog softly as lazy fox
+		int a = b + c(quick_fox);
+		int a = b + c(<b>bold</b>_you);
+		int a = b + c(as_<i>hot</i>);
+		moans fox it's over dog dog softly as quite softly */
+		target = "as feel" +
+		x.getAllOf("softly [pc.her] over fox as feel");
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		demonstoneEnergy = "feel jumps quite you quite jumps [pc.her] quite the the dog [npc.Name] the"
+		.add"quite quite quick quite <b>bold</b> <i>hot</i> as fox",
+		responses.add"the quick <b>bold</b> as")
+		effectsList.add("moans jumps softly the lazy feel over quite [npc.Name] jumps",
+		int a = b + c(as_jumps);
+		UtilText.returnStringAtRandom"brown dog over moans [npc.Name] feel feel"
+		int a = b + c(<i>hot</i>_[npc.Name]);
+		int a = b + c([npc.Name]_softly);
+		Util.newArrayListOfValues"dog [npc.Name] moans feel <i>hot</i> jumps softly dog over over warm"
+		clothingSlotCategories.put"[npc.Name] <b>bold</b> it's <b>bold</b> over",
+
+		int a = b + c(it's_quite);
+		"the dog" + "the dog"
+		adjectives = "it's dog lazy jumps dog quite lazy lazy as you moans you warm")
+		/* comment as moans it's
+		new AbstractCombatMove"fox softly"
+		x.getAllOf("quite moans dog jumps softly brown you dog you brown <i>hot</i> fox warm");
+		/* comment <b>bold</b> you moans moans <b>bold</b> */
+}
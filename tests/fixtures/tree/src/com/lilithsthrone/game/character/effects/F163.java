@@ -0,0 +1,19 @@
+package x;
+public class X {
+
+		style = "font-size: 26px; line-height:26px";
+		[npc.Name] jumps you the warm as warm */
+		quite the <b>bold</b> you moans quite quick jumps */
+		brown fox <i>hot</i> <b>bold</b> feel moans quick <i>hot</i> <i>hot</i> quick as [npc.Name] lazy */
+		new EventLogEntry"[pc.her] fox";
+		int a = b + c([npc.Name]_as);
+		static String[]"quick quick feel softly <i>hot</i> brown <b>bold</b> it's [npc.Name] brown over"
+		@Override
+		x.getAllOf("quick <b>bold</b> you quite warm <b>bold</b> the quick <b>bold</b> it's <b>bold</b> over moans");
+		new MuleReward"[npc.Name] quick [pc.her] softly brown <b>bold</b> jumps")
+		foo("quick [npc.Name] [npc.Name] lazy lazy softly warm jumps dog <b>bold</b> quite"); // dog feel it's
+		"quick the brown quite warm feel <b>bold</b> moans quite as" + "quick the brown quite warm feel <b>bold</b> moans quite as",
+		tooltipDescriptionSB.append"fox over the as jumps";
+		new AbstractFetish"over <b>bold</b> softly as quite"
+		int a = b + c(brown_quite);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(it's_brown);
+		/* comment lazy moans moans brown it's quite */
+		"feel feel over quite feel fox <i>hot</i> over the brown moans quite feel" + "feel feel over quite feel fox <i>hot</i> over the brown moans quite feel",
+		entries.add"over jumps [npc.Name] dog quick lazy you quite fox"
+		int a = b + c(over_quite);
+		int a = b + c(<b>bold</b>_lazy);
+		x.getAllOf("as feel warm feel it's as moans [pc.her] [pc.her] fox [npc.Name]");
+		System.err.println("moans softly dog <i>hot</i> you dog <i>hot</i> over [npc.Name] you the warm");
+		x.getAllOf("as as dog it's as quick [npc.Name] dog over");
+		additional = "fox dog fox as <b>bold</b> <i>hot</i> as quite lazy quick feel over")
+		Locale.ENGLISH;
+		int a = b + c([pc.her]_brown);
+		new AbstractFooType("quite the [pc.her] lazy fox [pc.her] [pc.her]"
+		new BodyCoveringTemplate"over lazy fox")
+		"dog jumps the quite it's <b>bold</b> softly warm brown jumps [npc.Name]" + "dog jumps the quite it's <b>bold</b> softly warm brown jumps [npc.Name]",
+		int a = b + c(brown_the);
+		int a = b + c(<i>hot</i>_jumps);
+		UtilText.parse"warm <b>bold</b> warm <i>hot</i> [pc.her] [npc.Name] [npc.Name]"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		setSurname"[pc.her] quick the <i>hot</i> softly you you moans the";
+		System.err.println"warm softly you lazy fox jumps feel brown it's it's dog moans"
+		foo("moans as softly moans brown the quick quick softly dog jumps the fox"); // quick [npc.Name] fox [pc.her] [pc.her] it's the jumps it's
+		style = "font-size: 15px; line-height:16px";
+		stringBuilder.append("lazy feel you jumps quick feel over quite"
+		System.err.println("[npc.Name] quite the it's brown warm you <b>bold</b> <b>bold</b> <b>bold</b> it's as");
+		foo("[pc.her] softly quite it's"); // you the <i>hot</i> [pc.her] warm [pc.her] brown as brown dog <b>bold</b>
+		womanCry = "it's feel <b>bold</b>"
+		/* comment jumps [pc.her] <i>hot</i> moans */
+		stringBuilder.append("it's fox feel fox lazy [pc.her] dog <b>bold</b> it's brown as moans softly")
+		foo("the moans <i>hot</i> brown the quite brown quite fox as jumps moans"); // fox dog <i>hot</i> quick lazy [pc.her] [npc.Name]
+		"[pc.her] feel quick dog softly jumps dog you brown moans you quick it's" + "[pc.her] feel quick dog softly jumps dog you brown moans you quick it's"
+		area = "[pc.her] lazy";
+		moans softly over fox as it's */
+		super("[npc.Name] you you lazy warm fox as [pc.her] you dog dog over moans softly" +
+		returnValue = "<i>hot</i> the [pc.her]" +
+		perkRequirementsList.add"jumps [pc.her] warm as [pc.her] feel the fox you fox dog jumps";
+		style = "font-size: 11px; line-height:25px";
+}
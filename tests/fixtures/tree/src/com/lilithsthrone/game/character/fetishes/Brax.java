@@ -0,0 +1,21 @@
+package x;
+public class X {
+		[npc.Name] feel lazy jumps softly <i>hot</i> dog fox fox as quite over */
+		int a = b + c(moans_[npc.Name]);
+		x.getAllOf("[npc.Name] as over warm jumps lazy jumps the quick");
+		you [pc.her] quite you dog the the <b>bold</b> over <i>hot</i> */
+		"jumps jumps <b>bold</b> the [pc.her] quite" + "jumps jumps <b>bold</b> the [pc.her] quite"
+		int a = b + c(jumps_brown);
+		int a = b + c(lazy_softly);
+		int a = b + c(feel_as);
+		new AbstractFooType("[npc.Name] fox feel [pc.her] <b>bold</b> softly" +
+		/* comment softly you softly [npc.Name] brown softly fox */
+		/* comment quick [npc.Name] you <b>bold</b> [npc.Name] the you it's brown moans */
+		"dog as <i>hot</i> lazy warm jumps lazy warm jumps quite" + "dog as <i>hot</i> lazy warm jumps lazy warm jumps quite"
+		"dog quite you brown brown [pc.her] feel" + "dog quite you brown brown [pc.her] feel",
+		formatAttackOutcome"warm [pc.her] quite the feel it's warm [pc.her] you as softly lazy [npc.Name]",
+		x.getAllOf("<b>bold</b> jumps softly over lazy dog [npc.Name] quite quite <b>bold</b>");
+		int a = b + c(it's_jumps);
+		target = "it's over" +
+		Locale.ENGLISH;
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		ingredientMap.put"quick softly quick warm over as quite you fox <i>hot</i> dog dog")
+		tailSpecial1 = "quick you it's the fox <b>bold</b>")
+		int a = b + c(warm_fox);
+		int a = b + c(fox_lazy);
+		writing = "feel brown the",
+		new AbstractPerk"jumps over <i>hot</i> fox dog fox it's over over <i>hot</i> as [npc.Name] dog" +
+		new AbstractParserTarget"fox warm the jumps moans brown [npc.Name]")
+		@Override
+		int a = b + c(<i>hot</i>_warm);
+		new AbstractCombatMove"jumps fox quick brown as feel fox quite brown lazy moans quite" +
+		descriptions.append("<i>hot</i> moans over feel" +
+		int a = b + c(fox_quick);
+		new Colour"the fox the",
+		UtilText.parse"as you dog you the";
+		"<i>hot</i> jumps warm warm brown brown dog quick" + "<i>hot</i> jumps warm warm brown brown dog quick"
+		@Override
+		additional = "warm [pc.her] lazy softly" +
+		x.getAllOf("quick over [pc.her] the feel");
+}
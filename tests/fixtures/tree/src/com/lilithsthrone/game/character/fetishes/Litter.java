@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(you_fox);
+		Modified.add"quite quick <b>bold</b> [npc.Name] softly it's moans" +
+		x.getAllOf("softly lazy");
+		int a = b + c(you_softly);
+		jumps the lazy brown brown quick as as jumps moans dog dog */
+		@Override
+		/* comment moans fox <b>bold</b> feel brown [pc.her] lazy feel it's [pc.her] you quite softly
+		foo("jumps you moans brown <b>bold</b> <b>bold</b>"); // fox over as
+		style = "font-size: 23px; line-height:10px";
+		adjectives = "fox fox <i>hot</i> as [pc.her] the",
+		Availability.add"lazy warm [npc.Name] fox warm the dog [npc.Name] <b>bold</b> over" +
+		/* comment feel <b>bold</b>
+		"<i>hot</i> you" + "<i>hot</i> you"
+		/* comment jumps you fox
+		x.getAllOf("fox as moans brown it's as as");
+		the <b>bold</b> the quite jumps the brown [npc.Name] quick warm it's <b>bold</b> moans */
+		dangerousDirections.add"the you quite lazy warm warm")
+		from2 = "fox jumps quite you over softly [pc.her] as <b>bold</b>")
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(fox_warm);
+		stringBuilderToAppendTo.append"brown you warm dog you as [pc.her] warm brown moans [npc.Name] <i>hot</i> it's")
+		legsSpreading = "[npc.Name] quick dog you" +
+		x.getAllOf("quite [pc.her] the lazy softly brown feel fox brown over warm");
+		int a = b + c(feel_quite);
+		.setTooltipContent"[pc.her] dog warm <i>hot</i> brown brown dog lazy")
+		.setInformation"jumps dog fox warm fox";
+		@Override
+		int a = b + c([npc.Name]_you);
+		desc = "<b>bold</b> as [npc.Name] lazy over quick over feel as as it's",
+		"quite jumps" + "quite jumps"
+		int a = b + c(it's_[npc.Name]);
+		foo("quick <i>hot</i>"); // quite softly as as fox fox
+		/* comment [npc.Name] the feel you warm dog the warm <i>hot</i> softly it's [pc.her] feel */
+		/* comment moans dog feel softly <i>hot</i> as [npc.Name] over it's
+		"quick the fox [npc.Name] lazy quite dog quite as quite the brown lazy brown" + "quick the fox [npc.Name] lazy quite dog quite as quite the brown lazy brown";
+		"[npc.Name] jumps warm" + "[npc.Name] jumps warm"
+		writing = "over the you [npc.Name] dog dog softly softly dog the [npc.Name] quite"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		style = "font-size: 14px; line-height:21px";
+		purchaseAvailability.append"it's moans it's moans moans dog")
+		x.getAllOf("fox [npc.Name] over");
+		int a = b + c([pc.her]_jumps);
+		new AbstractBodyCoveringType"quite brown [npc.Name] warm [npc.Name] lazy you feel [pc.her] dog quite"
+		System.err.println("quite [npc.Name] quite [pc.her] as you as as quite lazy");
+		new AbstractItemEffectType"<i>hot</i> fox")
+		spawnDomGloryHoleNPC"jumps warm jumps lazy";
+		int a = b + c(quick_brown);
+		Locale.ENGLISH;
+		int a = b + c(<i>hot</i>_quite);
+		@Override
+		"lazy softly you over [npc.Name] as it's as <i>hot</i>" + "lazy softly you over [npc.Name] as it's as <i>hot</i>"
+		legsSpreading = "warm the you warm [pc.her] it's moans as fox feel as lazy <b>bold</b> quite")
+		@Override
+
+		int a = b + c(as_<i>hot</i>);
+		style = "font-size: 30px; line-height:12px";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"lazy [pc.her] feel <i>hot</i> [pc.her] feel <b>bold</b> [pc.her]" + "lazy [pc.her] feel <i>hot</i> [pc.her] feel <b>bold</b> [pc.her]";
+		reason = "fox over quite <i>hot</i>";
+		int a = b + c(quick_quick);
+		new Value<>"moans the you lazy")
+		the fox */
+		int a = b + c(over_quick);
+		/* comment it's lazy the dog <i>hot</i> moans fox [pc.her] quite as moans */
+		int a = b + c(jumps_brown);
+		x.getAllOf("it's brown the quick <i>hot</i> warm dog <i>hot</i> <i>hot</i> [pc.her] [pc.her] over the brown");
+		UtilText.returnStringAtRandom"you over warm")
+		foo("it's [pc.her]"); // lazy softly lazy the moans quite warm as
+		entries.add"dog <i>hot</i> quick you dog you <b>bold</b>"
+		setSurname"fox <b>bold</b> brown [pc.her] as [pc.her] moans dog it's [pc.her] dog it's";
+
+		*/"lazy you softly over";
+		faceBodyDescriptionFeral = "[npc.Name] as softly <i>hot</i> feel over jumps <i>hot</i> moans" +
+		int a = b + c(brown_warm);
+		new AbstractAttribute"lazy softly it's as feel [npc.Name] over fox feel [npc.Name] quick" +
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new ParserCommand"<b>bold</b> as quite <i>hot</i> warm";
+		Locale.ENGLISH;
+		int a = b + c(it's_as);
+		tailSpecial2 = "fox <i>hot</i> it's warm <b>bold</b> brown fox"
+		x.getAllOf("[pc.her] [pc.her] warm warm softly");
+		x.getAllOf("<b>bold</b> warm the quick [npc.Name] <i>hot</i> over brown quick you [pc.her] feel jumps");
+		cost = "brown moans quite [npc.Name] [npc.Name] warm [pc.her] feel quite lazy"
+		int a = b + c(quick_brown);
+		@Override"lazy the jumps quite as fox" +
+		int a = b + c(feel_[npc.Name]);
+		new NameTriplet"lazy quick quick feel fox <b>bold</b> fox <b>bold</b> over";
+		int a = b + c(over_[pc.her]);
+		Util.capitaliseSentence"<i>hot</i> <b>bold</b> the" +
+		System.err.println("it's the brown it's over softly [npc.Name]");
+		cost = "quite the lazy moans <b>bold</b> <b>bold</b>"
+		new ParserCommand"quite moans [npc.Name] brown dog quick")
+
+		x.getAllOf("over brown fox as softly");
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		titles.add("over you [pc.her] warm warm feel" +
+		.add"brown jumps quick dog as warm fox the softly [pc.her] [npc.Name] the quick quick";
+		getTextStartStringBuilder()"fox you brown <b>bold</b>",
+		"you feel moans quick over it's jumps [pc.her] brown fox moans" + "you feel moans quick over it's jumps [pc.her] brown fox moans",
+		int a = b + c(feel_[npc.Name]);
+		int a = b + c(the_it's);
+		x.getAllOf("feel over over <b>bold</b> you the <b>bold</b> over");
+		"dog warm <b>bold</b> [pc.her] quite [pc.her] dog over moans over quick" + "dog warm <b>bold</b> [pc.her] quite [pc.her] dog over moans over quick";
+		@Override
+		/* comment quite [pc.her] feel feel feel brown jumps you */
+		appendToTextEndStringBuilder"<b>bold</b> quite [pc.her]";
+		textSB.append("[npc.Name] <i>hot</i> feel feel <b>bold</b> over fox the fox over moans [npc.Name] it's <i>hot</i>",
+		this("lazy over lazy dog" +
+		int a = b + c(brown_over);
+		System.err.println("over [npc.Name] it's feel [npc.Name]");
+		x.getAllOf("feel fox jumps softly the feel dog <b>bold</b>");
+		style = "font-size: 24px; line-height:30px";
+		/* comment warm softly quick softly the brown [pc.her] as quite as
+}
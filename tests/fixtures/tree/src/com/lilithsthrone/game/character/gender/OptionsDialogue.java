@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"moans jumps as [npc.Name] <i>hot</i> moans you lazy feel [npc.Name]" + "moans jumps as [npc.Name] <i>hot</i> moans you lazy feel [npc.Name]",
+		int a = b + c([pc.her]_moans);
+		new Response"[npc.Name] the <i>hot</i> moans <b>bold</b>"
+		feel it's quick dog warm over dog [pc.her] over over jumps quite [pc.her] fox */
+		int a = b + c(<b>bold</b>_<b>bold</b>);
+
+		@Override
+		purchaseAvailability.append"jumps lazy [pc.her] brown quick jumps" +
+		/* comment you <b>bold</b> dog moans quite jumps [pc.her] as jumps feel over [npc.Name]
+		new BodyCoveringTemplate"moans <i>hot</i> <i>hot</i> [pc.her] quick brown")
+		newArrayListOfValues"quite the fox you you softly lazy <i>hot</i> moans it's as";
+		.add"dog dog jumps lazy you over softly over softly [npc.Name]"
+		speech.add"the you"
+		/* comment quick warm
+		static String[]"fox it's <i>hot</i> lazy [pc.her]";
+		fox quite softly fox it's */
+		[pc.her] <b>bold</b> softly warm quick */
+		"quick over quick feel you warm dog moans feel quite softly over <i>hot</i> quite" + "quick over quick feel you warm dog moans feel quite softly over <i>hot</i> quite",
+}
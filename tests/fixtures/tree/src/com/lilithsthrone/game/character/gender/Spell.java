@@ -0,0 +1,21 @@
+package x;
+public class X {
+		modifiers.add("<i>hot</i> it's"
+		int a = b + c(as_dog);
+		/* comment jumps jumps fox moans */
+		title="fox [npc.Name]")
+		formatAttackOutcome"quite <i>hot</i> lazy you jumps the <b>bold</b> brown")
+		@Override
+		desc = "over softly lazy over you quite fox")
+		foo("over moans fox as quick over it's the brown warm as you as"); // you [npc.Name] [npc.Name] quick
+		/* comment it's jumps you [pc.her] [pc.her]
+		new AbstractBodyCoveringType"quick it's moans the dog";
+		int a = b + c(quite_fox);
+		"lazy jumps it's as feel lazy as warm moans <b>bold</b> [pc.her] [npc.Name]" + "lazy jumps it's as feel lazy as warm moans <b>bold</b> [pc.her] [npc.Name]",
+		foo("feel feel softly over quite [pc.her] quick it's quick warm lazy you"); // lazy lazy <i>hot</i> quite over as warm over [npc.Name]
+		Locale.ENGLISH;
+		_CALCULATION = "lazy you",
+		int a = b + c(<b>bold</b>_as);
+		it's moans warm */
+		failEffects"moans <b>bold</b> dog jumps feel quite it's jumps it's you [pc.her] quite over" +
+}
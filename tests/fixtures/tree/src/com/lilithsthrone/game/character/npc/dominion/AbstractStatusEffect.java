@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(<i>hot</i>_lazy);
+		[pc.her] brown fox over <b>bold</b> you [pc.her] */
+		SVGImageSB.append"softly [pc.her] feel brown lazy dog";
+		foo("<b>bold</b> it's <i>hot</i> feel the over feel dog [npc.Name] the quick you quick"); // you <i>hot</i> dog it's moans fox you quite dog over quick <b>bold</b> jumps it's
+		dog [npc.Name] over [pc.her] */
+		int a = b + c([npc.Name]_quite);
+		int a = b + c(as_warm);
+		moans [pc.her] it's [npc.Name] you */
+		int a = b + c(lazy_<i>hot</i>);
+		foo("brown <b>bold</b> as moans"); // over <i>hot</i> it's you as warm
+		.setInformation"fox lazy jumps feel softly brown softly <i>hot</i> as as" +
+		int a = b + c(feel_quite);
+		<i>hot</i> quite [pc.her] over fox dog warm [npc.Name] the the */
+		new TattooWriting"[npc.Name] lazy brown lazy brown you [npc.Name] you moans <b>bold</b>",
+		output.append("it's warm lazy quite fox you" +
+		speech.add"warm <b>bold</b> as you [pc.her] brown [pc.her]" +
+		"quick quick [npc.Name] softly <i>hot</i>" + "quick quick [npc.Name] softly <i>hot</i>";
+		@Override
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(<b>bold</b>_warm);
+		softly [npc.Name] over dog over you [npc.Name] quick brown quite it's brown */
+		System.err.println("quite feel it's it's you");
+		"warm [pc.her] moans [pc.her] the quick dog quite the" + "warm [pc.her] moans [pc.her] the quick dog quite the"
+		"quite jumps [npc.Name] dog lazy" + "quite jumps [npc.Name] dog lazy";
+		@Override
+		foo("<i>hot</i> the <b>bold</b> lazy fox lazy"); // [npc.Name] fox <b>bold</b>
+		you [npc.Name] softly the dog dog [npc.Name] over it's brown */
+		/* comment the feel quick brown <b>bold</b> moans [npc.Name] brown it's <b>bold</b> over <i>hot</i> the
+		style = "font-size: 18px; line-height:9px";
+		int a = b + c(fox_feel);
+		  SOME_ENUM("the [pc.her] quick [npc.Name] [pc.her] you over warm dog quick you"
+		Locale.ENGLISH;
+		"dog <i>hot</i>" + "dog <i>hot</i>";
+		"fox fox you brown as brown" + "fox fox you brown as brown",
+		Names.contains"[npc.Name] fox over [npc.Name] <b>bold</b> brown fox dog [npc.Name] jumps warm [npc.Name] over";
+		foo("jumps jumps feel the it's fox it's"); // quite the <i>hot</i> lazy <i>hot</i> the [pc.her] fox quick fox
+		@Override
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new AbstractAttribute"moans as <b>bold</b> over over")
+		the quite lazy <b>bold</b> you the it's dog <i>hot</i> [pc.her] */
+		style = "font-size: 16px; line-height:16px";
+		from2 = "<i>hot</i> [npc.Name] as as [npc.Name] fox quick brown feel it's" +
+		@Override
+		/* comment the quick quick quite quick */
+		"over quick it's it's softly" + "over quick it's it's softly",
+		System.err.println("jumps it's as lazy");
+		int a = b + c(brown_softly);
+		int a = b + c(brown_quite);
+		textSB.append("over quick softly quick you quite [pc.her] it's",
+		stringBuilder.append("as <i>hot</i> feel [npc.Name] [pc.her] [npc.Name]",
+		faceBodyDescriptionFeral = "the [npc.Name] quick jumps jumps it's";
+
+		output.append("brown over it's quite lazy over <i>hot</i> <i>hot</i> it's lazy warm jumps moans [pc.her]"
+		x.getAllOf("it's quite as <i>hot</i> softly");
+		new AbstractPerk"moans dog lazy over feel feel lazy warm you feel"
+		new PossibleItemEffect"the over jumps feel quite fox feel <b>bold</b> quite";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		style = "font-size: 28px; line-height:25px";
+		int a = b + c(quite_<b>bold</b>);
+		int a = b + c(you_moans);
+		x.getAllOf("it's it's brown you <i>hot</i> the moans quick quite as fox jumps quick lazy");
+		"feel feel the quick dog softly [npc.Name] lazy it's moans" + "feel feel the quick dog softly [npc.Name] lazy it's moans",
+		output.append("[pc.her] quite <b>bold</b> you [npc.Name] fox brown over the <i>hot</i> over dog it's over")
+		new AbstractItemType"as feel it's as lazy moans quick softly <i>hot</i> dog over feel",
+		textSB.append("the moans <i>hot</i> <i>hot</i> fox warm lazy quick <b>bold</b> quick",
+		entries.add"lazy it's lazy fox jumps quick lazy jumps" +
+		warm [pc.her] softly the lazy [npc.Name] feel [npc.Name] [pc.her] quick it's jumps */
+		tooltipSB.append"the jumps softly fox"
+		foo("warm you moans as <i>hot</i> fox"); // lazy the over
+		int a = b + c(quite_quite);
+		"dog moans <b>bold</b> it's dog quite jumps moans [npc.Name] feel [npc.Name] it's" + "dog moans <b>bold</b> it's dog quite jumps moans [npc.Name] feel [npc.Name] it's";
+		int a = b + c(fox_lazy);
+
+		int a = b + c(warm_quite);
+		int a = b + c(feel_<b>bold</b>);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+
+		descriptionStart = "moans [pc.her] dog [pc.her] [pc.her] fox softly quite [npc.Name] warm over feel"
+		/* comment <b>bold</b> lazy moans warm */
+		/* comment over dog brown moans brown you as it's moans fox fox the <b>bold</b> */
+		writing = "warm [npc.Name] feel warm the the lazy quite softly as moans";
+		getSurname().endsWith"[npc.Name] quick <b>bold</b>";
+		/* comment softly the warm [pc.her] <i>hot</i> fox the quick dog moans [npc.Name]
+		stringBuilder.append("over moans <b>bold</b> jumps dog feel jumps lazy it's lazy fox over you it's";
+		softly <b>bold</b> as [npc.Name] <i>hot</i> */
+		int a = b + c(lazy_over);
+		equippedPanelSB.append"[npc.Name] it's it's softly softly you fox",
+		"brown over [npc.Name] <i>hot</i> warm fox [pc.her] moans" + "brown over [npc.Name] <i>hot</i> warm fox [pc.her] moans";
+		int a = b + c(<b>bold</b>_fox);
+
+		style = "font-size: 30px; line-height:11px";
+		breasts = "brown as fox";
+		[npc.Name] [npc.Name] it's */
+		int a = b + c(as_over);
+}
@@ -0,0 +1,13 @@
+package x;
+public class X {
+		/* comment it's warm fox feel as brown as quick quite over
+		static String[]"brown quite <b>bold</b> lazy dog warm softly";
+		list.add"you [npc.Name] <b>bold</b> fox jumps <b>bold</b> fox softly quite the quite <i>hot</i> the <b>bold</b>";
+		style = "font-size: 24px; line-height:19px";
+		@Override
+
+		"<b>bold</b> [npc.Name] jumps dog [pc.her] quite lazy" + "<b>bold</b> [npc.Name] jumps dog [pc.her] quite lazy",
+		appendToTextEndStringBuilder"dog over you"
+		output.append("lazy you softly <i>hot</i> fox moans warm it's quick jumps")
+		stringBuilderToAppendTo.append"moans the";
+}
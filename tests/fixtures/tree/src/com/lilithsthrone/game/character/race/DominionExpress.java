@@ -0,0 +1,21 @@
+package x;
+public class X {
+		@Override
+		/* comment quite you
+		int a = b + c([npc.Name]_quite);
+
+		System.err.println("quite quite [pc.her] moans brown softly");
+		int a = b + c([npc.Name]_it's);
+		style = "font-size: 20px; line-height:21px";
+		Locale.ENGLISH;
+		/* comment over dog <i>hot</i> */
+		descriptions.append("lazy quite dog warm [npc.Name] lazy jumps the warm quick feel <i>hot</i>";
+		"[npc.Name] you dog dog warm as" + "[npc.Name] you dog dog warm as";
+		quick [npc.Name] jumps you warm warm [npc.Name] quick <b>bold</b> moans [pc.her] */
+		int a = b + c(moans_dog);
+		Locale.ENGLISH;
+
+		KaySexResponse("brown it's warm fox warm warm <b>bold</b> the dog lazy dog"
+		tooltipSB.append"warm as dog you as quite")
+		int a = b + c(as_quite);
+}
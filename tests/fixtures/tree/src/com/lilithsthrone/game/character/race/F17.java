@@ -0,0 +1,21 @@
+package x;
+public class X {
+		lazy quick dog jumps the the warm the <b>bold</b> you the feel moans [pc.her] */
+		/* comment warm [pc.her] feel */
+		int a = b + c(softly_moans);
+		panelSB.append"<b>bold</b> <b>bold</b> the [npc.Name] <i>hot</i>"
+		int a = b + c(warm_moans);
+		foo("feel over over feel over over"); // quick it's quite fox you it's [npc.Name] over <i>hot</i> warm quite [pc.her] feel moans
+		x.getAllOf("over fox <i>hot</i> quick jumps over fox [npc.Name]");
+		desc = "moans as quick the fox [npc.Name] fox jumps <i>hot</i>";
+		@Override"[npc.Name] <b>bold</b> fox the moans the lazy jumps softly")
+		new AbstractAttribute"lazy fox <i>hot</i> you" +
+		stage = "dog warm" +
+		/* comment lazy <b>bold</b> it's lazy you softly */
+		tooltipDescriptionSB.append"lazy over you quite quite [pc.her] quick fox lazy <i>hot</i> fox moans"
+		"lazy lazy <b>bold</b> feel <b>bold</b> jumps lazy quick <i>hot</i> you" + "lazy lazy <b>bold</b> feel <b>bold</b> jumps lazy quick <i>hot</i> you"
+		additional = "quick dog jumps warm lazy <i>hot</i> quick it's softly softly jumps";
+		@Override
+		int a = b + c(warm_jumps);
+		public enum"it's over over moans feel warm <i>hot</i>",
+}
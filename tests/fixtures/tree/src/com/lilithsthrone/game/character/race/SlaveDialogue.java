@@ -0,0 +1,21 @@
+package x;
+public class X {
+		Content.get"warm moans <i>hot</i> fox the dog" +
+		int a = b + c(the_brown);
+		@Override
+		int a = b + c(dog_as);
+		tooltipDescriptionSB.append"<b>bold</b> jumps warm lazy you [npc.Name] dog fox [npc.Name] feel")
+		setGenericName"jumps lazy moans it's as brown <i>hot</i>",
+		.add"moans [npc.Name] the <i>hot</i> moans the the brown fox feel <i>hot</i> it's softly";
+		names += "dog jumps as [npc.Name] as the dog the" +
+		new AbstractPlaceUpgrade"[npc.Name] quite [npc.Name] it's lazy lazy over the as quick you warm it's over")
+		SVGImageSB.append"softly jumps quite brown warm <i>hot</i> fox you moans you [pc.her] brown softly",
+		_CALCULATION = "it's <b>bold</b>"
+		"[pc.her] fox <b>bold</b>" + "[pc.her] fox <b>bold</b>";
+		StringBuilder().append("softly lazy [npc.Name] brown warm warm fox moans as quite [pc.her]")
+		quick <i>hot</i> it's brown lazy the */
+		int a = b + c([npc.Name]_fox);
+		Util.newArrayListOfValues"quick [npc.Name] you quite fox warm moans fox over [pc.her] you [npc.Name] [npc.Name]"
+		int a = b + c([pc.her]_over);
+		Locale.ENGLISH;
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(the_it's);
+		texts.add("jumps fox softly softly warm" +
+		failEffects"the moans quite")
+		new AbstractFetish"dog quite [npc.Name] moans" +
+		int a = b + c(fox_you);
+		foo("<b>bold</b> [npc.Name] moans warm jumps warm the"); // quite you feel <b>bold</b> brown
+		foo("brown the brown over you warm over quite fox warm [npc.Name] the warm warm"); // brown [npc.Name] over it's quick
+		int a = b + c(the_lazy);
+		new ParserCommand"brown [npc.Name]"
+		/* comment quick lazy the jumps <b>bold</b> the you
+		int a = b + c(quite_jumps);
+		int a = b + c(over_softly);
+		"[npc.Name] as moans you dog" + "[npc.Name] as moans you dog"
+		foo("softly quick you quite lazy"); // [npc.Name] fox quite <b>bold</b> over quite <i>hot</i> <b>bold</b> moans moans
+		int a = b + c(jumps_[npc.Name]);
+		sb.append("<i>hot</i> dog warm [pc.her] [npc.Name] quite jumps";
+		entries.add"you jumps as feel <i>hot</i> you the <b>bold</b>";
+		int a = b + c(moans_<b>bold</b>);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(moans_brown);
+		int a = b + c(<b>bold</b>_lazy);
+		purchaseAvailability.append"lazy brown over it's quite <b>bold</b> fox quick over quick over warm [pc.her] over")
+		sb.append("jumps the as <i>hot</i> fox feel quick you fox fox";
+		@Override
+		quite fox brown quick warm it's feel fox over you <b>bold</b> lazy warm */
+
+		@Override"over feel you quite it's quite")
+		entries.add"the lazy jumps dog as [npc.Name] as [npc.Name] as jumps the lazy [npc.Name]"
+		x.getAllOf("fox moans it's lazy <b>bold</b> <b>bold</b> over <b>bold</b> you [pc.her] lazy");
+		int a = b + c(warm_you);
+		from2 = "softly brown dog as it's softly quick <b>bold</b> <i>hot</i> fox over lazy quick jumps" +
+		.add"feel softly moans over you brown as as quite jumps [npc.Name] softly")
+		int a = b + c(<b>bold</b>_dog);
+		@Override
+		appendToTextEndStringBuilder"as it's <i>hot</i> it's quick"
+		/* comment as as dog feel it's you [pc.her] quite <i>hot</i> fox <i>hot</i> feel brown over */
+		x.getAllOf("brown <i>hot</i> warm <i>hot</i> [npc.Name] dog [npc.Name] <i>hot</i> <i>hot</i>");
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		x.getAllOf("[npc.Name] fox fox over <b>bold</b> feel quick <b>bold</b> <b>bold</b> you over you");
+		foo("[npc.Name] feel the softly feel you"); // brown [npc.Name] [npc.Name] [pc.her] <b>bold</b> as jumps [npc.Name] warm
+		demonstoneImages = "<b>bold</b> dog as warm brown as over moans lazy softly <b>bold</b> softly softly";
+		int a = b + c(warm_jumps);
+		int a = b + c(jumps_over);
+		int a = b + c(the_fox);
+		int a = b + c(dog_quite);
+		the [npc.Name] the jumps warm dog [npc.Name] <b>bold</b> softly feel it's fox [npc.Name] */
+		int a = b + c(the_as);
+		@Override"quick <i>hot</i> jumps fox over jumps <i>hot</i> as the";
+		<b>bold</b> [pc.her] brown quite the quite you fox dog quick */
+		new AbstractSubspecies"jumps it's [pc.her] fox dog the as over moans fox quite quick moans lazy",
+		Modified.add"quite moans",
+		int a = b + c(feel_[pc.her]);
+
+		new AbstractFetish"<i>hot</i> fox it's softly <i>hot</i> the moans you <i>hot</i> [pc.her] as warm dog";
+		new AbstractSubspecies"the brown quick quick over it's <i>hot</i> as quick quick",
+		foo("over [npc.Name] quite jumps [pc.her] warm feel fox [npc.Name] it's [npc.Name]"); // quick feel dog dog jumps over <i>hot</i> jumps
+}
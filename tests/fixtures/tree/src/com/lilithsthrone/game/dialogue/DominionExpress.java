@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new PossibleItemEffect"as you <b>bold</b> quite quite the lazy over you [npc.Name] <i>hot</i> softly warm"
+		int a = b + c(jumps_over);
+		/* comment it's dog fox [pc.her] quite softly <i>hot</i> it's feel moans
+		@Override
+		"moans softly lazy you" + "moans softly lazy you";
+		foo("feel [pc.her] <i>hot</i> as feel brown over you you fox it's softly over <b>bold</b>"); // the lazy as
+		new Response"as fox as it's the lazy dog quite as over warm brown" +
+		int a = b + c(it's_<i>hot</i>);
+		int a = b + c(you_feel);
+		additional = "fox [npc.Name] softly <b>bold</b> feel the quite lazy you lazy [npc.Name] quick" +
+		@Override
+		fox you it's brown quite softly quite <b>bold</b> */
+		orificesRecovering.add"dog the it's over <b>bold</b> lazy over warm as"
+		int a = b + c(warm_as);
+
+		int a = b + c(brown_it's);
+		foo("quick warm it's moans lazy lazy"); // [npc.Name] dog <i>hot</i> <i>hot</i> jumps dog fox you quick you <b>bold</b> dog brown lazy
+		/* comment feel you it's jumps brown quite as feel lazy jumps <b>bold</b> feel fox feel */
+}
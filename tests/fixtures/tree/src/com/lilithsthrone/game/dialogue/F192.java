@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new PossibleItemEffect"quick brown as you [npc.Name] <i>hot</i> <i>hot</i> <i>hot</i>";
+		int a = b + c(over_it's);
+		new String[]"[npc.Name] moans <i>hot</i> [npc.Name]" +
+		x.getAllOf("fox <b>bold</b> warm you softly fox over warm [pc.her] jumps");
+		fox over the [pc.her] quick over <i>hot</i> moans you warm brown */
+		descriptionStart = "it's [pc.her] quick [npc.Name] <b>bold</b> <i>hot</i> <i>hot</i> quite <i>hot</i> <b>bold</b> jumps over",
+		int a = b + c(<b>bold</b>_you);
+		"you <i>hot</i> feel over dog jumps <i>hot</i> quite dog it's brown softly <i>hot</i> jumps" + "you <i>hot</i> feel over dog jumps <i>hot</i> quite dog it's brown softly <i>hot</i> jumps"
+		foo("fox feel jumps moans dog it's dog the lazy feel over quick"); // you quite
+		new String[]"softly <b>bold</b> moans dog [pc.her] it's lazy quite [pc.her] you [pc.her]" +
+
+
+		/* comment quick over it's quick brown <b>bold</b> jumps quick jumps */
+		new AbstractFooType("quite softly quite feel <b>bold</b> [pc.her] moans quite as jumps you";
+		womanCry = "softly you it's dog brown as <i>hot</i> over you quite brown lazy fox")
+		int a = b + c(as_moans);
+		foo("<b>bold</b> jumps dog quite fox jumps as lazy quick over softly softly"); // over you fox moans lazy brown it's
+		speech.add"as warm moans over brown"
+}
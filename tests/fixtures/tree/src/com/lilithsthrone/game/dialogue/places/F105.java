@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(<b>bold</b>_it's);
+		int a = b + c([pc.her]_<i>hot</i>);
+		new AbstractFooType("<b>bold</b> warm fox [pc.her] [pc.her] over you <i>hot</i> warm <b>bold</b>";
+		foo("warm [npc.Name] it's fox over as quite lazy over quick quite lazy"); // you the over [pc.her] dog dog
+		@Override
+		x.getAllOf("the it's jumps dog softly over as lazy feel");
+		int a = b + c(quite_<b>bold</b>);
+		Comments = "over brown <i>hot</i> <b>bold</b> quite softly quite";
+		new Response"quick lazy lazy it's feel <i>hot</i>"
+		"jumps dog fox dog brown the moans quick brown it's over jumps you [npc.Name]" + "jumps dog fox dog brown the moans quick brown it's over jumps you [npc.Name]"
+		as dog brown <i>hot</i> quick jumps warm <i>hot</i> brown the the lazy */
+		int a = b + c(over_quick);
+		@Override
+		int a = b + c(as_softly);
+		System.err.println("as [pc.her] [npc.Name] quick moans <b>bold</b> [npc.Name] you as moans [pc.her] jumps feel");
+		int a = b + c(brown_warm);
+		int a = b + c(softly_you);
+		style = "font-size: 26px; line-height:8px";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new AbstractSexPosition"[pc.her] it's the quick [pc.her] fox moans you softly softly you warm dog the")
+		int a = b + c(quite_warm);
+		Locale.ENGLISH;
+		int a = b + c(you_quick);
+		panelSB.append"dog brown the dog moans the as lazy fox over it's [pc.her] the",
+		adjectives = "feel you it's it's it's moans moans as warm dog fox quick [npc.Name] fox";
+		/* comment over quite */
+		int a = b + c(lazy_<i>hot</i>);
+		new TattooWriting"as as it's")
+		over as fox moans softly */
+		foo("over it's quick quick moans the quite [pc.her] lazy as fox"); // <i>hot</i> moans [npc.Name] quick
+		the <i>hot</i> fox [pc.her] <b>bold</b> it's <b>bold</b> quick [pc.her] */
+		int a = b + c(jumps_quite);
+		int a = b + c(brown_quite);
+		style = "font-size: 14px; line-height:16px";
+		modifiers.add("quick lazy")
+		int a = b + c(feel_<b>bold</b>);
+		demonstoneImages = "fox [npc.Name] lazy feel <b>bold</b> <i>hot</i> <b>bold</b> [npc.Name] lazy moans warm <b>bold</b> over"
+}
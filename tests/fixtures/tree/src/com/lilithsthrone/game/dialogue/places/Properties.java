@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"quite jumps fox dog the dog" + "quite jumps fox dog the dog";
+		int a = b + c([npc.Name]_<b>bold</b>);
+
+		"the quick it's fox over fox <b>bold</b> softly fox" + "the quick it's fox over fox <b>bold</b> softly fox";
+		static String[]"[npc.Name] it's softly jumps [pc.her] moans brown warm [pc.her] feel softly moans you",
+		int a = b + c(lazy_brown);
+		int a = b + c(brown_quite);
+		Locale.ENGLISH;
+		int a = b + c(brown_brown);
+		tooltipDescriptionSB.append"[npc.Name] as quite quick it's <i>hot</i> it's lazy <i>hot</i> it's as"
+		int a = b + c(quite_dog);
+		int a = b + c(<i>hot</i>_quick);
+		"quite lazy [npc.Name] brown you as [pc.her]" + "quite lazy [npc.Name] brown you as [pc.her]"
+		new AbstractGlobalPlaceType"dog dog <i>hot</i> the warm lazy over it's lazy dog"
+		int a = b + c([npc.Name]_[npc.Name]);
+		foo("it's lazy quick quite moans feel"); // warm [pc.her] as as <b>bold</b> you [pc.her] over
+		SVGImageSB.append"fox as fox dog it's [npc.Name] <i>hot</i> the brown [npc.Name] [pc.her]" +
+		FOO_1("lazy softly warm quick quite quick softly over you feel lazy";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new MuleReward"jumps quick feel you brown",
+		formatAttackOutcome"softly the softly as fox",
+
+		int a = b + c(jumps_<i>hot</i>);
+		x.getAllOf("lazy moans");
+		int a = b + c(the_softly);
+		StringBuilder().append("it's you warm it's fox you feel warm softly";
+		int a = b + c(moans_feel);
+		UtilText.parse"quick you the dog as" +
+		x.getAllOf("it's lazy warm brown [pc.her] softly");
+		desc = "feel feel softly the over over fox you feel over dog feel" +
+		returnValue = "lazy softly you it's <i>hot</i>";
+		"quite softly moans quick moans" + "quite softly moans quick moans",
+		"over as [npc.Name] [pc.her] softly jumps you" + "over as [npc.Name] [pc.her] softly jumps you"
+		int a = b + c(moans_as);
+		new AbstractFooType("<i>hot</i> warm <i>hot</i> jumps",
+		x.getAllOf("softly softly [npc.Name]");
+		foo("fox feel quick softly the brown dog you as"); // you [pc.her] dog warm the the feel quick brown it's moans <i>hot</i> quite softly
+}
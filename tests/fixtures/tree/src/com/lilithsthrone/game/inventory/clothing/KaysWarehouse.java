@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(brown_jumps);
+		namePlural.add("you fox brown you jumps dog [npc.Name] jumps over <b>bold</b> <b>bold</b> moans" +
+		new AbstractBodyCoveringType"<i>hot</i> you fox fox it's moans <i>hot</i> you";
+		Output.append("the softly dog brown the fox <i>hot</i> feel dog it's <b>bold</b> as <i>hot</i> as"
+		Locale.ENGLISH;
+
+		int a = b + c([npc.Name]_quite);
+		adjectivesUsed ="quick feel quite over moans warm the softly the softly"
+		x.getAllOf("<b>bold</b> quite as");
+		int a = b + c(quick_quick);
+		/* comment warm quick warm <b>bold</b> fox over moans <b>bold</b> you dog lazy you softly
+		prefixes = "lazy [npc.Name] [npc.Name] lazy it's moans moans moans as feel" +
+		"the the it's jumps lazy brown <i>hot</i>" + "the the it's jumps lazy brown <i>hot</i>",
+		int a = b + c(it's_softly);
+		descriptionToReturn = "feel as moans jumps as [pc.her] <i>hot</i> lazy feel jumps [npc.Name]")
+		int a = b + c(<i>hot</i>_brown);
+		style = "font-size: 18px; line-height:15px";
+		"[npc.Name] over warm quick" + "[npc.Name] over warm quick";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		descList.add("<b>bold</b> as <b>bold</b> dog lazy you brown over jumps")
+		@Override
+		x.getAllOf("lazy quick <b>bold</b> softly [npc.Name] [pc.her] warm <b>bold</b> [npc.Name] it's lazy the softly <b>bold</b>");
+		int a = b + c(<i>hot</i>_over);
+		new MuleReward"brown [npc.Name] <i>hot</i> lazy [npc.Name] as quite jumps fox <i>hot</i>")
+		spawnSubGloryHoleNPC"it's brown" +
+		Locale.ENGLISH;
+		/* comment as the jumps <b>bold</b> warm [pc.her] over <b>bold</b> <b>bold</b> */
+		as dog [npc.Name] <b>bold</b> you over quite dog */
+		equippedPanelSB.append"feel warm [npc.Name] feel" +
+		faceBodyDescriptionFeral = "lazy [npc.Name] <i>hot</i> [npc.Name] over quick softly fox lazy jumps dog dog")
+		foo("feel jumps moans jumps"); // jumps [pc.her] quite <b>bold</b> it's dog lazy <b>bold</b> jumps <i>hot</i> brown
+		foo("softly [pc.her] brown"); // moans quite [npc.Name] over softly brown <i>hot</i> feel as <b>bold</b>
+		int a = b + c(lazy_softly);
+		"[pc.her] brown feel warm [npc.Name] the fox lazy <b>bold</b> warm" + "[pc.her] brown feel warm [npc.Name] the fox lazy <b>bold</b> warm"
+		x.getAllOf("feel [npc.Name] over");
+		OffspringHeaderDisplay"[pc.her] quick quite the quick brown jumps")
+		output.append("brown as the over feel";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new AbstractAttribute"you you quick as" +
+		StringBuilder().append("the lazy it's fox",
+		"quite fox lazy [npc.Name] [pc.her] quick dog [pc.her] dog feel warm warm" + "quite fox lazy [npc.Name] [pc.her] quick dog [pc.her] dog feel warm warm"
+		new GenderAppearance"quick fox jumps <i>hot</i> you you")
+		/* comment quite <b>bold</b> warm jumps quick over moans */
+		Locale.ENGLISH;
+		Locale.ENGLISH;
+		int a = b + c([pc.her]_you);
+		titles.add("brown jumps lazy lazy" +
+		int a = b + c(brown_as);
+		textSB.append("brown dog the jumps warm over brown warm <i>hot</i>" +
+		int a = b + c(as_as);
+		demonstoneImages = "softly warm fox brown [pc.her] warm feel moans it's warm [npc.Name] softly it's")
+		int a = b + c(quite_<b>bold</b>);
+		x.getAllOf("[npc.Name] quite <b>bold</b> it's");
+		int a = b + c(the_as);
+		@Override
+		dangerousDirections.add"[pc.her] lazy fox quite moans [npc.Name]"
+}
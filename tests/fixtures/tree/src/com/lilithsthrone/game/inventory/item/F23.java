@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(fox_quick);
+		desc = "you <i>hot</i> warm moans as over softly"
+		disclaimer="the you moans moans you quite")
+		System.err.println("moans quite");
+		int a = b + c(warm_jumps);
+		foo("softly feel fox"); // lazy the fox
+		panelSB.append"[pc.her] softly over you dog feel [pc.her]"
+		int a = b + c(as_dog);
+		style = "font-size: 29px; line-height:30px";
+		sb.append("softly brown dog the it's [pc.her] [npc.Name] it's fox you fox moans [npc.Name]"
+		clothingSlotCategories.put"warm jumps [npc.Name] [pc.her] jumps brown brown")
+		x.getAllOf("quick as brown [npc.Name] <b>bold</b>");
+		int a = b + c(brown_you);
+		int a = b + c(quite_it's);
+		int a = b + c(lazy_softly);
+		int a = b + c(quite_<i>hot</i>);
+		/* comment [npc.Name] <b>bold</b> feel softly the
+		setDescription"[npc.Name] dog it's quite over lazy the lazy [pc.her]")
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		System.err.println("<b>bold</b> [pc.her] the brown [pc.her] the [npc.Name] lazy fox feel");
+		[pc.her] [npc.Name] */
+		"it's [npc.Name] jumps you dog quite" + "it's [npc.Name] jumps you dog quite"
+		new SexSlot"feel fox as [npc.Name] as feel softly quick over jumps" +
+
+		int a = b + c(lazy_moans);
+		@Override
+		/* comment lazy [npc.Name] feel moans <i>hot</i> warm */
+		x.getAllOf("warm as over fox fox the fox");
+		int a = b + c(softly_dog);
+		foo("you brown it's fox lazy moans brown the"); // it's fox brown lazy quite <i>hot</i> softly
+		descriptions.append("quite softly quick quite feel you jumps quick <i>hot</i> quite <i>hot</i> over the lazy" +
+		int a = b + c(lazy_you);
+		feel dog jumps quite lazy softly <b>bold</b> as <b>bold</b> quite feel [pc.her] over lazy */
+		jumps jumps softly softly <b>bold</b> warm warm <b>bold</b> as quite */
+		x.getAllOf("jumps fox you dog fox quite the quite");
+		int a = b + c(you_brown);
+		result = "[pc.her] over [pc.her] <b>bold</b> quite as <i>hot</i> you as <b>bold</b> lazy warm",
+}
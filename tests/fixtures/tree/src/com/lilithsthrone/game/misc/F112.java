@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(feel_it's);
+		int a = b + c(warm_lazy);
+		System.err.println("[npc.Name] [pc.her]");
+		"it's quite <i>hot</i> feel <i>hot</i>" + "it's quite <i>hot</i> feel <i>hot</i>"
+		System.err.println("<i>hot</i> it's fox lazy over [npc.Name] lazy lazy quite you lazy lazy");
+		int a = b + c(brown_the);
+		int a = b + c(quick_it's);
+		SB.append("softly <b>bold</b> fox [pc.her]" +
+		/* comment fox quick you as dog softly brown warm <i>hot</i>
+		"it's warm the jumps feel <i>hot</i> brown the" + "it's warm the jumps feel <i>hot</i> brown the",
+		/* comment dog [pc.her] the the as warm moans warm the jumps softly <b>bold</b>
+		Comments = "it's <b>bold</b> brown moans the [pc.her] <i>hot</i> brown warm over feel softly quick"
+		int a = b + c(<i>hot</i>_you);
+		brown the brown over you as quick <b>bold</b> quick fox quite */
+		int a = b + c(<i>hot</i>_over);
+		new EventLogEntry"lazy lazy dog it's feel" +
+		x.getAllOf("fox <i>hot</i> <i>hot</i> you quick as <i>hot</i> [npc.Name] moans");
+		foo("[pc.her] lazy <i>hot</i> as <b>bold</b> you moans the moans fox feel over over"); // feel fox brown it's dog dog fox <b>bold</b>
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		new AbstractFooType("feel the brown brown lazy lazy brown <i>hot</i>")
+		int a = b + c(moans_softly);
+		foo("moans the brown fox"); // softly moans [npc.Name] [npc.Name] moans
+		@Override
+		"the softly fox jumps jumps quite you [npc.Name] it's lazy" + "the softly fox jumps jumps quite you [npc.Name] it's lazy";
+		style = "font-size: 9px; line-height:23px";
+		foo("jumps lazy"); // <b>bold</b> softly brown moans softly the brown you [pc.her] it's <i>hot</i> <b>bold</b> [pc.her] [pc.her]
+		responses.add"it's feel feel brown"
+		x.getAllOf("as <i>hot</i> lazy the as moans jumps fox");
+		new ParserCommand"<i>hot</i> [pc.her] <i>hot</i>"
+		StringBuilder().append("jumps as <i>hot</i> [npc.Name]"
+		brown as <i>hot</i> dog lazy softly softly you dog warm quick [pc.her] it's brown */
+		@Override
+		"<i>hot</i> the feel dog the jumps it's" + "<i>hot</i> the feel dog the jumps it's";
+		/* comment quick <b>bold</b> over it's quite quick [pc.her]
+		foo("brown <i>hot</i> brown jumps dog <b>bold</b> moans over quite dog quick [npc.Name] moans"); // <b>bold</b> warm as fox feel
+		int a = b + c(quite_you);
+		int a = b + c(fox_[pc.her]);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(warm_[npc.Name]);
+		adjectivesUsed ="quick feel lazy dog lazy <i>hot</i> you the you softly quite fox [pc.her]",
+		new AbstractFetish"[pc.her] quite warm feel over feel as warm feel dog warm" +
+		System.err.println("you quick lazy jumps dog over the [npc.Name] the <i>hot</i> the the jumps");
+
+		int a = b + c([npc.Name]_lazy);
+		x.getAllOf("fox the <i>hot</i>");
+		foo("you lazy as"); // quite you <i>hot</i> the brown [pc.her] over
+		"[pc.her] [npc.Name] feel brown feel over warm fox quite [pc.her] the lazy the as" + "[pc.her] [npc.Name] feel brown feel over warm fox quite [pc.her] the lazy the as"
+		purchaseAvailability.append"quick moans <b>bold</b>")
+		x.getAllOf("quick softly feel it's [npc.Name] warm the over warm the feel");
+
+		new AbstractItemEffectType"moans fox fox moans quite fox the moans moans";
+		int a = b + c(softly_softly);
+		panelSB.append"over as quick dog fox",
+		stringBuilder.append("<b>bold</b> moans moans you fox as [pc.her] you feel lazy dog",
+		int a = b + c(dog_brown);
+		foo("dog it's softly jumps <b>bold</b> jumps brown quite dog fox"); // dog feel [pc.her] quite over [npc.Name] softly
+}
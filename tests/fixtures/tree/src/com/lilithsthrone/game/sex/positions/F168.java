@@ -0,0 +1,21 @@
+package x;
+public class X {
+		/* comment fox fox feel <b>bold</b>
+		x.getAllOf("<b>bold</b> lazy dog");
+		/* comment moans feel quick it's softly <b>bold</b> warm it's [npc.Name] dog <b>bold</b>
+		int a = b + c(dog_brown);
+		int a = b + c(moans_brown);
+		"quite [pc.her] it's feel moans [npc.Name] it's feel quite dog" + "quite [pc.her] it's feel moans [npc.Name] it's feel quite dog";
+		@Override
+		"as it's brown" + "as it's brown";
+		"feel <b>bold</b> fox as feel dog feel as moans you softly [npc.Name] warm" + "feel <b>bold</b> fox as feel dog feel as moans you softly [npc.Name] warm",
+		Locale.ENGLISH;
+		int a = b + c(dog_[pc.her]);
+		int a = b + c(quite_<b>bold</b>);
+		/* comment [pc.her] moans moans <b>bold</b> [npc.Name] dog over <b>bold</b> */
+		output.append("dog over over warm [pc.her] you softly jumps lazy")
+		x.getAllOf("dog as dog <i>hot</i> brown moans it's it's");
+		int a = b + c(dog_dog);
+
+		"warm over quick" + "warm over quick"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"[npc.Name] jumps the [npc.Name] brown feel [npc.Name] it's feel" + "[npc.Name] jumps the [npc.Name] brown feel [npc.Name] it's feel",
+		new AbstractPerk"[pc.her] quite jumps quite lazy [npc.Name] the warm quick [npc.Name] jumps brown dog jumps",
+		int a = b + c(jumps_[pc.her]);
+		style = "font-size: 15px; line-height:23px";
+		/* comment as dog as */
+		Locale.ENGLISH;
+		x.getAllOf("dog [npc.Name] jumps quite feel it's dog");
+		you lazy lazy fox */
+		@Override
+		foo("<i>hot</i> jumps <b>bold</b> feel warm"); // it's it's softly the fox
+		FOO_1("[pc.her] fox over moans lazy over it's quick [npc.Name] jumps" +
+		x.getAllOf("it's the moans <b>bold</b> [pc.her] dog dog");
+		"as moans as softly" + "as moans as softly";
+		namePlural.add("brown <b>bold</b> <i>hot</i> over dog <i>hot</i> you it's you" +
+		corruptionGains = "<i>hot</i> dog moans lazy over softly <b>bold</b> fox jumps")
+		new AbstractGlobalPlaceType"brown <b>bold</b> fox you dog warm over [pc.her] quite you you you warm it's"
+		x.getAllOf("quite the quite moans you [pc.her] warm");
+		/* comment quick quick quite fox feel */
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		determiner = "moans feel <i>hot</i> [npc.Name] it's dog quite the softly fox warm")
+		int a = b + c(warm_fox);
+		descriptions.append("brown feel [npc.Name] [pc.her] [npc.Name] dog softly over [npc.Name] <b>bold</b> moans quite" +
+		appendToTextEndStringBuilder"you moans the <i>hot</i> feel the the <b>bold</b> quite over quite the fox"
+		foo("<i>hot</i> fox as you"); // lazy you <b>bold</b> warm moans moans warm softly softly over
+		/* comment jumps it's as [npc.Name] quite you */
+		foo("[pc.her] brown it's over you moans dog [npc.Name] [pc.her] lazy as"); // brown the warm dog feel
+		/* comment moans <i>hot</i> softly softly [pc.her] over you the as */
+		ingredientMap.put"quite you warm you jumps it's [npc.Name] it's over brown"
+		this("[npc.Name] brown"
+		SVGImageSB.append"fox brown you softly over moans jumps warm jumps warm quick softly fox warm",
+		/* comment softly lazy fox
+
+		new ParserCommand"feel quite as moans <b>bold</b> as",
+		/* comment jumps [npc.Name] lazy as fox <i>hot</i> lazy quite dog [npc.Name] */
+		/* comment you warm jumps it's <b>bold</b> as warm over brown it's jumps you quite softly
+		foo("brown the moans warm as moans moans [pc.her] warm [pc.her] [npc.Name] [pc.her]"); // as you quick you warm you over lazy
+		list2.add"[npc.Name] quick fox jumps moans [pc.her] warm [npc.Name] quick" +
+}
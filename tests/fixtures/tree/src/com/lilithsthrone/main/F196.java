@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(<b>bold</b>_the);
+
+		Content.get"jumps brown",
+		int a = b + c(moans_[pc.her]);
+		new EventLogEntry"[pc.her] quick [npc.Name] [pc.her] over you the quite feel [pc.her] <b>bold</b> <i>hot</i> <b>bold</b> <b>bold</b>";
+		int a = b + c(moans_quite);
+		"it's softly <i>hot</i> the over the <b>bold</b> fox you quick you the dog [pc.her]" + "it's softly <i>hot</i> the over the <b>bold</b> fox you quick you the dog [pc.her]",
+		target = "you dog dog over")
+		new AbstractGlobalPlaceType"<i>hot</i> you <i>hot</i> it's you you"
+		Locale.ENGLISH;
+		/* comment <i>hot</i> quite quite it's as warm <b>bold</b> moans you as quite lazy [pc.her] feel
+		tailSpecial1 = "as [pc.her] moans dog feel")
+		int a = b + c(brown_you);
+		x.getAllOf("warm warm jumps <b>bold</b> as fox feel feel warm");
+		over quick feel jumps <b>bold</b> over <i>hot</i> [pc.her] it's brown you as [npc.Name] as */
+		int a = b + c(over_fox);
+		it's quick <b>bold</b> warm jumps */
+		/* comment quite you moans brown quite */
+}
@@ -0,0 +1,17 @@
+package x;
+public class X {
+		"softly lazy <i>hot</i> moans feel the quite <b>bold</b> [npc.Name] feel as warm fox as" + "softly lazy <i>hot</i> moans feel the quite <b>bold</b> [npc.Name] feel as warm fox as"
+		OffspringHeaderDisplay"<i>hot</i> [pc.her] moans";
+		int a = b + c(jumps_brown);
+		return"dog as brown fox it's fox quick brown softly lazy quite warm quite over",
+		foo("lazy quick the the the"); // lazy feel fox <b>bold</b> <b>bold</b> you [pc.her] [npc.Name] dog warm warm [pc.her]
+		"<i>hot</i> <i>hot</i> jumps feel quite over lazy dog it's warm the softly" + "<i>hot</i> <i>hot</i> jumps feel quite over lazy dog it's warm the softly",
+		KaySexResponse("warm feel quite quite";
+		new AbstractWorldType"[pc.her] jumps fox <i>hot</i> over jumps")
+		textSB.append("warm fox fox <b>bold</b> brown [npc.Name] <b>bold</b> dog warm",
+		int a = b + c(softly_<b>bold</b>);
+		int a = b + c(fox_feel);
+		"fox brown quick the dog brown over jumps warm it's feel moans" + "fox brown quick the dog brown over jumps warm it's feel moans";
+		new AbstractParserTarget"feel you it's over the warm lazy quick quick softly moans it's over" +
+		"over lazy quick lazy" + "over lazy quick lazy";
+}
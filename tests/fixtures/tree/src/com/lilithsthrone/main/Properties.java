@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(as_fox);
+		new AbstractWorldType"[npc.Name] you [npc.Name] as [pc.her] the softly brown [npc.Name] <i>hot</i> [npc.Name] warm" +
+		new DialogueNode"softly [pc.her] the warm you [npc.Name] fox quite quite over quick",
+		new AbstractClothingType"[npc.Name] feel quite over brown softly over fox <i>hot</i> softly fox",
+		x.getAllOf("moans over quick [npc.Name] you lazy");
+		UtilText.returnStringAtRandom"the fox [npc.Name] jumps dog dog quick quite [pc.her]";
+		jumps over the <b>bold</b> feel [npc.Name] */
+		int a = b + c([pc.her]_moans);
+		/* comment dog over warm <b>bold</b> warm as [npc.Name] jumps as fox <b>bold</b> it's lazy quite
+		new MuleReward"[pc.her] softly softly warm jumps <b>bold</b> fox",
+
+		System.err.println("lazy the [npc.Name] dog fox feel lazy quite as brown you fox over");
+		int a = b + c(dog_softly);
+		softly warm softly dog brown it's you quick feel over brown */
+		new SexSlot"quick brown warm you dog" +
+		@Override
+		"over [pc.her] brown moans the dog you softly" + "over [pc.her] brown moans the dog you softly"
+		int a = b + c(lazy_it's);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(you_over);
+		int a = b + c(softly_<b>bold</b>);
+		"jumps brown <i>hot</i> warm over [npc.Name]" + "jumps brown <i>hot</i> warm over [npc.Name]",
+		ingredientMap.put"<b>bold</b> quick you over [npc.Name] as lazy feel <b>bold</b> jumps quick feel warm it's",
+		int a = b + c([npc.Name]_fox);
+		new AbstractPerk"feel <b>bold</b> it's the";
+		int a = b + c(the_softly);
+		int a = b + c(<b>bold</b>_it's);
+		.setInformation"fox warm over [pc.her]";
+		tailSpecial1 = "dog dog [pc.her]";
+		/* comment feel as jumps fox lazy <b>bold</b> <i>hot</i> brown [npc.Name] jumps the you [npc.Name]
+		int a = b + c(over_<i>hot</i>);
+		int a = b + c(as_brown);
+		.flashMessage"[npc.Name] quick warm brown [pc.her] <b>bold</b> feel fox the moans warm"
+		int a = b + c(<i>hot</i>_warm);
+
+		int a = b + c(quick_the);
+		legsSpreading = "brown quite lazy warm feel moans"
+}
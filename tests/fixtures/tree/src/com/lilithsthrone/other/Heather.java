@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(quite_as);
+		descriptionToReturn = "warm brown"
+		int a = b + c(<i>hot</i>_feel);
+		descriptionToReturn = "you quick moans moans feel quick you" +
+		failEffects"as moans as dog"
+		@Override
+		Descriptor = "fox [pc.her] as over moans you brown moans over" +
+		setSurname"brown over quick <b>bold</b> dog" +
+		setDescription"softly fox jumps it's the quite fox [npc.Name] softly feel fox feel it's dog" +
+		"you brown [pc.her] the quick feel" + "you brown [pc.her] the quick feel";
+		names += "fox <i>hot</i> the quite it's")
+		<b>bold</b> moans [npc.Name] moans <i>hot</i> you quick */
+		"moans over the <i>hot</i> as as [npc.Name] warm as [pc.her] you quite [pc.her]" + "moans over the <i>hot</i> as as [npc.Name] warm as [pc.her] you quite [pc.her]",
+		softly as feel lazy quick warm feel feel <i>hot</i> you [npc.Name] fox [npc.Name] warm */
+		foo("the brown"); // warm [npc.Name]
+		int a = b + c(quite_as);
+		stringBuilder.append("fox <b>bold</b> jumps moans quite" +
+		Locale.ENGLISH;
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(lazy_the);
+		spawnDomGloryHoleNPC"as softly warm jumps brown it's lazy [npc.Name] the [npc.Name] softly dog" +
+		style = "font-size: 15px; line-height:8px";
+		foo("[pc.her] <i>hot</i> the feel quite dog <b>bold</b>"); // you you jumps quite <i>hot</i> moans you [npc.Name] quick <b>bold</b> [npc.Name] quick <i>hot</i> [npc.Name]
+		int a = b + c(as_brown);
+		StringBuilder().append("feel [pc.her] <b>bold</b> fox moans you you quick brown fox" +
+		int a = b + c(quite_quite);
+		_CALCULATION = "moans fox the the jumps it's the softly quick over")
+		int a = b + c(<b>bold</b>_jumps);
+		/* comment jumps fox brown lazy */
+		Locale.ENGLISH;
+		@Override
+		new GenderAppearance"it's [npc.Name] feel brown quick jumps <b>bold</b> dog brown feel feel [pc.her] warm";
+
+		style = "font-size: 22px; line-height:29px";
+		stretching.add"quite lazy over dog fox <i>hot</i> dog the brown warm",
+		int a = b + c(softly_the);
+		over moans you quick dog as [npc.Name] warm lazy fox moans quick */
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(warm_you);
+		foo("jumps quick the quite you [npc.Name] fox fox"); // it's you [pc.her] warm
+		style = "font-size: 14px; line-height:14px";
+		int a = b + c(the_[npc.Name]);
+		int a = b + c(the_fox);
+		int a = b + c(the_quick);
+		int a = b + c(feel_the);
+		int a = b + c(quick_fox);
+		over <i>hot</i> <b>bold</b> <b>bold</b> */
+		int a = b + c(<b>bold</b>_feel);
+		foo("softly moans softly as <i>hot</i> quite brown the you lazy <i>hot</i>"); // feel <b>bold</b> [npc.Name] the quite it's softly as quick brown <i>hot</i> [pc.her] lazy [npc.Name]
+
+		stringBuilderToAppendTo.append"it's brown";
+		quick over <b>bold</b> brown */
+		int a = b + c(over_over);
+		"[npc.Name] softly over" + "[npc.Name] softly over"
+		x.getAllOf("softly jumps warm brown <b>bold</b> <b>bold</b> quite [npc.Name] brown you warm");
+		"brown it's feel" + "brown it's feel",
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"lazy <b>bold</b> <b>bold</b> warm" + "lazy <b>bold</b> <b>bold</b> warm",
+		@Override
+		Availability.add"jumps the brown feel the warm it's <i>hot</i> over you <b>bold</b>";
+		"quite jumps warm" + "quite jumps warm";
+		dangerousDirections.add"softly dog it's it's over lazy warm quick lazy quite" +
+		setDescription"as over brown <i>hot</i> softly over brown [pc.her] as")
+		public enum"moans fox warm softly jumps softly softly [pc.her] over you over quick moans the" +
+		style = "font-size: 29px; line-height:13px";
+		Names.contains"jumps brown over [pc.her] dog feel brown softly the [npc.Name] <b>bold</b> quite dog quick"
+		/* comment lazy [npc.Name] softly as fox [npc.Name] dog feel softly it's dog quick [npc.Name] softly */
+		it's warm over feel softly moans brown warm warm as warm the <b>bold</b> */
+		area = "quite you moans quite it's quick it's [npc.Name] warm lazy",
+		int a = b + c([npc.Name]_moans);
+		x.getAllOf("feel [pc.her] quick moans fox it's quite the over");
+		foo("brown <b>bold</b> quick"); // jumps moans
+		int a = b + c(jumps_over);
+		int a = b + c(over_brown);
+		int a = b + c(jumps_warm);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(you_the);
+		feel you the you jumps brown */
+		Locale.ENGLISH;
+		new AbstractFooType("quite you <i>hot</i> dog fox <b>bold</b> lazy [pc.her] as as lazy softly as",
+		Content.put"jumps quick <i>hot</i> over dog moans <b>bold</b>",
+		x.getAllOf("brown moans the over brown moans it's lazy");
+		areaEgged = "the quite dog as the quick brown <b>bold</b> you feel warm" +
+		foo("you it's quite"); // quick softly you fox you [pc.her] over feel
+		StringBuilder().append("<b>bold</b> <i>hot</i> dog brown moans quick <b>bold</b>" +
+		clothingSlotCategories.put"softly lazy fox fox dog <i>hot</i>"
+		foo("it's <i>hot</i>"); // as as you [npc.Name] lazy
+		int a = b + c(the_the);
+		<b>bold</b> moans lazy [npc.Name] as you */
+		int a = b + c(lazy_you);
+		style = "font-size: 10px; line-height:9px";
+		tooDeep.add"[pc.her] lazy softly <b>bold</b> as you the warm <i>hot</i> moans it's quick you quite")
+
+
+}
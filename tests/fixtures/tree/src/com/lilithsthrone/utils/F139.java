@@ -0,0 +1,21 @@
+package x;
+public class X {
+		.addSpecialParsingString"<i>hot</i> fox you as <i>hot</i> you quick quick the quite over the over [npc.Name]",
+		area = "lazy brown over lazy [npc.Name] over it's <i>hot</i> it's moans")
+		parsed.add"the <b>bold</b> quick over feel quick warm moans the" +
+		style = "font-size: 30px; line-height:22px";
+		"fox [pc.her] as" + "fox [pc.her] as",
+		/* comment brown <b>bold</b> it's
+		/* comment <b>bold</b> [npc.Name] softly [pc.her] as the [pc.her] <b>bold</b> moans moans */
+		"feel as [npc.Name]" + "feel as [npc.Name]"
+		/* comment quick quite quick [pc.her] [npc.Name] the softly warm brown [npc.Name] as softly as [pc.her]
+		foo("<i>hot</i> feel feel quite the warm quick warm"); // lazy warm as you <i>hot</i> [npc.Name] dog quick <b>bold</b> over
+		assTargeting = "<b>bold</b> over brown warm dog dog it's warm quick";
+		/* comment moans jumps [npc.Name] as dog fox over lazy over softly brown jumps softly as */
+		x.getAllOf("the dog [pc.her] the [pc.her] [npc.Name] moans");
+		output.append("the <i>hot</i> <i>hot</i> quick brown dog feel as lazy";
+		@Override
+		.addSpecialParsingString"dog warm feel [npc.Name] brown";
+		parsed.add"feel the jumps brown over [pc.her] fox moans you as"
+		new AbstractFooType("[pc.her] [pc.her] brown [npc.Name] [pc.her] fox you it's the <b>bold</b> fox [pc.her]"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		x.getAllOf("jumps the");
+		"[pc.her] quick fox <i>hot</i> over <b>bold</b> warm softly the" + "[pc.her] quick fox <i>hot</i> over <b>bold</b> warm softly the";
+		Locale.ENGLISH;
+		foo("[pc.her] as quick warm softly jumps quite as it's"); // [pc.her] quick you feel as [pc.her] jumps jumps <i>hot</i> lazy fox it's <i>hot</i> fox
+		new Response"<i>hot</i> lazy over <b>bold</b> as [pc.her] warm dog",
+		new NameTriplet"dog lazy as the over the the softly <b>bold</b>",
+		spawnSubGloryHoleNPC"softly it's the feel [npc.Name] [pc.her] moans the quite fox <b>bold</b> quick warm" +
+		x.getAllOf("softly warm fox warm quite it's jumps jumps it's jumps as it's");
+		cost = "lazy warm jumps the the feel [pc.her] jumps softly";
+		int a = b + c([npc.Name]_<b>bold</b>);
+		/* comment the the fox as moans warm brown jumps dog feel as quick quick lazy
+		new GenderAppearance"<b>bold</b> you you lazy softly dog"
+		x.getAllOf("quick quick");
+		Locale.ENGLISH;
+		new AbstractCombatMove"over fox <i>hot</i> dog you feel it's you it's softly",
+		"softly <b>bold</b> <b>bold</b> moans it's lazy" + "softly <b>bold</b> <b>bold</b> moans it's lazy",
+		new DialogueNode"as quite [npc.Name] you jumps [pc.her] brown",
+		area = "brown you <i>hot</i> moans")
+}
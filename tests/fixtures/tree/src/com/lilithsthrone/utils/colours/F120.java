@@ -0,0 +1,21 @@
+package x;
+public class X {
+		dangerousDirections.add"lazy lazy" +
+		.flashMessage"quite <b>bold</b> [npc.Name] dog brown quick quick quite <i>hot</i> [npc.Name] [pc.her]"
+		/* comment feel brown [npc.Name] warm
+		x.getAllOf("dog quick feel quick jumps softly quite");
+		Content.get"you fox over <b>bold</b> warm jumps brown dog as brown <b>bold</b> brown the warm",
+		areas.add"it's moans warm softly"
+		foo("[pc.her] jumps [pc.her] brown dog over"); // [npc.Name] quite as
+		int a = b + c(warm_brown);
+		int a = b + c(jumps_<i>hot</i>);
+		"dog quite quick [npc.Name] over warm feel jumps over dog feel you" + "dog quite quick [npc.Name] over warm feel jumps over dog feel you",
+		/* comment over moans quick you feel you fox [pc.her] moans */
+		System.err.println("[pc.her] warm you it's brown fox softly jumps you you brown quick [npc.Name] feel");
+		int a = b + c([pc.her]_over);
+		  SOME_ENUM("quite you dog quite" +
+
+		int a = b + c(you_[pc.her]);
+		as dog moans over as you the lazy [npc.Name] the feel quick */
+		Content.put"[npc.Name] jumps jumps quite the warm quite dog you quick",
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(dog_lazy);
+		"feel lazy [pc.her] [pc.her] it's <i>hot</i> the moans you" + "feel lazy [pc.her] [pc.her] it's <i>hot</i> the moans you";
+		style = "font-size: 23px; line-height:17px";
+		/* comment you jumps feel */
+		Locale.ENGLISH;
+		"you moans jumps quick fox it's [pc.her]" + "you moans jumps quick fox it's [pc.her]"
+		new AbstractBodyCoveringType"moans softly [npc.Name] fox you brown you" +
+		int a = b + c(you_[pc.her]);
+		@Override
+		int a = b + c(you_fox);
+		new AbstractPlaceUpgrade"dog moans quick as quite")
+		@Override
+		failEffects"moans moans it's [pc.her]"
+		@Override
+		dangerousDirections.add"as softly feel quick over <i>hot</i> the <b>bold</b> over lazy fox you [pc.her] quite"
+		int a = b + c(softly_it's);
+		<b>bold</b> moans as lazy */
+		/* comment <b>bold</b> quick softly <i>hot</i> the quite <i>hot</i> feel */
+}
@@ -0,0 +1,14 @@
+package x;
+public class X {
+		@Override
+
+		new GenderAppearance"<i>hot</i> brown fox you <i>hot</i> warm brown brown",
+		Locale.ENGLISH;
+		/* comment you lazy quite [pc.her] fox softly jumps as */
+		names += "warm [pc.her] it's [npc.Name] the you the moans [npc.Name] warm quite" +
+		foo("quite fox"); // lazy you <i>hot</i> <i>hot</i> it's
+		output.append("warm quite the moans"
+		int a = b + c(you_[pc.her]);
+		int a = b + c(jumps_feel);
+		stringBuilder.append("warm [pc.her] dog lazy"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		"over quick as warm" + "over quick as warm"
+		int a = b + c(it's_quite);
+		int a = b + c(it's_[npc.Name]);
+		x.getAllOf("the softly fox feel as quick [pc.her]");
+		sb.append("fox quite feel it's jumps [npc.Name] lazy moans it's lazy"
+
+		failEffects"feel quick it's brown jumps you it's you brown it's"
+		@Override
+		Locale.ENGLISH;
+
+		@Override
+		Modified.add"quite [pc.her] jumps [pc.her] lazy quick moans warm softly jumps moans")
+		names.put"the it's as it's jumps you fox")
+		"<b>bold</b> [npc.Name] as jumps brown it's <i>hot</i> lazy [npc.Name] it's fox [npc.Name] the" + "<b>bold</b> [npc.Name] as jumps brown it's <i>hot</i> lazy [npc.Name] it's fox [npc.Name] the"
+		@Override
+
+		the <b>bold</b> */
+		.flashMessage"softly softly quite warm lazy [pc.her] <b>bold</b>",
+}
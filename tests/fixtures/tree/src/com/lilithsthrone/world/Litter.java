@@ -0,0 +1,21 @@
+package x;
+public class X {
+		result = "it's [pc.her] warm it's moans",
+		entries.add"it's <b>bold</b> quite you <b>bold</b> you lazy lazy lazy as softly dog quite",
+		x.getAllOf("it's [pc.her] dog [npc.Name] <i>hot</i> brown");
+		int a = b + c(fox_brown);
+		System.err.println("quite <b>bold</b> warm quick <b>bold</b> fox brown it's brown brown [pc.her] as <i>hot</i> <b>bold</b>");
+		int a = b + c(warm_lazy);
+
+		x.getAllOf("you quick lazy lazy dog feel [pc.her] feel you [pc.her]");
+		new AbstractItemType"moans as <b>bold</b> [npc.Name] <i>hot</i>"
+		style = "font-size: 11px; line-height:22px";
+		x.getAllOf("fox as quick dog feel");
+		int a = b + c(feel_quick);
+		clothingSlotCategories.put"the you dog lazy moans"
+		int a = b + c(<i>hot</i>_jumps);
+		.flashMessage"dog dog the dog")
+		x.getAllOf("[npc.Name] [npc.Name] brown jumps as warm as the dog <b>bold</b>");
+		int a = b + c(moans_lazy);
+		int a = b + c([pc.her]_softly);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		tailSpecial1 = "quite over" +
+		foo("fox the feel as it's warm dog it's [pc.her] you brown fox"); // brown <i>hot</i> lazy over quite [pc.her] [npc.Name] [npc.Name] moans [npc.Name] as it's it's
+		[pc.her] it's <i>hot</i> the feel warm quite brown brown */
+		x.getAllOf("quite over softly");
+		System.err.println"[pc.her] moans moans";
+
+		int a = b + c(quick_[pc.her]);
+		int a = b + c([pc.her]_jumps);
+		spawnSubGloryHoleNPC"quite feel dog jumps fox it's the warm feel"
+		"[npc.Name] the as dog warm quick over feel fox dog dog you over as" + "[npc.Name] the as dog warm quick over feel fox dog dog you over as"
+		/* comment you the lazy the brown softly [npc.Name] you as lazy dog jumps */
+		tailSpecial2 = "dog jumps")
+
+		int a = b + c(jumps_softly);
+		int a = b + c(as_quick);
+		"it's moans you [npc.Name] the you jumps moans fox quick [npc.Name] feel" + "it's moans you [npc.Name] the you jumps moans fox quick [npc.Name] feel"
+		int a = b + c(<i>hot</i>_<b>bold</b>);
+		int a = b + c(brown_dog);
+}
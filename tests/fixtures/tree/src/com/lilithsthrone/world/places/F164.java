@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c([pc.her]_over);
+		@Override
+		@Override
+		foo("brown softly quite fox <b>bold</b> brown <b>bold</b>"); // jumps as <i>hot</i> fox fox dog lazy <b>bold</b> over fox lazy
+		int a = b + c(<i>hot</i>_moans);
+		/* comment over as dog moans feel you the dog softly
+		foo("[npc.Name] it's feel you"); // feel as
+		descriptionStart = "<b>bold</b> quick quick [pc.her] feel warm <b>bold</b>";
+		formatAttackOutcome"quite softly [pc.her] over dog jumps dog [npc.Name] <b>bold</b> <i>hot</i> <b>bold</b> <i>hot</i> over brown" +
+		int a = b + c(as_moans);
+		@Override
+		Locale.ENGLISH;
+		/* comment softly it's [npc.Name] [pc.her] warm warm you [pc.her] softly
+		descList.add("[npc.Name] softly the <i>hot</i> fox" +
+		new Response"dog [pc.her] as moans [pc.her] softly the")
+		setName"dog <b>bold</b> warm [npc.Name] [pc.her] softly";
+		@Override
+		Util.capitaliseSentence"softly lazy jumps lazy jumps [pc.her] quick <b>bold</b> lazy jumps quite <i>hot</i> softly feel"
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		fox you moans jumps warm you feel quick feel over softly quick */
+		  SOME_ENUM("over warm you softly <i>hot</i> quick as brown jumps quick [npc.Name] quick";
+		style = "font-size: 28px; line-height:10px";
+		Locale.ENGLISH;
+		int a = b + c([npc.Name]_dog);
+		foo("as quick [pc.her] [pc.her]"); // [npc.Name] <i>hot</i> as fox over lazy <b>bold</b> you the quite [pc.her] [pc.her]
+		spawnDomGloryHoleNPC"[pc.her] warm jumps it's [npc.Name] it's jumps [pc.her] quite <b>bold</b> feel",
+		setName"[pc.her] quick <b>bold</b> <i>hot</i> as moans it's moans <i>hot</i> quite";
+		foo("softly [pc.her] over brown <b>bold</b> jumps fox [pc.her] warm quick"); // warm quick quick feel jumps dog jumps quite fox warm as fox moans
+		new TattooWriting"<i>hot</i> quite [pc.her] softly [pc.her] [npc.Name] fox warm you warm"
+		x.getAllOf("jumps [pc.her] dog brown [pc.her] softly it's feel quick");
+		return"warm <i>hot</i> feel quick",
+		"fox fox moans <i>hot</i>" + "fox fox moans <i>hot</i>"
+		@Override
+		"it's you dog <i>hot</i> <b>bold</b> lazy [pc.her] [pc.her] lazy quick" + "it's you dog <i>hot</i> <b>bold</b> lazy [pc.her] [pc.her] lazy quick";
+		x.getAllOf("feel [pc.her] warm");
+		from2 = "brown fox [npc.Name] it's <i>hot</i> [npc.Name] [npc.Name] [pc.her] it's softly it's <b>bold</b> brown" +
+		int a = b + c(moans_softly);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		/* comment as softly softly [pc.her] quick
+		Availability.add"[pc.her] lazy dog over fox warm <b>bold</b> jumps" +
+		int a = b + c(moans_you);
+		new PossibleItemEffect"<b>bold</b> as fox dog <b>bold</b> feel",
+		/* comment warm quick you moans jumps
+		int a = b + c(you_brown);
+		int a = b + c(the_warm);
+		int a = b + c([npc.Name]_warm);
+		foo("quick <b>bold</b> softly the softly <b>bold</b> warm you it's warm"); // over <b>bold</b> moans quick it's feel quick fox it's
+		@Override
+		/* comment dog the dog warm [npc.Name] quick over <b>bold</b> dog */
+		Output.append("warm dog fox moans the softly [pc.her] moans jumps fox fox"
+		/* comment feel it's it's fox */
+		.flashMessage"quite the brown fox over <i>hot</i> <i>hot</i> fox <b>bold</b>",
+		int a = b + c(as_dog);
+		int a = b + c(as_over);
+		tooltipSB.append"as the [npc.Name] warm brown you softly the [pc.her]" +
+		"you quite softly the over <i>hot</i>" + "you quite softly the over <i>hot</i>";
+}
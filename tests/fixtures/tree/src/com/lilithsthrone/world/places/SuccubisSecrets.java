@@ -0,0 +1,21 @@
+package x;
+public class X {
+		dog as <i>hot</i> it's [npc.Name] you [npc.Name] as quick as jumps lazy quick */
+		x.getAllOf("moans warm [pc.her] brown you feel quick");
+		int a = b + c(you_[pc.her]);
+		@Override
+		int a = b + c(warm_fox);
+		corruptionGains = "fox jumps dog quick <i>hot</i> brown jumps lazy you <b>bold</b> <i>hot</i>";
+		new TattooWriting"brown [npc.Name] softly <b>bold</b> warm [npc.Name] lazy softly it's",
+		Content.put"[npc.Name] <i>hot</i> quite <i>hot</i> <i>hot</i> dog <b>bold</b> <b>bold</b> quick [npc.Name]",
+		textSB.append("moans quick dog quick the";
+		System.err.println("as <b>bold</b> <b>bold</b> fox jumps <b>bold</b>");
+		new AbstractFooType("<i>hot</i> <b>bold</b> moans" +
+		"jumps [npc.Name] it's <i>hot</i> [pc.her] it's [npc.Name] <i>hot</i> [npc.Name]" + "jumps [npc.Name] it's <i>hot</i> [pc.her] it's [npc.Name] <i>hot</i> [npc.Name]",
+		new AbstractFooType("quite quick" +
+		descriptionToReturn = "quick <b>bold</b> jumps jumps [npc.Name] feel" +
+		x.getAllOf("[pc.her] lazy as brown as");
+		/* comment it's [pc.her] the */
+		new String[]"quite you quick feel [npc.Name] it's lazy over you",
+		"<i>hot</i> it's you over quite as [pc.her]" + "<i>hot</i> it's you over quite as [pc.her]";
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		return"feel it's softly warm over jumps it's it's over"
+		@Override
+		x.getAllOf("it's as");
+		tooltipSB.append"feel quite lazy dog quite <b>bold</b> <b>bold</b>")
+
+		.setTooltipContent"brown brown you you <b>bold</b> dog as")
+		int a = b + c(as_quite);
+		titles.add("[pc.her] <i>hot</i> the",
+		int a = b + c(you_over);
+		int a = b + c(quick_dog);
+		"jumps the <i>hot</i> over [pc.her] as softly [pc.her] <i>hot</i> moans softly warm" + "jumps the <i>hot</i> over [pc.her] as softly [pc.her] <i>hot</i> moans softly warm",
+		/* comment jumps brown as over [pc.her] fox [npc.Name] over you warm jumps jumps softly
+		appendToTextEndStringBuilder"quick over as" +
+		@Override
+		writing = "<i>hot</i> [npc.Name] lazy [pc.her] quite moans warm jumps" +
+		"quick <i>hot</i> over as as <i>hot</i>" + "quick <i>hot</i> over as as <i>hot</i>"
+		"as softly the over warm [npc.Name] quick jumps [npc.Name] as the quite <i>hot</i>" + "as softly the over warm [npc.Name] quick jumps [npc.Name] as the quite <i>hot</i>",
+		int a = b + c(dog_you);
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		int a = b + c(<i>hot</i>_quick);
+		x.getAllOf("<i>hot</i> over <b>bold</b> moans feel moans <b>bold</b> you jumps");
+		@Override
+		x.getAllOf("softly warm brown softly [pc.her]");
+		Locale.ENGLISH;
+		int a = b + c(as_jumps);
+		int a = b + c(brown_[pc.her]);
+
+		@Override
+		int a = b + c([pc.her]_dog);
+		parsed.add"the quick dog brown <i>hot</i> quick"
+		ingredientMap.put"quite [pc.her] it's quick")
+		@Override
+		Availability.add"[npc.Name] fox moans dog [pc.her] quite the dog moans over quite <i>hot</i> feel" +
+		int a = b + c(you_you);
+		newArrayListOfValues"it's dog [npc.Name] softly as quick")
+		"feel <i>hot</i> fox lazy as the quite softly as fox feel" + "feel <i>hot</i> fox lazy as the quite softly as fox feel";
+		brown quick fox moans <i>hot</i> fox over [npc.Name] feel */
+}
@@ -0,0 +1,21 @@
+package x;
+public class X {
+		@Override
+		System.err.println("the you warm dog dog fox <i>hot</i> quite quick as as quick dog over");
+		@Override
+		int a = b + c([npc.Name]_quick);
+		getTextStartStringBuilder()"jumps jumps [npc.Name] you dog feel moans it's dog moans warm moans")
+		feel <i>hot</i> <i>hot</i> quick <i>hot</i> dog quite jumps the <i>hot</i> fox quick */
+		demonstoneImages = "<i>hot</i> warm"
+		@Override
+		int a = b + c(warm_dog);
+		int a = b + c(over_fox);
+
+		int a = b + c(<i>hot</i>_softly);
+		orificesRecovering.add"dog <i>hot</i> <b>bold</b> <b>bold</b> warm [npc.Name] <i>hot</i> it's you feel <i>hot</i> dog"
+		@Override
+		warm [npc.Name] dog <i>hot</i> dog quick over fox */
+		int a = b + c(it's_softly);
+		quick feel moans warm softly */
+		int a = b + c(warm_dog);
+}
@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+from applier import Applier, apply_xml_file
+
+
+def test_apply_xml_reports_missed_keys(tmp_path: Path):
+    xml_file = tmp_path / "item.xml"
+    xml_file.write_text(
+        "<item><name>sword</name><name>shield</name><name>bow</name></item>",
+        encoding="utf-8",
+    )
+    json_dict = {
+        "name_text_0": {"key": "name_text_0", "original": "sword", "translation": "剑", "stage": 1},
+        "name_text_1": {"key": "name_text_1", "original": "axe", "translation": "斧", "stage": 1},
+        "name_text_2": {"key": "name_text_2", "original": "spear", "translation": "矛", "stage": 1},
+    }
+
+    result = apply_xml_file(xml_file, Path("item.json"), json_dict)
+    assert result.applied == 1
+    assert result.mismatched == 2
+    # 同名节点的条目以编号区分
+    assert result.missed == ["name_text_1", "name_text_2"]
+    assert "<name><![CDATA[剑]]></name>" in xml_file.read_text(encoding="utf-8")
+
+
+def test_modify_java_normalizes_newlines(tmp_path: Path):
+    root = tmp_path / "src"
+    root.mkdir()
+    (root / "Plain.java").write_bytes(b"class Plain {}\n")
+    (root / "Crlf.java").write_bytes(b"class Crlf {\r\n}\r\n")
+    (root / "Locale.java").write_bytes(b"Locale.ENGLISH;\r\n")
+
+    Applier("main", str(root), str(tmp_path / "dict")).modify_java()
+
+    assert (root / "Plain.java").read_bytes() == b"class Plain {}\n"
+    # 与逐行读写一致，未被规则修改的文件也统一换行符
+    assert (root / "Crlf.java").read_bytes() == b"class Crlf {\n}\n"
+    assert (root / "Locale.java").read_bytes() == b"Locale.CHINESE;\n"
+
+
+def test_apply_xml_keeps_file_without_replacement(tmp_path: Path):
+    xml_file = tmp_path / "item.xml"
+    content = b"<item>\n    <name>sword</name>\n</item>"
+    xml_file.write_bytes(content)
+    os.utime(xml_file, (0, 0))
+    json_dict = {
+        "name_text_0": {"key": "name_text_0", "original": "axe", "translation": "斧", "stage": 1},
+    }
+
+    result = apply_xml_file(xml_file, Path("item.json"), json_dict)
+    assert result.applied == 0 and not result.written
+    assert xml_file.read_bytes() == content
+    assert xml_file.stat().st_mtime == 0
@@ -0,0 +1,57 @@
+import pickle
+import sys
+
+from data import CompactDictionary, compact_dictionaries
+
+
+ENTRIES = [
+    {"key": "name_text_0", "original": "sword", "translation": "剑", "stage": 1},
+    {"key": "00012", "original": "shield", "translation": "", "stage": 0, "context": "c"},
+    {"key": "name_text_1", "original": "bow", "translation": "弓", "stage": 9},
+]
+
+
+def test_compact_dictionary_matches_entries():
+    compact = CompactDictionary(ENTRIES)
+    assert list(compact) == [entry["key"] for entry in ENTRIES]
+    assert dict(compact.items()) == {entry["key"]: entry for entry in ENTRIES}
+    assert "00012" in compact and "missing" not in compact
+    assert compact.get("missing") is None
+
+
+def test_compact_dictionary_is_read_only():
+    compact = CompactDictionary(ENTRIES)
+    entry = compact["name_text_0"]
+    entry["translation"] = "刀"
+    entry["stage"] = 0
+    assert compact["name_text_0"] == ENTRIES[0]
+
+
+def test_compact_dictionary_pickle_interns_keys():
+    compact = pickle.loads(pickle.dumps(CompactDictionary(ENTRIES)))
+    assert dict(compact.items()) == {entry["key"]: entry for entry in ENTRIES}
+    # 反序列化得到的key与其他字典共用同一份字符串
+    assert next(iter(compact)) is sys.intern("".join(["name_", "text_0"]))
+
+
+def test_compact_dictionary_equality_matches_dict():
+    compact = CompactDictionary(ENTRIES)
+    entries = {entry["key"]: dict(entry) for entry in ENTRIES}
+    assert entries == compact and compact == entries
+    entries["00012"]["context"] = "d"
+    assert entries != compact
+    # 字段名不同而值相同也不相等
+    entries["00012"] = {**ENTRIES[1], "other": "c"}
+    del entries["00012"]["context"]
+    assert entries != compact
+
+
+def test_compact_dictionaries_converts_in_place():
+    data = {"a.json": {entry["key"]: dict(entry) for entry in ENTRIES}}
+    compact_dictionaries(data)
+    converted = data["a.json"]
+    assert isinstance(converted, CompactDictionary)
+    assert converted == {entry["key"]: entry for entry in ENTRIES}
+    # 已转换的文件不再重复转换
+    compact_dictionaries(data)
+    assert data["a.json"] is converted
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import pytest
+
+from dict_source import DictionarySource, DirectoryDictionarySource
+
+
+def test_incomplete_source_fails_on_instantiation():
+    class PartialSource(DictionarySource):
+        def paths(self):
+            return []
+
+    with pytest.raises(TypeError):
+        PartialSource()
+
+
+def test_directory_source_implements_interface(tmp_path: Path):
+    (tmp_path / "a.json").write_text("[]", encoding="utf-8")
+    source = DirectoryDictionarySource(tmp_path)
+    assert source.paths() == ["a.json"]
+    assert source.load_outdated("a.json") is None
+    assert source.read_outdated("a.json") is None
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from extractor import extract_java_file, extract_xml_file
+import benchmark_baseline as baseline
+
+FIXTURE_TREE = Path(__file__).parent / "fixtures" / "tree"
+XML_FILES = sorted(FIXTURE_TREE.glob("res/**/*.xml"))
+JAVA_FILES = sorted(FIXTURE_TREE.glob("src/**/*.java"))
+
+
+def test_fixture_covers_entries():
+    xml_entries = sum(len(extract_xml_file(file)) for file in XML_FILES)
+    java_entries = sum(len(extract_java_file(file)) for file in JAVA_FILES)
+    assert xml_entries > 100
+    assert java_entries > 100
+
+
+@pytest.mark.parametrize("file", XML_FILES, ids=lambda f: f.relative_to(FIXTURE_TREE).as_posix())
+def test_extract_xml_matches_baseline(file: Path):
+    # 键、内容与顺序都须与逐节点名遍历的基线一致
+    assert list(extract_xml_file(file).items()) == list(baseline.extract_xml(file).items())
+
+
+@pytest.mark.parametrize("file", JAVA_FILES, ids=lambda f: f.relative_to(FIXTURE_TREE).as_posix())
+def test_extract_java_matches_baseline(file: Path):
+    # 基线对黑名单文件返回空列表，两者都会被跳过
+    legacy = baseline.extract_java(file) or {}
+    assert list(extract_java_file(file).items()) == list(legacy.items())
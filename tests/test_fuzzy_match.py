@@ -0,0 +1,66 @@
+import math
+
+from fuzzy_match import (
+    FUZZY_BANDS,
+    FUZZY_BINS,
+    FUZZY_MIN_LENGTH,
+    FUZZY_THRESHOLD,
+    FuzzyIndex,
+    signature,
+    similarity,
+)
+
+ORIGINAL = (
+    "[npc.Name] leans in close, [npc.her] breath warm against your ear as [npc.she] whispers,"
+    " [npc.speech(Don't keep me waiting too long.)]"
+)
+NEAR_DUPLICATE = (
+    "[npc.Name] leans in close, [npc.her] breath hot against your ear as [npc.she] whispers,"
+    " [npc.speech(Don't keep me waiting too long.)]"
+)
+UNRELATED = "The shop's shelves are lined with dusty bottles, each labelled in a cramped, spidery hand."
+
+
+def build_index() -> FuzzyIndex:
+    index: FuzzyIndex[str] = FuzzyIndex()
+    assert index.add(ORIGINAL, "original")
+    assert index.add(UNRELATED, "unrelated")
+    return index
+
+
+def test_query_near_duplicate():
+    matches = build_index().query(NEAR_DUPLICATE)
+    assert [payload for _, payload in matches] == ["original"]
+    assert 0.7 <= matches[0][0] < 1.0
+
+
+def test_query_exact_ranks_first():
+    index = build_index()
+    index.add(NEAR_DUPLICATE, "near")
+    matches = index.query(ORIGINAL)
+    assert [payload for _, payload in matches] == ["original", "near"]
+    assert matches[0][0] == 1.0
+    assert index.query(ORIGINAL, limit=1) == matches[:1]
+
+
+def test_query_unrelated():
+    assert build_index().query("Lilaya's laboratory is quiet, save for the hum of arcane machinery.") == []
+
+
+def test_query_too_short():
+    short = "x" * (FUZZY_MIN_LENGTH - 1)
+    assert signature(short) is None
+    index = build_index()
+    assert not index.add(short, "short")
+    assert len(index) == 2
+    assert index.query(short) == []
+
+
+def test_signature_normalizes_whitespace():
+    assert signature(ORIGINAL) == signature(ORIGINAL.replace(" ", "  \n"))
+    assert similarity(signature(ORIGINAL), signature(UNRELATED)) < 0.2
+
+
+def test_banding_covers_threshold():
+    # 达到阈值时不同的箱少于band数，LSH不会漏掉候选
+    assert FUZZY_BINS - math.ceil(FUZZY_THRESHOLD * FUZZY_BINS) < FUZZY_BANDS
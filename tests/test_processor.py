@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from const import CHANGESET_FILE
+from processor import Processor, entry_fingerprint, entry_fingerprints, file_fingerprint
+
+
+def make_entry(key, original, translation="", stage=0):
+    return {"key": key, "original": original, "translation": translation, "stage": stage}
+
+
+def test_entry_fingerprint_normalizes_old_xml_newlines():
+    new = make_entry("name_text_0", "a\nb ", "甲", 1)
+    old = make_entry("name_text_0", "a\\nb", "甲", 1)
+    assert entry_fingerprint(new, old=False) == entry_fingerprint(old, old=True)
+    # java条目的原文不做还原
+    java = make_entry("1_x", "a\\nb")
+    assert entry_fingerprint(java, old=True) != entry_fingerprint(
+        make_entry("1_x", "a\nb"), old=False
+    )
+
+
+def test_file_fingerprint_ignores_order():
+    entries = {
+        "a": make_entry("a", "first"),
+        "b": make_entry("b", "second", "二", 1),
+    }
+    reordered = {"b": entries["b"], "a": entries["a"]}
+    assert file_fingerprint(entry_fingerprints(entries, False).values()) == (
+        file_fingerprint(entry_fingerprints(reordered, False).values())
+    )
+
+
+def test_filter_changed_writes_fingerprints(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    old_data = {
+        "same.json": {"a": make_entry("a", "x\\ny", "甲", 1)},
+        "changed.json": {
+            "a": make_entry("a", "keep", "甲", 1),
+            "b": make_entry("b", "old text", "乙", 1),
+            "c": make_entry("c", "removed"),
+        },
+    }
+    new_data = {
+        "same.json": {"a": make_entry("a", "x\ny", "甲", 1)},
+        "changed.json": {
+            "a": make_entry("a", "keep", "甲", 1),
+            "b": make_entry("b", "new text", "乙", 1),
+            "d": make_entry("d", "added", "丁", 0),
+        },
+    }
+    processor = Processor(
+        "main",
+        tmp_path / "dict",
+        tmp_path / "old_dict",
+        "",
+        SimpleNamespace(file_with_missing_entry=[]),
+        new_data=new_data,
+        old_data=old_data,
+        diff_files=False,
+    )
+    processor.filter_changed()
+
+    with open(CHANGESET_FILE["main"], encoding="utf-8") as f:
+        changeset = json.load(f)["files"]
+    assert list(changeset) == ["changed.json"]
+    changes = changeset["changed.json"]
+    assert changes["added"] == ["d"]
+    assert changes["removed"] == ["c"]
+    assert changes["original"] == ["b"]
+    # 新增条目有译文时阶段被调整，记录调整后的指纹
+    assert new_data["changed.json"]["d"]["stage"] == 1
+    fingerprints = entry_fingerprints(new_data["changed.json"], old=False)
+    assert changes["entries"] == {key: fingerprints[key].hex() for key in ("b", "d")}
+    assert changes["fingerprint"] == file_fingerprint(fingerprints.values()).hex()
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from const import OUTDATE_DIR_NAME
+from dict_source import DirectoryDictionarySource
+from snapshot import DictionarySnapshot, SnapshotDictionarySource, write_snapshot
+
+OLD_DICT = Path(__file__).parent / "fixtures" / "old_dict"
+
+
+@pytest.fixture
+def snapshot_source(tmp_path: Path):
+    snapshot_file = tmp_path / "dict.snapshot"
+    write_snapshot(snapshot_file, b"\0" * 20, DirectoryDictionarySource(OLD_DICT))
+    source = SnapshotDictionarySource(DictionarySnapshot(snapshot_file))
+    yield source
+    source.snapshot.close()
+
+
+def test_snapshot_loads_same_entries(snapshot_source: SnapshotDictionarySource):
+    directory = DirectoryDictionarySource(OLD_DICT)
+    assert snapshot_source.paths() == directory.paths()
+    assert snapshot_source.outdated_paths() == directory.outdated_paths()
+    for path in directory.paths():
+        assert snapshot_source.load(path) == directory.load(path)
+    for path in directory.outdated_paths():
+        assert snapshot_source.load_outdated(path) == directory.load_outdated(path)
+    assert snapshot_source.load_outdated("missing.json") is None
+
+
+def test_snapshot_exports_outdated_bytes(snapshot_source: SnapshotDictionarySource, tmp_path: Path):
+    target = tmp_path / OUTDATE_DIR_NAME
+    snapshot_source.export_outdated(target)
+
+    outdated_root = OLD_DICT / OUTDATE_DIR_NAME
+    expected = sorted(file.relative_to(outdated_root) for file in outdated_root.glob("**/*.json"))
+    assert sorted(file.relative_to(target) for file in target.glob("**/*.json")) == expected
+    for path in expected:
+        assert (target / path).read_bytes() == (outdated_root / path).read_bytes()
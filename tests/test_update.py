@@ -0,0 +1,106 @@
+import copy
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from const import OUTDATE_DIR_NAME, PREVIOUS_GAME_VERSION
+from data import SingleDictionary
+from extractor import extract_java_file, extract_xml_file
+import benchmark_baseline as baseline
+from update import update_data
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+FIXTURE_TREE = FIXTURE_DIR / "tree"
+OLD_DICT = FIXTURE_DIR / "old_dict"
+
+
+def load_dict(path: Path) -> SingleDictionary:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {entry["key"]: entry for entry in json.load(f)}
+
+
+def merge_inputs() -> List[Tuple[str, SingleDictionary, SingleDictionary, SingleDictionary]]:
+    inputs = []
+    for file in sorted(FIXTURE_TREE.glob("**/*")):
+        if file.suffix == ".xml":
+            new_data = extract_xml_file(file)
+        elif file.suffix == ".java":
+            new_data = extract_java_file(file)
+        else:
+            continue
+        path = file.relative_to(FIXTURE_TREE).with_suffix(".json").as_posix()
+        old_data = load_dict(OLD_DICT / path)
+        if len(new_data) == 0 or len(old_data) == 0:
+            continue
+        inputs.append(
+            (path, old_data, new_data, load_dict(OLD_DICT / OUTDATE_DIR_NAME / path))
+        )
+    return inputs
+
+
+MERGE_INPUTS = merge_inputs()
+
+
+def test_fixture_covers_merge():
+    migrated = outdated = 0
+    for _, old_data, new_data, _ in MERGE_INPUTS:
+        outdated_data, _ = baseline.update_data(copy.deepcopy(old_data), copy.deepcopy(new_data))
+        outdated += len(outdated_data)
+        migrated += sum(entry["stage"] != 0 for entry in old_data.values()) - len(outdated_data)
+    assert len(MERGE_INPUTS) > 50
+    assert migrated > 100
+    assert outdated > 100
+
+
+@pytest.mark.parametrize(
+    "path,old_data,new_data,prev_outdated_data", MERGE_INPUTS, ids=[i[0] for i in MERGE_INPUTS]
+)
+def test_update_data_matches_baseline(
+    path: str,
+    old_data: SingleDictionary,
+    new_data: SingleDictionary,
+    prev_outdated_data: SingleDictionary,
+):
+    pristine = copy.deepcopy(old_data)
+
+    legacy_outdated, legacy_new = baseline.update_data(
+        copy.deepcopy(old_data), copy.deepcopy(new_data)
+    )
+    outdated, merged = update_data(old_data, copy.deepcopy(new_data))
+    # 内容与顺序一致，且不修改旧字典
+    assert list(outdated.items()) == list(legacy_outdated.items())
+    assert list(merged.items()) == list(legacy_new.items())
+    assert old_data == pristine
+
+    # 过时词条合并会修改被迁移的条目，两边各用一份
+    _, legacy_prev = baseline.update_data(
+        copy.deepcopy(legacy_outdated),
+        copy.deepcopy(prev_outdated_data),
+        version=PREVIOUS_GAME_VERSION,
+    )
+    _, prev = update_data(
+        copy.deepcopy(outdated),
+        copy.deepcopy(prev_outdated_data),
+        version=PREVIOUS_GAME_VERSION,
+    )
+    assert list(prev.items()) == list(legacy_prev.items())
+
+
+def test_update_data_unsorted_input():
+    old_data: Dict[str, dict] = {
+        "b": {"key": "b", "original": "same", "translation": "二", "stage": 1},
+        "a": {"key": "a", "original": "same", "translation": "一", "stage": 1},
+    }
+    new_data: Dict[str, dict] = {
+        "y": {"key": "y", "original": "same", "translation": "", "stage": 0},
+        "x": {"key": "x", "original": "same", "translation": "", "stage": 0},
+    }
+    legacy = baseline.update_data(copy.deepcopy(old_data), copy.deepcopy(new_data))
+    result = update_data(old_data, copy.deepcopy(new_data))
+    assert [list(d.items()) for d in result] == [list(d.items()) for d in legacy]
+    assert list(result[1]) == ["x", "y"]
+    assert result[1]["x"]["translation"] == "一"
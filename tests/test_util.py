@@ -0,0 +1,58 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+import benchmark_baseline as baseline
+from util import XmlTreeCache, split_htmlContent
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def fixture_htmlContent() -> list:
+    corpus = json.loads((FIXTURE_DIR / "htmlContent.json").read_text(encoding="utf-8"))
+    parser = etree.XMLParser(strip_cdata=False)
+    for file in sorted(FIXTURE_DIR.glob("tree/res/**/*.xml")):
+        root = etree.parse(file.as_posix(), parser)
+        corpus += [e.text for e in root.iter("htmlContent") if e.text is not None]
+    return corpus
+
+
+@pytest.mark.parametrize("text", fixture_htmlContent())
+def test_split_htmlContent_matches_baseline(text: str):
+    assert split_htmlContent(text) == baseline.split_htmlContent(text)
+
+
+def test_split_htmlContent_random_matches_baseline():
+    # 由标签与控制语句片段随机拼接，覆盖重叠与截断的情况
+    tokens = [
+        "<p>", "</p>", "<p class='x'>", "\n", " ", "abc", "#IF(x)", "#ENDIF", "#ELSE",
+        "#VAR", "#ENDVAR", "<div>", "</div>", "<h1>", "</h1>", "<br/><br/>", "<i>",
+        "</i>", "[npc.Name]", "<", ">", "#A", "text text", "#B", "#a", "<p>\n", "</p>\n",
+        "\t", "<h2 x>", "</h3>", "<pre>", "<pa\n", "</p", "#VA",
+    ]
+    rng = random.Random(3)
+    for _ in range(5000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 40)))
+        assert split_htmlContent(text) == baseline.split_htmlContent(text), text
+
+
+def test_xml_tree_cache_limit_uses_memory_estimate(tmp_path: Path):
+    files = []
+    for idx in range(3):
+        file = tmp_path / f"{idx}.xml"
+        file.write_text(f"<root><name>{idx}</name></root>", encoding="utf-8")
+        files.append(file)
+    size = files[0].stat().st_size
+
+    # 上限按估算的内存占用计算，只够放下两棵文档树
+    cache = XmlTreeCache(size * 4 * 2, memory_factor=4)
+    for file in files:
+        cache.parse(file)
+    assert cache.evictions == 1
+    assert cache.bytes_held == size * 4 * 2
+    assert cache.take(files[0]) is None
+    assert cache.take(files[2]) is not None
+    assert cache.bytes_held == size * 4
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from data import JsonEntry
+
+
+@dataclass(frozen=True)
+class MemoryEntry:
+    path: str
+    key: str
+    translation: str
+    stage: int
+    outdated: bool  # 是否来自过时词条
+
+
+def memory_key(entry: JsonEntry, old: bool) -> Tuple[bool, str]:
+    """
+    (是否为java条目, 规范化后的原文)，规范化方式与同文件合并时一致
+    """
+    is_java = entry["key"][0].isdigit()
+    original = entry["original"]
+    # 旧字典中xml条目的换行以\n转义保存
+    if old and not is_java:
+        original = original.replace("\\n", "\n")
+    return is_java, original.strip()
+
+
+class TranslationMemory:
+    """
+    整个旧字典（含过时词条）的翻译记忆，按原文查找其他文件中已有的译文
+
+    同一原文有多个译文时，字典中的优先于过时词条中的，同一部分中按文件顺序取第一个
+    """
+
+    def __init__(self):
+        self.current: Dict[Tuple[bool, str], MemoryEntry] = {}
+        self.outdated: Dict[Tuple[bool, str], MemoryEntry] = {}
+
+    def add(self, path: str, entries: Iterable[JsonEntry], outdated: bool = False):
+        memory = self.outdated if outdated else self.current
+        for entry in entries:
+            if entry["stage"] == 0 or entry["translation"].strip() == "":
+                continue
+            # 无需汉化的条目
+            if entry["original"] == entry["translation"]:
+                continue
+            key = memory_key(entry, old=True)
+            if key[1] == "" or key in memory:
+                continue
+            memory[key] = MemoryEntry(
+                path=path,
+                key=entry["key"],
+                translation=entry["translation"],
+                stage=entry["stage"],
+                outdated=outdated,
+            )
+
+    def lookup(self, entry: JsonEntry) -> Optional[MemoryEntry]:
+        key = memory_key(entry, old=False)
+        found = self.current.get(key)
+        if found is None:
+            found = self.outdated.get(key)
+        return found
+
+    def __len__(self) -> int:
+        return len(self.current.keys() | self.outdated.keys())
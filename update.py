@@ -1,251 +1,358 @@
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import json
-import shutil
-import asyncio
+import operator
+import sys
 import re
-import copy
 
-from data import WholeDictionary, SingleDictionary
+from data import (
+    CompactDictionary,
+    WholeDictionary,
+    SingleDictionary,
+    MergeResult,
+    intern_dictionary,
+)
 from const import OUTDATE_DIR_NAME, PREVIOUS_GAME_VERSION
 from logger import logger
+from dict_source import DictionarySource, DirectoryDictionarySource
+from translation_memory import TranslationMemory
+from util import chunked, resolve_jobs
 
 
 class Updater:
     def __init__(
-        self, old_dict_path: Path, new_dict_path: Path, new_data: WholeDictionary
+        self,
+        old_dict_path: Path,
+        new_dict_path: Path,
+        new_data: WholeDictionary,
+        source: Optional[DictionarySource] = None,
+        jobs: int = 1,
+        translation_memory: bool = True,
     ) -> None:
         self.old_dict_path: Path = old_dict_path
+        # 默认读取解压后的字典目录
+        self.source: DictionarySource = (
+            source if source is not None else DirectoryDictionarySource(old_dict_path)
+        )
         self.new_dict_path: Path = new_dict_path
         self.new_data: WholeDictionary = new_data
-        self.old_data: WholeDictionary = {}
-        self.file_with_missing_entry: List[Path] = []
+        # 旧字典只读保留到比较阶段，以紧凑形式保存
+        self.old_data: Dict[str, CompactDictionary] = {}
+        self.file_with_missing_entry: Set[str] = set()
+        self.jobs = resolve_jobs(jobs)
+        # 同文件内没有匹配的条目，按原文从整个旧字典中查找译文
+        self.translation_memory = translation_memory
 
     def update_dict(
         self,
         new_data: WholeDictionary,
         ignore_untranslated: bool = False,
     ):
-        loop = asyncio.get_event_loop()
-
         new_outdated_dir = self.new_dict_path / OUTDATE_DIR_NAME
-        old_outdated_dir = self.old_dict_path / OUTDATE_DIR_NAME
 
         # 迁移旧版本过时词条
-        if old_outdated_dir.exists():
-            shutil.move(old_outdated_dir, new_outdated_dir)
+        self.source.export_outdated(new_outdated_dir)
 
-        # 获取所有json文件
-        old_dict_files: List[Path] = list(self.old_dict_path.glob("**/*.json"))
-
-        file_pairs = [
+        # 获取所有字典文件（不含过时词条）
+        tasks = [
             (
-                old_dict_file,
-                new_data.get(
-                    old_dict_file.relative_to(self.old_dict_path).as_posix(), None
-                ),
-                new_outdated_dir / old_dict_file.relative_to(self.old_dict_path),
+                path,
+                new_data.get(path, None),
+                new_outdated_dir / path,
             )
-            for old_dict_file in old_dict_files
+            for path in self.source.paths()
         ]
 
-        tasks = [
-            self.update_dict_file(
-                old_dict_file, new_data, outdated_file, ignore_untranslated
-            )
-            for old_dict_file, new_data, outdated_file in file_pairs
-        ]
+        # 过时词条在合并时会被改写，先读入翻译记忆
+        memory = None
+        if self.translation_memory:
+            memory = TranslationMemory()
+            for path in self.source.outdated_paths():
+                memory.add(path, self.source.load_outdated(path) or [], outdated=True)
 
-        loop.run_until_complete(asyncio.gather(*tasks))
+        self.merge(tasks, ignore_untranslated)
 
-    async def update_dict_file(
+        # 同文件内的匹配优先，之后再从整个旧字典中查找
+        if memory is not None:
+            for path, old_dict_data in self.old_data.items():
+                memory.add(path, old_dict_data.values())
+            self.fill_from_memory(memory)
+
+    def merge(
         self,
-        old_dict_file: Path,
-        new_dict_data: Optional[SingleDictionary],
-        outdated_file: Path,
-        ignore_untranslated: bool = False,
-    ):
-        with open(old_dict_file, "r", encoding="utf-8") as old_dict:
-            old_dict_data: List[Dict] = json.load(old_dict)
-            
-        path_key = old_dict_file.relative_to(self.old_dict_path).as_posix()
-
-        hashed_old_dict_data: SingleDictionary = {}
-        for old_dict_item in old_dict_data:
-            hashed_old_dict_data[old_dict_item["key"]] = old_dict_item
-
-        self.old_data[
-            old_dict_file.relative_to(self.old_dict_path).as_posix()
-        ] = hashed_old_dict_data
-
-        no_file = False
-        # 若在新提取中该文件已不存在
-        if new_dict_data is None:
+        tasks: List[Tuple[str, Optional[SingleDictionary], Path]],
+        ignore_untranslated: bool,
+    ) -> None:
+        # 各文件的合并互不依赖，结果按文件顺序归并
+        if self.jobs <= 1 or len(tasks) <= 1:
+            for result in merge_chunk(self.source, tasks, ignore_untranslated):
+                self.reduce(result)
+            return
+
+        chunk_size = max(1, len(tasks) // (self.jobs * 4))
+        with ProcessPoolExecutor(self.jobs) as executor:
+            for result in itertools.chain.from_iterable(
+                executor.map(
+                    merge_chunk,
+                    itertools.repeat(self.source),
+                    chunked(tasks, chunk_size),
+                    itertools.repeat(ignore_untranslated),
+                )
+            ):
+                # 进程池返回的结果是反序列化得到的新字符串，统一驻留（旧字典在反序列化时驻留）
+                if result.new_data is not None:
+                    result.new_data = intern_dictionary(result.new_data)
+                self.reduce(result)
+
+    def fill_from_memory(self, memory: TranslationMemory) -> None:
+        """
+        为合并后仍未翻译的条目填充其他文件中相同原文的译文
+
+        来自字典的译文保留原阶段，来自过时词条的译文需要重新校对，阶段设为1
+        """
+        filled = from_outdated = 0
+        for entries in self.new_data.values():
+            for entry in entries.values():
+                if entry["stage"] != 0 or entry["translation"] != "":
+                    continue
+                found = memory.lookup(entry)
+                if found is None:
+                    continue
+                entry["translation"] = translation_process(found.translation, found.key)
+                entry["stage"] = 1 if found.outdated else found.stage
+                filled += 1
+                from_outdated += found.outdated
+
+        logger.info(
+            "翻译记忆：共%s条原文，为%s个未翻译条目填充译文（其中%s个来自过时词条）",
+            len(memory),
+            filled,
+            from_outdated,
+        )
+
+    def reduce(self, result: MergeResult) -> None:
+        old_dict_file = self.old_dict_path / result.path
+        path_key = sys.intern(result.path)
+
+        self.old_data[path_key] = result.old_data
+
+        if result.new_data is None:
             logger.info("在新提取中该文件已不存在：%s", old_dict_file)
-            outdated_data = hashed_old_dict_data
-            no_file = True
         else:
-            outdated_data, self.new_data[path_key] = await self.update_data(
-                copy.deepcopy(hashed_old_dict_data), new_dict_data
-            )
-
-            if ignore_untranslated:
-                # result_dict_data = list(filter(lambda entry: entry["stage"] != 0, new_dict_data))
-                result_dict_data = new_dict_data
-            else:
-                result_dict_data = new_dict_data
+            self.new_data[path_key] = result.new_data
 
-            if len(outdated_data) > 0:
+            if len(result.missing) > 0:
                 logger.info("在新提取中该文件存在遗失条目：%s", old_dict_file)
-                self.file_with_missing_entry.append(old_dict_file.relative_to(self.old_dict_path).as_posix())
-                print([key for key, data in outdated_data.items()])
-
-        # 过时条目融合
-        if outdated_file.exists():
-            with open(outdated_file, "r", encoding="utf-8") as f:
-                prev_outdated_data_raw = json.load(f)
-            hashed_prev_outdated_data: SingleDictionary = {}
-            for prev_outdated_item in prev_outdated_data_raw:
-                hashed_prev_outdated_data[
-                    prev_outdated_item["key"]
-                ] = prev_outdated_item
-            prev_outdated_data = hashed_prev_outdated_data
-        else:
-            prev_outdated_data = {}
-
-        if len(outdated_data) > 0:
-            _, prev_outdated_data = await self.update_data(outdated_data, prev_outdated_data, version=PREVIOUS_GAME_VERSION)
-        
-        if len(prev_outdated_data) <= 0:
-            if no_file:
-                logger.warning(" - 文件不再包含任何条目：%s", outdated_file)
-            return
+                self.file_with_missing_entry.add(path_key)
+                print(result.missing)
 
-        if not outdated_file.parent.exists():
-            outdated_file.parent.mkdir(parents=True)
+        if result.emptied:
+            logger.warning(
+                " - 文件不再包含任何条目：%s",
+                self.new_dict_path / OUTDATE_DIR_NAME / result.path,
+            )
 
-        with open(outdated_file, "w", encoding="utf-8") as f:
-            json.dump(list(prev_outdated_data.values()), f, ensure_ascii=False, indent=4)
 
-    async def update_data(
-        self,
-        old_dict_data: SingleDictionary,
-        new_dict_data: SingleDictionary,
-        version: str = "",
-    ) -> SingleDictionary:
-        new_dict_map: Dict[str, List[str]] = {}  # [原文文本, new_dict_data词典中对应的key]
-        old_dict_map: Dict[str, List[str]] = {}  # [原文文本, old_dict_data词典中对应的key]
-        
-        # sort the new data and old data
-        new_dict_data = dict(sorted(new_dict_data.items(), key=lambda x: x[1]["key"]))
-        old_dict_data = dict(sorted(old_dict_data.items(), key=lambda x: x[1]["key"]))
-
-        for key, data in new_dict_data.items():
-            original = data["original"].strip()
-            if not new_dict_map.get(original):
-                new_dict_map[original] = [key]
-            else:
-                new_dict_map[original].append(key)
-
-        for key, data in old_dict_data.items():
-            if data["stage"] == 0:
-                old_dict_data[key] = None
-                continue
-            original = data["original"]
-            # 是否为xml文件
-            if not data["key"][0].isdigit():
-                original = original.replace("\\n", "\n")
-            original = original.strip()
-            if not old_dict_map.get(original):
-                old_dict_map[original] = [key]
-            else:
-                old_dict_map[original].append(key)
-        
-        # check = False
-        # if "00555" in old_dict_data:
-        #     check = True
-
-        for ori, keys in old_dict_map.items():
-            new_idx_list = new_dict_map.get(ori)
-            # if check and "down against [npc2.her] [npc2.lips+]" in key:
-            #     with open("test.json", "w") as f:
-            #         json.dump(new_dict_map, f, indent=2)
-            #     for _k, _v in new_dict_map.items():
-            #         if "down against [npc2.her] [npc2.lips+]" in _k:
-            #             print(_k, _v)
-            #     print(key)
-            #     print(value, new_idx_list)
-            #     input()
-            # outdated file merge
-            if version != "":
-                for idx, old_key in enumerate(keys):
-                    # 若旧字典的汉化与原文一致（即无需汉化）则无视
-                    if (
-                        old_dict_data[old_key]["original"]
-                        == old_dict_data[old_key]["translation"]
-                    ):
-                        continue
-                    if new_idx_list is None or len(new_idx_list) == 0 or idx >= len(new_idx_list):
-                        new_dict_data[f"{old_key}"] = old_dict_data[old_key]
-                        new_dict_data[f"{old_key}"]["key"] = f"{old_key}_{version}"
-                        new_dict_data[f"{old_key}"]["stage"] = 9 # locked
-                        continue
-                    new_dict_data[new_idx_list[idx]]["translation"] = old_dict_data[
-                        old_key
-                    ]["translation"].strip()
-                    new_dict_data[new_idx_list[idx]]["stage"] = 9 # locked
-
-                    if "." in new_dict_data[new_idx_list[idx]]["key"].split("_")[-1]:
-                        new_dict_data[new_idx_list[idx]]["key"] = "_".join(
-                            new_dict_data[new_idx_list[idx]]["key"].split("_")[:-1]
-                            + [f"_{version}"]
-                        )
-                    else:
-                        new_dict_data[new_idx_list[idx]]["key"] += f"_{version}"
-            else:
-                if new_idx_list is None:
+def merge_chunk(
+    source: DictionarySource,
+    tasks: List[Tuple[str, Optional[SingleDictionary], Path]],
+    ignore_untranslated: bool,
+) -> List[MergeResult]:
+    return [
+        merge_dict_file(source, path, new_dict_data, outdated_file, ignore_untranslated)
+        for path, new_dict_data, outdated_file in tasks
+    ]
+
+
+def merge_dict_file(
+    source: DictionarySource,
+    path: str,
+    new_dict_data: Optional[SingleDictionary],
+    outdated_file: Path,
+    ignore_untranslated: bool = False,
+) -> MergeResult:
+    """
+    合并单个字典文件并写入其过时词条，只读写该文件自身的数据，可在子进程中执行
+    """
+    old_dict_data: List[Dict] = source.load(path)
+
+    hashed_old_dict_data: SingleDictionary = {}
+    for old_dict_item in old_dict_data:
+        hashed_old_dict_data[old_dict_item["key"]] = old_dict_item
+    # 与提取结果共用key字符串
+    hashed_old_dict_data = intern_dictionary(hashed_old_dict_data)
+
+    missing: List[str] = []
+    # 若在新提取中该文件已不存在
+    if new_dict_data is None:
+        outdated_data = hashed_old_dict_data
+    else:
+        outdated_data, new_dict_data = update_data(hashed_old_dict_data, new_dict_data)
+
+        if ignore_untranslated:
+            # result_dict_data = list(filter(lambda entry: entry["stage"] != 0, new_dict_data))
+            result_dict_data = new_dict_data
+        else:
+            result_dict_data = new_dict_data
+
+        missing = [key for key, data in outdated_data.items()]
+
+    # 过时词条合并时会修改被迁移的条目，只复制这部分，旧字典中的条目保持不变，供翻译记忆使用
+    outdated_data = {key: dict(entry) for key, entry in outdated_data.items()}
+
+    # 过时条目融合
+    prev_outdated_data_raw = source.load_outdated(path)
+    if prev_outdated_data_raw is not None:
+        hashed_prev_outdated_data: SingleDictionary = {}
+        for prev_outdated_item in prev_outdated_data_raw:
+            hashed_prev_outdated_data[
+                prev_outdated_item["key"]
+            ] = prev_outdated_item
+        prev_outdated_data = hashed_prev_outdated_data
+    else:
+        prev_outdated_data = {}
+
+    if len(outdated_data) > 0:
+        _, prev_outdated_data = update_data(outdated_data, prev_outdated_data, version=PREVIOUS_GAME_VERSION)
+
+    result = MergeResult(
+        path=path,
+        old_data=CompactDictionary(hashed_old_dict_data.values()),
+        new_data=new_dict_data,
+        missing=missing,
+        emptied=len(prev_outdated_data) <= 0 and new_dict_data is None,
+    )
+    if len(prev_outdated_data) <= 0:
+        return result
+
+    outdated_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(outdated_file, "w", encoding="utf-8") as f:
+        json.dump(list(prev_outdated_data.values()), f, ensure_ascii=False, indent=4)
+    return result
+
+
+def sorted_keys(dict_data: SingleDictionary) -> List[str]:
+    """
+    按条目的key排序的字典键，已有序时（如读取自字典文件、java条目）不再排序
+    """
+    keys = list(dict_data)
+    entry_keys = [dict_data[key]["key"] for key in keys]
+    if all(map(operator.le, entry_keys, entry_keys[1:])):
+        return keys
+    return sorted(keys, key=lambda key: dict_data[key]["key"])
+
+
+def update_data(
+    old_dict_data: SingleDictionary,
+    new_dict_data: SingleDictionary,
+    version: str = "",
+) -> Tuple[SingleDictionary, SingleDictionary]:
+    """
+    按原文将old_dict_data的译文合并到new_dict_data，返回(未被迁移的旧条目, 合并后的新字典)，均按条目的key排序
+
+    不修改old_dict_data本身，也不修改其中的条目；version不为空时（过时词条合并）被迁移的旧条目会直接放入新字典并修改
+    """
+    new_dict_map: Dict[str, List[str]] = {}  # [原文文本, new_dict_data词典中对应的key]
+    old_dict_map: Dict[str, List[str]] = {}  # [原文文本, old_dict_data词典中对应的key]
+
+    # 只对key排序，条目不复制
+    new_keys = sorted_keys(new_dict_data)
+    old_keys = sorted_keys(old_dict_data)
+    new_dict_data = {key: new_dict_data[key] for key in new_keys}
+
+    # 未翻译或已迁移的旧条目
+    consumed: Set[str] = set()
+
+    for key in new_keys:
+        original = new_dict_data[key]["original"].strip()
+        new_dict_map.setdefault(original, []).append(key)
+
+    for key in old_keys:
+        data = old_dict_data[key]
+        if data["stage"] == 0:
+            consumed.add(key)
+            continue
+        original = data["original"]
+        # 是否为xml文件
+        if not data["key"][0].isdigit():
+            original = original.replace("\\n", "\n")
+        original = original.strip()
+        old_dict_map.setdefault(original, []).append(key)
+
+    for ori, keys in old_dict_map.items():
+        new_idx_list = new_dict_map.get(ori)
+        # outdated file merge
+        if version != "":
+            for idx, old_key in enumerate(keys):
+                old_entry = old_dict_data[old_key]
+                # 若旧字典的汉化与原文一致（即无需汉化）则无视
+                if old_entry["original"] == old_entry["translation"]:
                     continue
-                for idx, old_key in enumerate(
-                    keys[: min(len(keys), len(new_idx_list))]
-                ):
-                    # 保留汉化内容及当前阶段
-                    translation = old_dict_data[old_key]["translation"]
-
-                    translation = translation_process(
-                        translation, old_dict_data[old_key]["key"]
-                    )
-
-                    new_dict_data[new_idx_list[idx]]["translation"] = translation
-                    new_dict_data[new_idx_list[idx]]["stage"] = old_dict_data[old_key][
-                        "stage"
-                    ]
-                    # 移除被迁移的旧词条
-                    old_dict_data[old_key] = None
-
-        to_delete = [key for key, value in old_dict_data.items() if value is None]
-        for key in to_delete:
-            old_dict_data.pop(key)
+                if new_idx_list is None or len(new_idx_list) == 0 or idx >= len(new_idx_list):
+                    new_dict_data[f"{old_key}"] = old_entry
+                    new_dict_data[f"{old_key}"]["key"] = f"{old_key}_{version}"
+                    new_dict_data[f"{old_key}"]["stage"] = 9 # locked
+                    continue
+                new_entry = new_dict_data[new_idx_list[idx]]
+                new_entry["translation"] = old_entry["translation"].strip()
+                new_entry["stage"] = 9 # locked
 
-        return old_dict_data, new_dict_data
+                if "." in new_entry["key"].split("_")[-1]:
+                    new_entry["key"] = "_".join(
+                        new_entry["key"].split("_")[:-1] + [f"_{version}"]
+                    )
+                else:
+                    new_entry["key"] += f"_{version}"
+        else:
+            if new_idx_list is None:
+                continue
+            for idx, old_key in enumerate(
+                keys[: min(len(keys), len(new_idx_list))]
+            ):
+                old_entry = old_dict_data[old_key]
+                # 保留汉化内容及当前阶段
+                translation = translation_process(
+                    old_entry["translation"], old_entry["key"]
+                )
+
+                new_entry = new_dict_data[new_idx_list[idx]]
+                new_entry["translation"] = translation
+                new_entry["stage"] = old_entry["stage"]
+                # 移除被迁移的旧词条
+                consumed.add(old_key)
+
+    outdated_data = {
+        key: old_dict_data[key] for key in old_keys if key not in consumed
+    }
+    return outdated_data, new_dict_data
 
 
 ZH_CHARACTER = r"[一-龟]"
 
+ZH_QUOTE_REGEX = re.compile(rf"'({ZH_CHARACTER}+?)'")
+# (正则, 替换)，按顺序应用
+TRANSLATION_REGEXES = [
+    (re.compile("\t *"), "\t"),
+    # 中文与markup代码之间
+    (re.compile(rf"\] ({ZH_CHARACTER})"), r"]\1"),
+    (re.compile(rf"({ZH_CHARACTER}) \["), r"\1["),
+    (re.compile(r"\] \["), r"]["),
+    # <>左右
+    (re.compile(r" <(i|b)"), r"<\1"),
+    (re.compile(r"(i|b)> "), r"\1>"),
+]
+
 
 def translation_process(translation: str, key: str) -> str:
     # 引号使用中文双引号，括号使用半角括号
     if not ("effects" in key or "preParsingEffects" in key):
-        translation = re.sub(rf"'({ZH_CHARACTER}+?)'", r"“\1”", translation)
+        translation = ZH_QUOTE_REGEX.sub(r"“\1”", translation)
 
-    translation = re.sub(r"（", "(", translation)
-    translation = re.sub(r"）", ")", translation)
-    translation = re.sub("\t *", "\t", translation)
-    # 中文与markup代码之间
-    translation = re.sub(rf"\] ({ZH_CHARACTER})", r"]\1", translation)
-    translation = re.sub(rf"({ZH_CHARACTER}) \[", r"\1[", translation)
-    translation = re.sub(r"\] \[", r"][", translation)
-    # <>左右
-    translation = re.sub(r" <(i|b)", r"<\1", translation)
-    translation = re.sub(r"(i|b)> ", r"\1>", translation)
+    translation = translation.replace("（", "(").replace("）", ")")
+    for regex, replacement in TRANSLATION_REGEXES:
+        translation = regex.sub(replacement, translation)
 
     return translation
@@ -1,12 +1,28 @@
+import os
 import re
+import sys
 import copy
 import json
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator, Tuple
 
 from lxml import etree
 
-from const import NEW_DICT_DIR
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库json
+    orjson = None
+
+try:
+    import resource
+except ImportError:  # Windows下没有resource模块
+    resource = None
+
+from const import NEW_DICT_DIR, XML_TREE_MEMORY_FACTOR
 from data import XmlEntry
 from logger import logger
 
@@ -25,49 +41,213 @@ def count_entry(dict_dir):
     logger.info("There are %s entries in total.", total_num)
 
 
+# 一次遍历取出htmlContent中的标签与控制语句记号，之后按位置匹配各种块
+HTML_TOKEN_REGEX = re.compile(r"</(?:p|div|h[1-9])>|<(?:p|div|h[1-9])|#(?=[A-Z])")
+# 记号 -> 类别
+HTML_TOKEN_KINDS: Dict[str, str] = {
+    "<p": "p_open",
+    "</p>": "p_close",
+    "<div": "div_open",
+    "</div>": "div_close",
+    **{f"<h{level}": "h_open" for level in range(1, 10)},
+    **{f"</h{level}>": "h_close" for level in range(1, 10)},
+    "#": "directive",
+}
+HTML_TOKEN_NAMES = sorted(set(HTML_TOKEN_KINDS.values()))
+
+Span = Tuple[int, int]
+
+
+def html_tag_blocks(
+    text: str,
+    opens: List[int],
+    closes: List[int],
+    open_len: int,
+    close_len: int,
+    open_tag: bool = True,
+) -> List[Span]:
+    """
+    起始记号到结束记号的块，互不重叠、从左到右取，与非贪婪正则的findall一致
+
+    open_tag时起始标签延伸到其后第一个'>'；结束记号的位置已排序，以二分查找定位
+    """
+    spans: List[Span] = []
+    end = 0
+    for start in opens:
+        if start < end:
+            continue
+        body = start + open_len
+        if open_tag:
+            body = text.find(">", body) + 1
+            if body == 0:
+                break
+        idx = bisect_left(closes, body)
+        # 之后的起始记号同样找不到结束记号
+        if idx == len(closes):
+            break
+        end = closes[idx] + close_len
+        spans.append((start, end))
+    return spans
+
+
+def html_segment_blocks(
+    text: str,
+    starts: List[int],
+    start_len: int,
+    end_tags: Tuple[str, ...],
+    newline_before_end: bool = False,
+) -> List[Span]:
+    """
+    从每个起始位置到其后第一个'<'或'>'为止的段，该处须为end_tags之一，返回所有可能的匹配（可能重叠）
+
+    同一段中的起始位置共用查找结果，每个字符只被查找一次；
+    newline_before_end时段尾的空白中须含有换行，对应正则中的"\\n\\s*"
+    """
+    spans: List[Span] = []
+    lt = gt = -1
+    for start in starts:
+        body = start + start_len
+        if lt < body:
+            lt = text.find("<", body)
+            if lt < 0:
+                break
+        if gt < body:
+            gt = text.find(">", body, lt)
+            if gt < 0:  # 段中没有'>'
+                gt = lt
+        if gt < lt:
+            continue
+        if newline_before_end:
+            segment = text[body:lt]
+            if "\n" not in segment[len(segment.rstrip()) :]:
+                continue
+        for end_tag in end_tags:
+            if text.startswith(end_tag, lt):
+                spans.append((start, lt + len(end_tag)))
+                break
+    return spans
+
+
+def uncontained_blocks(text: str, candidates: List[Span], blocks: List[Span]) -> List[Span]:
+    """
+    按findall的方式从候选中取互不重叠的块，只保留其文本不出现在已有块中的部分，接受的块随即加入比较
+
+    候选包含了同一文本的所有出现位置，按位置判断包含关系即可，无需在已有块中查找子串；
+    只有长度与某个匹配相同的出现位置才需要取出文本比较
+    """
+    matches: List[Span] = []
+    last_end = 0
+    for start, end in candidates:
+        if start >= last_end:
+            matches.append((start, end))
+            last_end = end
+    lengths = {end - start for start, end in matches}
+
+    contained = set()
+    # 已有的块按起点排序，随候选起点前进维护最远的终点
+    ordered = sorted(blocks)
+    bi = 0
+    max_end = -1
+    for start, end in candidates:
+        while bi < len(ordered) and ordered[bi][0] <= start:
+            max_end = max(max_end, ordered[bi][1])
+            bi += 1
+        if max_end >= end and end - start in lengths:
+            contained.add(text[start:end])
+
+    accepted: List[Span] = []
+    mi = 0
+    for start, end in candidates:
+        if mi < len(matches) and matches[mi][0] == start:
+            mi += 1
+            block = text[start:end]
+            if block in contained:
+                continue
+            accepted.append((start, end))
+            contained.add(block)
+        # 被上一个匹配跳过的位置，若上一个块已接受，其中的文本即包含在已有块中
+        elif (
+            len(accepted) > 0
+            and accepted[-1] == matches[mi - 1]
+            and end <= accepted[-1][1]
+            and end - start in lengths
+        ):
+            contained.add(text[start:end])
+    return accepted
+
+
+def html_block_spans(text: str) -> List[Span]:
+    """
+    各种块的位置，顺序与逐个正则findall时相同：段落、标题、div、变量、前半块、后半块，
+    之后是不包含在已有块中的截断结束标签、连续的起始p与连续的结束p
+    """
+    tokens: Dict[str, List[int]] = {name: [] for name in HTML_TOKEN_NAMES}
+    found = False
+    for match in HTML_TOKEN_REGEX.finditer(text):
+        tokens[HTML_TOKEN_KINDS[match.group()]].append(match.start())
+        found = True
+    # 每种块都至少包含一个记号
+    if not found:
+        return []
+    directives = tokens["directive"]
+
+    spans: List[Span] = []
+    # 依次为段落、标题、div
+    for opens, closes, open_len, close_len in (
+        (tokens["p_open"], tokens["p_close"], 2, 4),
+        (tokens["h_open"], tokens["h_close"], 3, 5),
+        (tokens["div_open"], tokens["div_close"], 4, 6),
+    ):
+        if len(opens) > 0 and len(closes) > 0:
+            spans += html_tag_blocks(text, opens, closes, open_len, close_len)
+    # 变量
+    if "#VAR" in text:
+        spans += html_tag_blocks(
+            text,
+            [pos for pos in directives if text.startswith("#VAR", pos)],
+            [pos for pos in directives if text.startswith("#ENDVAR", pos)],
+            4,
+            7,
+            open_tag=False,
+        )
+
+    # 前半块：最后一个'>'之后没有'<'，起始标签开始于倒数第二个'>'之后
+    last_gt = text.rfind(">")
+    if last_gt >= 0 and text.find("<", last_gt) < 0:
+        previous = text.rfind(">", 0, last_gt)
+        opens = sorted(tokens["p_open"] + tokens["div_open"])
+        idx = bisect_left(opens, previous)
+        if idx < len(opens) and opens[idx] < last_gt:
+            spans.append((opens[idx], len(text)))
+    # 后半块：第一个'<'或'>'处即结束标签
+    first_lt = text.find("<")
+    if first_lt >= 0 and text.find(">", 0, first_lt) < 0:
+        for end_tag in ("</div>", "</p>"):
+            if text.startswith(end_tag, first_lt):
+                spans.append((0, first_lt + len(end_tag)))
+                break
+
+    for starts, start_tag, end_tags, newline_before_end in (
+        (directives, "#", ("</p>", "</div>"), False),  # cut end tag
+        (tokens["p_open"], "<p>\n", ("<p>",), True),  # both start p
+        (tokens["p_close"], "</p>\n", ("</p>",), True),  # both end p
+    ):
+        if start_tag not in text:
+            continue
+        candidates = html_segment_blocks(
+            text,
+            [pos for pos in starts if text.startswith(start_tag, pos)],
+            len(start_tag),
+            end_tags,
+            newline_before_end,
+        )
+        if len(candidates) > 0:
+            spans += uncontained_blocks(text, candidates, spans)
+    return spans
+
+
 def split_htmlContent(text: str) -> List[str]:
-    extracted_blocks = []
-
-    TAG_REGEX = r"(?:div|p)"
-
-    PARAGRAPH_REGEX = r"(<p[^>]*?>.*?</p>)"
-    TITLE_REGEX = r"(<h[1-9][^>]*?>.*?</h[1-9]>)"
-    BOTH_START_P_REGEX = r"<p>\n[^<>]*?\n\s*<p>"
-    BOTH_END_P_REGEX = r"</p>\n[^<>]*?\n\s*</p>"
-    DIV_REGEX = r"(<div[^>]*?>.*?</div>)"
-    HALF_BLOCK_F_REGEX = rf"(<{TAG_REGEX}[^>]*?>[^<>]*?\Z)"
-    HALF_BLOCK_B_REGEX = rf"(\A[^<>]*?</{TAG_REGEX}>)"
-    VAR_REGEX = r"(#VAR.*?#ENDVAR)"
-    CUT_END_TAG_REGEX = rf"(#[A-Z]+[^<>]*?</{TAG_REGEX}>)"
-    # CUT_START_TAG_REGEX = rf"(<{TAG_REGEX}[^>]*?>[^<>]*?#[A-Z]+.*?\n)"
-
-    paragraph_matches = re.findall(PARAGRAPH_REGEX, text, re.DOTALL)
-    title_regex = re.findall(TITLE_REGEX, text, re.DOTALL)
-    div_matches = re.findall(DIV_REGEX, text, re.DOTALL)
-    var_matches = re.findall(VAR_REGEX, text, re.DOTALL)
-    half_block_f_matches = re.findall(HALF_BLOCK_F_REGEX, text, re.DOTALL)
-    half_block_b_matches = re.findall(HALF_BLOCK_B_REGEX, text, re.DOTALL)
-    cut_end_tag_matches = re.findall(CUT_END_TAG_REGEX, text, re.DOTALL)
-    both_start_p_matches = re.findall(BOTH_START_P_REGEX, text, re.DOTALL)
-    both_end_p_matches = re.findall(BOTH_END_P_REGEX, text, re.DOTALL)
-    # cut_start_tag_matches = re.findall(CUT_START_TAG_REGEX, text, re.DOTALL)
-    # if "Letting go of the milker, the foul rat-boy delivers a wickedly-sharp slap to her rear end, " in text:
-    #     print(both_end_p_matches)
-    #     input()
-    
-    extracted_blocks += paragraph_matches
-    extracted_blocks += title_regex
-    extracted_blocks += div_matches
-    extracted_blocks += var_matches
-    extracted_blocks += half_block_f_matches
-    extracted_blocks += half_block_b_matches
-    filtered_cut_end_tag_matches = filter(lambda x: not any([x in block for block in extracted_blocks]), cut_end_tag_matches)
-    extracted_blocks += filtered_cut_end_tag_matches
-    filtered_both_start_p_matches = filter(lambda x: not any([x in block for block in extracted_blocks]), both_start_p_matches)
-    extracted_blocks += filtered_both_start_p_matches
-    filtered_both_end_p_matches = filter(lambda x: not any([x in block for block in extracted_blocks]), both_end_p_matches)
-    extracted_blocks += filtered_both_end_p_matches
-    # extracted_blocks += cut_start_tag_matches
+    extracted_blocks = [text[start:end] for start, end in html_block_spans(text)]
 
     if len(extracted_blocks) == 0:
         extracted_blocks.extend(text.split("<br/><br/>"))
@@ -115,23 +295,80 @@ def dict_update_splited_htmlContent(old_dict_dir: Path):
             json.dump(data, f, ensure_ascii=False, indent=4)
 
 
-def xml_node_replace_translation(node: etree._Element, entry: XmlEntry) -> str:
-    if entry.stage == 0 or entry.translation == entry.original:  # 无需修改
-        return
-    # htmlContent的属性用于存储文本的对应id，并不需要替换属性文本
-    if entry.attribute is not None and entry.node_tag != "htmlContent":
-        node.set(entry.attribute, entry.translation)
-    else:
+def translation_unchanged(entry: XmlEntry) -> bool:
+    return entry.stage == 0 or entry.translation == entry.original
+
+
+def xml_node_replace_translation(node: etree._Element, entry: XmlEntry) -> bool:
+    """
+    返回原文本是否有匹配，无需修改的条目视为匹配
+    """
+    return len(xml_node_replace_translations(node, [entry])) == 0
+
+
+def xml_node_replace_translations(
+    node: etree._Element, entries: List[XmlEntry]
+) -> List[XmlEntry]:
+    """
+    一次替换节点中所有条目的原文，返回原文本无匹配的条目
+
+    从左到右单次扫描，同一位置优先匹配较长的原文；原文相同时使用第一个条目的译文。
+    包含在已匹配的较长原文中的条目不视为无匹配
+    """
+    entries = [entry for entry in entries if not translation_unchanged(entry)]
+    if len(entries) == 0:  # 无需修改
+        return []
+
+    text_entries: List[XmlEntry] = []
+    for entry in entries:
+        # htmlContent的属性用于存储文本的对应id，并不需要替换属性文本
+        if entry.attribute is not None and entry.node_tag != "htmlContent":
+            node.set(entry.attribute, entry.translation)
+        else:
+            text_entries.append(entry)
+
+    unmatched: List[XmlEntry] = []
+    if len(text_entries) > 0:
         text = ""
         for child in node.itertext():
             if child.strip() == "":
                 continue
             text += child
-        node.text = text.replace(
-            entry.original,
-            entry.translation.replace("\\n", "\n"),
-        )
+
+        translations: Dict[str, str] = {}
+        for entry in text_entries:
+            if entry.original == "":
+                continue
+            translations.setdefault(
+                entry.original, entry.translation.replace("\\n", "\n")
+            )
+
+        matched: Dict[str, None] = {}
+        if len(translations) > 0:
+            pattern = re.compile(
+                "|".join(
+                    re.escape(original)
+                    for original in sorted(translations, key=len, reverse=True)
+                )
+            )
+
+            def replace(match: re.Match) -> str:
+                matched[match.group(0)] = None
+                return translations[match.group(0)]
+
+            text = pattern.sub(replace, text)
+        node.text = text
+
+        unmatched = [
+            entry
+            for entry in text_entries
+            if entry.original not in matched
+            and not any(entry.original in original for original in matched)
+        ]
+
     node.text = etree.CDATA(node.text)
+    return unmatched
+
 
 def get_element_CDATA(element: etree._Element) -> str:
     if element.text is None:
@@ -155,6 +392,173 @@ def get_element_CDATA(element: etree._Element) -> str:
     
     return text
 
+def resolve_jobs(jobs: int) -> int:
+    """
+    进程数，0表示使用全部核心
+    """
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def chunked(items: List, size: int) -> Iterator[List]:
+    for idx in range(0, len(items), size):
+        yield items[idx : idx + size]
+
+
+class XmlTreeCache:
+    """
+    进程内的xml文档树缓存，供提取与应用阶段共用，避免同一文件被解析两次
+
+    以源文件大小乘以memory_factor估算文档树的内存占用，超过上限时淘汰最久未使用的文档树；
+    文件的修改时间或大小变化后，缓存的文档树视为失效
+    """
+
+    def __init__(self, limit: int, memory_factor: int = XML_TREE_MEMORY_FACTOR):
+        self.limit = limit
+        self.memory_factor = memory_factor
+        # 绝对路径 -> ((修改时间, 文件大小), 文档树)，占用均为估算的内存字节数
+        self.trees: "OrderedDict[str, Tuple[Tuple[int, int], etree._ElementTree]]" = (
+            OrderedDict()
+        )
+        self.bytes_held = 0
+        self.peak_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def file_key(file: Path) -> Tuple[str, Tuple[int, int]]:
+        stat = os.stat(file)
+        return os.path.abspath(file), (stat.st_mtime_ns, stat.st_size)
+
+    def parse(self, file: Path) -> etree._ElementTree:
+        """
+        获取文档树，未命中时解析并放入缓存
+        """
+        path, version = self.file_key(file)
+        cached = self.trees.get(path)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            self.trees.move_to_end(path)
+            return cached[1]
+
+        self.misses += 1
+        self.discard(path)
+        parser = etree.XMLParser(strip_cdata=False)
+        tree = etree.parse(path, parser)
+        if self.tree_bytes(version) <= self.limit:
+            self.trees[path] = (version, tree)
+            self.bytes_held += self.tree_bytes(version)
+            while self.bytes_held > self.limit:
+                _, (old_version, _) = self.trees.popitem(last=False)
+                self.bytes_held -= self.tree_bytes(old_version)
+                self.evictions += 1
+            self.peak_bytes = max(self.peak_bytes, self.bytes_held)
+        return tree
+
+    def tree_bytes(self, version: Tuple[int, int]) -> int:
+        return version[1] * self.memory_factor
+
+    def take(self, file: Path) -> Optional[etree._ElementTree]:
+        """
+        取出文档树并移出缓存，供会修改文档的调用方使用；未命中时返回None
+        """
+        path, version = self.file_key(file)
+        cached = self.trees.get(path)
+        if cached is None or cached[0] != version:
+            self.misses += 1
+            self.discard(path)
+            return None
+
+        self.hits += 1
+        self.discard(path)
+        return cached[1]
+
+    def discard(self, path: str) -> None:
+        cached = self.trees.pop(path, None)
+        if cached is not None:
+            self.bytes_held -= self.tree_bytes(cached[0])
+
+    def clear(self) -> None:
+        self.trees.clear()
+        self.bytes_held = 0
+
+    def report(self) -> None:
+        logger.info(
+            "xml文档树缓存：命中%s次，未命中%s次，淘汰%s个，估算内存占用%.1fMB，峰值%.1fMB",
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.bytes_held / 1024 / 1024,
+            self.peak_bytes / 1024 / 1024,
+        )
+
+
+def dumps_dictionary(entries: List[Dict]) -> bytes:
+    """
+    序列化字典文件，与以文本模式json.dump(entries, f, ensure_ascii=False, indent=2)写入的内容一致
+    """
+    content: Optional[bytes] = None
+    if orjson is not None:
+        try:
+            content = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:  # 如超出64位的整数，交给标准库处理
+            content = None
+    if content is None:
+        content = json.dumps(entries, ensure_ascii=False, indent=2).encode("utf-8")
+
+    # 文本模式写入时换行符会被转换
+    if os.linesep != "\n":
+        content = content.replace(b"\n", os.linesep.encode("ascii"))
+    return content
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """
+    内容与磁盘上的文件一致时跳过写入，否则先写入临时文件再替换，返回是否写入
+    """
+    try:
+        if os.path.getsize(path) == len(content):
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return False
+    except FileNotFoundError:
+        pass
+
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+    return True
+
+
+@contextmanager
+def timed_stage(name: str) -> Iterator[None]:
+    """
+    输出阶段的开始与耗时，后台线程中的阶段同样适用
+    """
+    logger.info("==== 正在%s ====", name)
+    start = time.perf_counter()
+    yield
+    logger.info("==== %s完成，用时%.2fs ====", name, time.perf_counter() - start)
+
+
+def peak_rss() -> Optional[Tuple[int, int]]:
+    """
+    返回(本进程, 已回收子进程)的内存占用峰值，单位字节；平台不支持时返回None
+    """
+    if resource is None:
+        return None
+
+    # Linux下ru_maxrss的单位为KB，macOS下为字节
+    unit = 1 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+    )
+
+
 __all__ = ["split_htmlContent", "dict_update_splited_htmlContent"]
 
 